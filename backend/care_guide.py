@@ -3,9 +3,25 @@ Pet Care Guide Module
 
 Generates detailed, kid-friendly care instructions for different pet species.
 Instructions are tailored to the pet's life stage and specific task type.
+
+Each species' instruction text lives in its own care_guide_<species> module. The flattened
+instructions and recommended schedules are precomputed into care_guide_generated.py; run
+`python scripts/gen_care_guide.py` after editing the instructions or schedules.
 """
 
+import importlib
+import re
+import sys
+from collections.abc import Mapping
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
+
+try:
+    import care_guide_generated
+except ImportError:
+    # Not generated yet (or hidden by scripts/gen_care_guide.py); build the tables at import instead
+    care_guide_generated = None
 
 
 class CareTaskType(str, Enum):
@@ -33,381 +49,192 @@ class LifeStage(str, Enum):
     SENIOR = "senior"
 
 
-# Bearded Dragon Care Instructions
-BEARDED_DRAGON_INSTRUCTIONS = {
-    "feeding": {
-        "insects": {
-            LifeStage.BABY: """
-**Feeding Baby Bearded Dragon - Insects**
-
-📋 What you need:
-• 30-50 micro Dubia roaches (1/4 inch size - very small!)
-• Calcium powder
-• Escape-proof feeding dish
-
-📊 Daily amount: 30-50 micro roaches
-
-📝 Steps:
-1. Put the roaches in a bag or container
-2. Add a small pinch of calcium powder
-3. Shake gently so roaches get a light white coating
-4. Put ALL the dusted roaches in the feeding dish
-5. Place dish in tank (NOT under the basking light - roaches will overheat!)
-6. Let your beardie hunt throughout the day
-7. Remove any uneaten roaches at night before bed
-
-💡 Tip: You can add greens to the same dish - roaches will eat them too!
-
-⚠️ Remember: Roaches should be NO bigger than the space between the eyes!
-""",
-            LifeStage.JUVENILE: """
-**Feeding Juvenile Bearded Dragon - Insects**
-
-📋 What you need:
-• Medium Dubia roaches (1/2 inch size)
-• Calcium powder
-• Escape-proof feeding dish
-
-📊 Daily amount (by age):
-• 4-5 months old: 15-25 medium roaches
-• 6-9 months old: 10-15 medium roaches
-• 10-11 months old: 10-13 medium roaches
-
-📝 Steps:
-1. Put the roaches in a bag or container
-2. Add a small pinch of calcium powder
-3. Shake gently so roaches get a light white coating
-4. Put ALL the dusted roaches in the feeding dish
-5. Place dish in tank (NOT under the basking light - roaches will overheat!)
-6. Let your beardie hunt throughout the day
-7. Remove any uneaten roaches at night before bed
-
-💡 Tip: You can add greens to the same dish - roaches will eat them too!
-
-⚠️ Remember: Roaches should be NO bigger than the space between the eyes!
-""",
-            LifeStage.SUB_ADULT: """
-**Feeding Sub-Adult Bearded Dragon - Insects**
-
-📋 What you need:
-• 5-7 medium Dubia roaches (1/2 inch) OR 3-5 large roaches (3/4 inch)
-• Calcium powder
-• Escape-proof feeding dish
-
-🥬 Diet balance: 60% veggies, 40% protein (bugs)
-
-📝 Steps:
-1. Put the roaches in a bag or container
-2. Add a pinch of calcium powder
-3. Shake gently so roaches get a light white coating
-4. Put the dusted roaches in the feeding dish
-5. Place dish in tank (NOT under the basking light!)
-6. Let your beardie hunt throughout the day
-7. Remove any uneaten roaches at night before bed
-
-💡 Tip: Add greens to the same dish!
-""",
-            LifeStage.ADULT: """
-**Feeding Adult Bearded Dragon - Insects**
-
-📋 What you need:
-• 3-5 adult Dubia roaches (1 inch size)
-• Calcium powder
-• Escape-proof feeding dish
-
-📊 Daily amount: 3-5 large roaches (or skip a day - adults don't need bugs daily!)
-
-📝 Steps:
-1. Put the roaches in a bag or container
-2. Add a small pinch of calcium powder
-3. Shake gently so roaches get a light white coating
-4. Put the dusted roaches in the feeding dish
-5. Place dish in tank (NOT under the basking light!)
-6. Let your beardie hunt throughout the day
-7. Remove any uneaten roaches at night before bed
-
-💡 Tip: Adults need mostly veggies (80%) with only some bugs (20%)!
-""",
-        },
-        "greens": {
-            LifeStage.BABY: """
-**Feeding Baby Bearded Dragon - Greens**
-
-📋 What you need:
-• Fresh greens: collard greens, dandelion greens, or mustard greens
-• Clean food dish
-• Cutting board and knife (ask an adult to help chop)
-
-📝 Steps:
-1. Wash the greens under water
-2. Chop into tiny pieces (easier for babies to eat)
-3. Put a small handful in the food dish
-4. Place dish in the tank
-5. Remove uneaten greens at the end of the day
-
-🥬 Best greens: Collard greens, dandelion greens, mustard greens
-🚫 DON'T feed: Spinach, lettuce, or avocado (these are bad for beardies!)
-
-💡 Babies may not eat much greens - that's okay! Keep offering them.
-""",
-            LifeStage.JUVENILE: """
-**Feeding Juvenile Bearded Dragon - Greens**
-
-📋 What you need:
-• Fresh greens: collard greens, dandelion greens, or mustard greens
-• Clean food dish
-
-📊 Diet balance by age:
-• 4-5 months: 10% veggies, 90% protein (bugs)
-• 6-9 months: 20% veggies, 80% protein
-• 10-11 months: 30% veggies, 70% protein
-
-📝 Steps:
-1. Wash the greens under water
-2. Tear or chop into small bite-sized pieces
-3. Make a salad about the size of your beardie's head
-4. Place in the food dish in the tank EVERY MORNING
-5. Remove uneaten greens at the end of the day
-
-🥬 Best greens: Collard greens, dandelion greens, mustard greens, butternut squash
-🚫 DON'T feed: Spinach (blocks calcium!), lettuce (no nutrition), avocado (toxic!)
-""",
-            LifeStage.SUB_ADULT: """
-**Feeding Sub-Adult Bearded Dragon - Greens**
-
-📋 What you need:
-• Fresh greens: collard greens, dandelion greens, or mustard greens
-• Clean food dish
-
-📝 Steps:
-1. Wash the greens under cold water
-2. Tear or chop into bite-sized pieces
-3. Make a salad about the size of your beardie's head
-4. You can add some butternut squash, bell pepper, or blueberries as treats!
-5. Place in the food dish
-6. Remove uneaten food at the end of the day
-
-🥬 Good greens: Collard greens, dandelion greens, mustard greens
-🍓 Treats (sometimes): Blueberries, strawberries, butternut squash
-🚫 AVOID: Spinach, lettuce, avocado, citrus fruits
-""",
-            LifeStage.ADULT: """
-**Feeding Adult Bearded Dragon - Greens**
-
-📋 What you need:
-• Fresh greens: collard greens, dandelion greens, or mustard greens
-• Clean food dish
-
-📝 Steps:
-1. Wash the greens under cold water
-2. Tear or chop into bite-sized pieces
-3. Make a salad about the size of your beardie's head
-4. You can mix in some butternut squash, bell pepper, or a few blueberries!
-5. Place in the food dish
-6. Remove uneaten food at the end of the day
-
-🥬 Best greens (feed daily):
-• Collard greens ⭐
-• Dandelion greens ⭐
-• Mustard greens
-• Turnip greens
-
-🍓 Occasional treats:
-• Blueberries, strawberries (1-2 pieces)
-• Butternut squash
-• Bell peppers
-
-🚫 NEVER feed:
-• Spinach (blocks calcium absorption!)
-• Iceberg lettuce (no nutrition)
-• Avocado (toxic!)
-• Citrus fruits (too acidic)
-
-💡 Adults need 80% greens, only 20% insects!
-""",
-        },
-    },
-    "water": {
-        "default": """
-**Changing Water**
-
-📋 What you need:
-• Fresh filtered or bottled water (room temperature)
-• Clean paper towels
-• Reptile water conditioner
-
-📝 Steps:
-1. Remove the water dish from the tank
-2. Dump out the old water in the sink
-3. Rinse the dish with warm water
-4. Wipe it clean with a paper towel
-5. Fill with fresh filtered or bottled water
-6. Add ONE drop of reptile water conditioner
-7. Put back in the tank (away from the heat lamp!)
-
-💡 Tips:
-• Change water every day - beardies can poop in it!
-• Use room temperature water, not cold
-• Don't put the dish directly under the basking light
-
-⚠️ Note: Beardies don't drink much from dishes - they get most water from their food!
-""",
-    },
-    "cleaning": {
-        "spot_clean": """
-**Daily Spot Cleaning** ☀️ Do this FIRST thing every morning!
-
-📋 What you need:
-• Paper towels
-• Small trash bag
-
-📝 Steps:
-1. **FIRST: Remove yesterday's uneaten food** - throw away old greens and any dead insects
-2. Check the water dish - dump and refill if it looks dirty
-3. Wipe up any wet spots with a paper towel
-4. Throw away the dirty paper towels
-
-⏰ Do this BEFORE feeding breakfast - start with a clean tank!
-
-💡 Tip: Poop gets cleaned during the weekly deep clean!
-""",
-        "deep_clean": """
-**Weekly Deep Clean** 🧹 The big clean!
-
-📋 What you need:
-• Paper towels
-• Reptile-safe cleaner (or 1 part vinegar + 2 parts water)
-• Clean cloth
-• Temporary container for your beardie
-• Small trash bag
-
-📝 Steps:
-1. **FIRST: Find and remove ALL poop** - look for brownish droppings with white part (urate)
-   👀 Check: under basking spot, near food dish, in corners, on decorations
-2. Safely move your beardie to a temporary container
-3. Remove all decorations, food dish, and water dish
-4. Remove loose substrate or liner
-5. Spray the tank walls and floor with reptile-safe cleaner
-6. Wipe everything down with paper towels
-7. Clean all decorations with the cleaner and rinse well
-8. Let everything dry completely
-9. Put clean substrate/liner back
-10. Return decorations, dishes, and your beardie!
-
-⏱️ This takes about 20-30 minutes
-
-⚠️ Important: Make sure everything is completely dry before putting your beardie back!
-""",
-    },
-    "dusting": {
-        "calcium": """
-**Calcium Dusting**
-
-📋 What you need:
-• Calcium powder (WITHOUT D3 if your beardie has UVB light, WITH D3 if no UVB)
-• Small container or plastic bag
-• Feeder insects
-
-📝 Steps:
-1. Put insects in a small plastic bag or container
-2. Add a tiny pinch of calcium powder
-3. Shake gently until insects have a light white coating
-4. Feed the dusted insects to your beardie right away!
-
-💡 How much: Just a light coating - like a dusting of powdered sugar!
-⏰ How often: Every feeding for adults (3x per week is fine too)
-
-⚠️ Don't use too much - excess calcium can cause problems!
-""",
-        "multivitamin": """
-**Multivitamin Dusting**
-
-📋 What you need:
-• Reptile multivitamin powder
-• Small container or plastic bag
-• Feeder insects
-
-📝 Steps:
-1. Put insects in a small plastic bag or container
-2. Add a tiny pinch of multivitamin powder
-3. Shake gently until insects have a light coating
-4. Feed the dusted insects to your beardie!
-
-⏰ How often: 2 times per week (like Tuesday and Saturday)
-
-💡 Tip: On vitamin days, use multivitamin instead of calcium, not both at once!
-""",
-    },
-}
+def _strip_instructions(node: dict | str) -> MappingProxyType | str:
+    """Recursively strip and intern every instruction string, freezing each level into a read-only mapping."""
+    if isinstance(node, dict):
+        return MappingProxyType({key: _strip_instructions(value) for key, value in node.items()})
+    return sys.intern(node.strip())
+
+
+def _flatten_instructions(species: str, instructions: Mapping) -> dict[tuple, str]:
+    """
+    Flatten a species' nested instruction table into a single-level dict.
+
+    Keys are (species, category, subtype, life_stage) tuples of plain strings. Categories that
+    don't vary by life stage (water, cleaning, dusting) use None for the life stage.
+    """
+    flat = {}
+    for category, subtypes in instructions.items():
+        for subtype, entry in subtypes.items():
+            if isinstance(entry, str):
+                flat[(species, category, subtype, None)] = entry
+            else:
+                for life_stage, text in entry.items():
+                    flat[(species, category, subtype, life_stage.value)] = text
+    return flat
+
+
+# Modules holding each species' source instruction tables, by species value. Species without
+# an entry get generic instructions.
+_SPECIES_MODULES: Mapping[str, str] = MappingProxyType(
+    {
+        PetSpecies.BEARDED_DRAGON.value: "care_guide_bearded_dragon",
+    }
+)
+
+
+def _build_flat_instructions() -> dict[tuple, str]:
+    """
+    Flatten every species' instruction table into one (species, category, subtype, life_stage) dict.
+
+    Only the generator and imports without care_guide_generated call this, so the species modules
+    are imported here rather than at module level.
+    """
+    flat = {}
+    for species_key, module_name in _SPECIES_MODULES.items():
+        # The literals are padded with newlines for readability; strip them once here so the
+        # getters can hand back the stored text directly
+        instructions = _strip_instructions(importlib.import_module(module_name).INSTRUCTIONS)
+        flat.update(_flatten_instructions(species_key, instructions))
+    return flat
+
+
+# The flattened table is generated ahead of time by scripts/gen_care_guide.py so cold starts
+# load it as a literal. LifeStage is a str enum, so member lookups hit its string keys. The text
+# is interned so every getter and schedule description shares one object per instruction.
+FLAT_INSTRUCTIONS: Mapping[tuple, str] = MappingProxyType(
+    {
+        key: sys.intern(text)
+        for key, text in (
+            care_guide_generated.FLAT_INSTRUCTIONS if care_guide_generated else _build_flat_instructions()
+        ).items()
+    }
+)
+
+# Text to fall back on per (species, category, subtype): the stage-less entry, or the adult
+# entry for categories that vary by life stage
+_SUBTYPE_DEFAULTS: Mapping[tuple[str, str, str], str] = MappingProxyType(
+    {
+        (species_key, category, subtype): text
+        for (species_key, category, subtype, life_stage), text in FLAT_INSTRUCTIONS.items()
+        if life_stage is None or life_stage == LifeStage.ADULT
+    }
+)
+
+# Subtype used when a category doesn't know the requested one
+_DEFAULT_SUBTYPES: Mapping[str, str] = MappingProxyType(
+    {
+        "feeding": "insects",
+        "water": "default",
+        "cleaning": "spot_clean",
+        "dusting": "calcium",
+    }
+)
+
+# Instructions for species without a care guide
+_GENERIC_FALLBACKS: Mapping[str, str] = MappingProxyType(
+    {
+        "feeding": "Follow the standard feeding guidelines for your pet type. Consult a vet or care guide for specific instructions.",
+        "water": "Change water daily with fresh, clean water. Clean the water dish regularly.",
+        "cleaning": "Clean the habitat regularly to maintain a healthy environment.",
+        "dusting": "Follow supplement guidelines for your pet type.",
+    }
+)
+
+
+def _species_key(species: str) -> str:
+    """Normalize a PetSpecies member or raw species string to the plain string value."""
+    return species.value if isinstance(species, PetSpecies) else species
+
+
+# Keyword patterns used to pick a task subtype from a free-form task name
+FEEDING_INSECT_RE = re.compile(r"roach|dubia|cricket|insect|bug|protein", re.IGNORECASE)
+FEEDING_GREENS_RE = re.compile(r"green|salad|vegetable|veggie|leaf", re.IGNORECASE)
+CLEANING_DEEP_RE = re.compile(r"deep|weekly|full|thorough", re.IGNORECASE)
+
+
+# Enum members are singletons, so the hot paths compare against these with `is`
+_FEEDING = CareTaskType.FEEDING
+_WATER = CareTaskType.WATER
+_CLEANING = CareTaskType.CLEANING
+_TASK_TYPES_BY_VALUE: Mapping[str, CareTaskType] = MappingProxyType({member.value: member for member in CareTaskType})
+
+# Bit flags for the keyword classes a task name can hit
+_MASK_INSECTS = 1
+_MASK_GREENS = 2
+_MASK_DEEP_CLEAN = 4
+
+
+@lru_cache(maxsize=256)
+def _name_mask(task_name: str) -> int:
+    """Scan a task name once and record which keyword classes it mentions as a bitmask."""
+    mask = 0
+    if FEEDING_INSECT_RE.search(task_name) is not None:
+        mask |= _MASK_INSECTS
+    if FEEDING_GREENS_RE.search(task_name) is not None:
+        mask |= _MASK_GREENS
+    if CLEANING_DEEP_RE.search(task_name) is not None:
+        mask |= _MASK_DEEP_CLEAN
+    return mask
 
 
 def _detect_task_subtype(task_name: str, task_type: CareTaskType) -> str:
-    """Detect the task subtype from the task name."""
-    name_lower = task_name.lower()
-
-    if task_type == CareTaskType.FEEDING:
-        if any(word in name_lower for word in ["roach", "dubia", "cricket", "insect", "bug", "protein"]):
-            return "insects"
-        elif any(word in name_lower for word in ["green", "salad", "vegetable", "veggie", "leaf"]):
-            return "greens"
-        else:
-            return "insects"  # Default for feeding
-
-    elif task_type == CareTaskType.CLEANING:
-        if any(word in name_lower for word in ["deep", "weekly", "full", "thorough"]):
-            return "deep_clean"
-        else:
-            return "spot_clean"
-
-    elif task_type == CareTaskType.WATER:
-        return "default"
+    """Detect the task subtype from the task name. task_type must already be a CareTaskType member."""
+    mask = _name_mask(task_name)
+
+    if task_type is _FEEDING:
+        # Insect keywords win when a name mentions both; insects are also the default
+        return "greens" if mask & (_MASK_INSECTS | _MASK_GREENS) == _MASK_GREENS else "insects"
+
+    elif task_type is _CLEANING:
+        return "deep_clean" if mask & _MASK_DEEP_CLEAN else "spot_clean"
 
     return "default"
 
 
-def get_feeding_instructions(species: str, life_stage: LifeStage, task_subtype: str = "insects") -> str:
-    """Get feeding instructions for a specific species and life stage."""
-    if species == PetSpecies.BEARDED_DRAGON or species == "bearded_dragon":
-        instructions = BEARDED_DRAGON_INSTRUCTIONS.get("feeding", {})
-        subtype_instructions = instructions.get(task_subtype, instructions.get("insects", {}))
+def _lookup(species: str, category: str, subtype: str, life_stage: LifeStage | None = None) -> str:
+    """
+    Look up instruction text for any category.
 
-        if isinstance(subtype_instructions, dict):
-            # Get instructions for the specific life stage, or default to adult
-            return subtype_instructions.get(
-                life_stage,
-                subtype_instructions.get(LifeStage.ADULT, "Follow standard feeding guidelines for your pet."),
-            ).strip()
+    Unknown subtypes use the category's default subtype, and life stages without their own
+    entry use the adult text. Categories that don't vary by life stage are looked up with None.
+    """
+    species_key = _species_key(species)
+    if species_key not in _SPECIES_MODULES:
+        return _GENERIC_FALLBACKS[category]
 
-    return "Follow the standard feeding guidelines for your pet type. Consult a vet or care guide for specific instructions."
+    default = _SUBTYPE_DEFAULTS.get((species_key, category, subtype))
+    if default is None:
+        subtype = _DEFAULT_SUBTYPES[category]
+        default = _SUBTYPE_DEFAULTS[(species_key, category, subtype)]
+    return FLAT_INSTRUCTIONS.get((species_key, category, subtype, life_stage), default)
 
 
+@lru_cache(maxsize=512)
+def get_feeding_instructions(species: str, life_stage: LifeStage, task_subtype: str = "insects") -> str:
+    """Get feeding instructions for a specific species and life stage."""
+    return _lookup(species, "feeding", task_subtype, life_stage)
+
+
+@lru_cache(maxsize=512)
 def get_water_instructions(species: str, life_stage: LifeStage) -> str:
     """Get water change instructions for a specific species."""
-    if species == PetSpecies.BEARDED_DRAGON or species == "bearded_dragon":
-        instructions = BEARDED_DRAGON_INSTRUCTIONS.get("water", {})
-        return instructions.get("default", "Change water daily with fresh, clean water.").strip()
-
-    return "Change water daily with fresh, clean water. Clean the water dish regularly."
+    return _lookup(species, "water", "default")
 
 
+@lru_cache(maxsize=512)
 def get_cleaning_instructions(species: str, life_stage: LifeStage, task_subtype: str = "spot_clean") -> str:
     """Get cleaning instructions for a specific species."""
-    if species == PetSpecies.BEARDED_DRAGON or species == "bearded_dragon":
-        instructions = BEARDED_DRAGON_INSTRUCTIONS.get("cleaning", {})
-        return instructions.get(task_subtype, instructions.get("spot_clean", "Clean the habitat regularly.")).strip()
-
-    return "Clean the habitat regularly to maintain a healthy environment."
+    return _lookup(species, "cleaning", task_subtype)
 
 
+@lru_cache(maxsize=512)
 def get_dusting_instructions(species: str, life_stage: LifeStage, task_subtype: str = "calcium") -> str:
     """Get supplement dusting instructions."""
-    if species == PetSpecies.BEARDED_DRAGON or species == "bearded_dragon":
-        instructions = BEARDED_DRAGON_INSTRUCTIONS.get("dusting", {})
-        return instructions.get(task_subtype, instructions.get("calcium", "Dust insects with calcium powder.")).strip()
-
-    return "Follow supplement guidelines for your pet type."
+    return _lookup(species, "dusting", task_subtype)
 
 
+@lru_cache(maxsize=512)
 def get_task_description(task_type: CareTaskType, species: str, life_stage: LifeStage, task_name: str) -> str:
     """
     Generate a detailed, kid-friendly task description.
@@ -421,29 +248,28 @@ def get_task_description(task_type: CareTaskType, species: str, life_stage: Life
     Returns:
         A detailed, step-by-step instruction string
     """
+    # Map raw strings onto the enum singletons so the checks below can compare by identity
+    task_type = _TASK_TYPES_BY_VALUE.get(task_type, task_type)
+
     # Detect subtype from task name
     subtype = _detect_task_subtype(task_name, task_type)
 
-    if task_type == CareTaskType.FEEDING:
-        return get_feeding_instructions(species, life_stage, subtype)
+    if task_type is _FEEDING:
+        return _lookup(species, "feeding", subtype, life_stage)
 
-    elif task_type == CareTaskType.WATER:
-        return get_water_instructions(species, life_stage)
+    elif task_type is _WATER:
+        return _lookup(species, "water", subtype)
 
-    elif task_type == CareTaskType.CLEANING:
-        return get_cleaning_instructions(species, life_stage, subtype)
+    elif task_type is _CLEANING:
+        return _lookup(species, "cleaning", subtype)
 
     # For other task types, return generic instructions
     return f"Complete the {task_name} task following standard care guidelines for your pet."
 
 
-def get_recommended_schedules(species: str, life_stage: LifeStage) -> list[dict]:
-    """
-    Get recommended care schedules for a species/life stage.
-
-    Returns a list of recommended tasks with their frequencies and descriptions.
-    """
-    if species == PetSpecies.BEARDED_DRAGON or species == "bearded_dragon":
+def _build_recommended_schedules(species: str, life_stage: LifeStage) -> list[dict]:
+    """Build the recommended care schedules for a species/life stage from the instruction tables."""
+    if _species_key(species) == PetSpecies.BEARDED_DRAGON.value:
         schedules = [
             {
                 "task_name": "Feed Dubia Roaches",
@@ -498,3 +324,71 @@ def get_recommended_schedules(species: str, life_stage: LifeStage) -> list[dict]
         return schedules
 
     return []
+
+
+def _build_schedule_table() -> dict[tuple[str, str], list[dict]]:
+    """Build the schedules for every (species, life_stage) pair that has any, with plain string values."""
+    table = {}
+    for species in PetSpecies:
+        for life_stage in LifeStage:
+            schedules = _build_recommended_schedules(species.value, life_stage)
+            if schedules:
+                table[(species.value, life_stage.value)] = [
+                    {**schedule, "task_type": schedule["task_type"].value} for schedule in schedules
+                ]
+    return table
+
+
+# Schedules only depend on (species, life_stage), so they are generated ahead of time with the
+# instruction text. Each schedule is a read-only mapping, so callers can share them without copying.
+_SCHEDULE_CACHE: dict[tuple[str, str], tuple[MappingProxyType, ...]] = {
+    key: tuple(
+        MappingProxyType(
+            {
+                **schedule,
+                "task_type": _TASK_TYPES_BY_VALUE[schedule["task_type"]],
+                "description": sys.intern(schedule["description"]),
+            }
+        )
+        for schedule in schedules
+    )
+    for key, schedules in (
+        care_guide_generated.RECOMMENDED_SCHEDULES if care_guide_generated else _build_schedule_table()
+    ).items()
+}
+
+
+def get_recommended_schedules(species: str, life_stage: LifeStage) -> list[MappingProxyType]:
+    """
+    Get recommended care schedules for a species/life stage.
+
+    Returns a list of recommended tasks with their frequencies and descriptions.
+    The schedules themselves are shared, read-only mappings.
+    """
+    return list(_SCHEDULE_CACHE.get((species, life_stage), ()))
+
+
+def _warm() -> int:
+    """
+    Prime the instruction getter caches for every known species, life stage and subtype.
+
+    Runs once at import so the first request for each combination is already a cache hit.
+    Returns a checksum over the touched text so the work can't be skipped as unused.
+    """
+    subtype_getters = {
+        "feeding": get_feeding_instructions,
+        "cleaning": get_cleaning_instructions,
+        "dusting": get_dusting_instructions,
+    }
+    total = 0
+    for species_key, category, subtype in _SUBTYPE_DEFAULTS:
+        for life_stage in LifeStage:
+            if category in subtype_getters:
+                text = subtype_getters[category](species_key, life_stage, subtype)
+            else:
+                text = get_water_instructions(species_key, life_stage)
+            total ^= len(text)
+    return total
+
+
+_warm()
@@ -0,0 +1,69 @@
+"""
+Precomputed care guide tables.
+
+Generated by scripts/gen_care_guide.py from the care_guide instruction modules. Do not edit by hand.
+"""
+
+FLAT_INSTRUCTIONS = {
+    ('bearded_dragon', 'feeding', 'insects', 'baby'): '**Feeding Baby Bearded Dragon - Insects**\n\n📋 What you need:\n• 30-50 micro Dubia roaches (1/4 inch size - very small!)\n• Calcium powder\n• Escape-proof feeding dish\n\n📊 Daily amount: 30-50 micro roaches\n\n📝 Steps:\n1. Put the roaches in a bag or container\n2. Add a small pinch of calcium powder\n3. Shake gently so roaches get a light white coating\n4. Put ALL the dusted roaches in the feeding dish\n5. Place dish in tank (NOT under the basking light - roaches will overheat!)\n6. Let your beardie hunt throughout the day\n7. Remove any uneaten roaches at night before bed\n\n💡 Tip: You can add greens to the same dish - roaches will eat them too!\n\n⚠️ Remember: Roaches should be NO bigger than the space between the eyes!',
+    ('bearded_dragon', 'feeding', 'insects', 'juvenile'): '**Feeding Juvenile Bearded Dragon - Insects**\n\n📋 What you need:\n• Medium Dubia roaches (1/2 inch size)\n• Calcium powder\n• Escape-proof feeding dish\n\n📊 Daily amount (by age):\n• 4-5 months old: 15-25 medium roaches\n• 6-9 months old: 10-15 medium roaches\n• 10-11 months old: 10-13 medium roaches\n\n📝 Steps:\n1. Put the roaches in a bag or container\n2. Add a small pinch of calcium powder\n3. Shake gently so roaches get a light white coating\n4. Put ALL the dusted roaches in the feeding dish\n5. Place dish in tank (NOT under the basking light - roaches will overheat!)\n6. Let your beardie hunt throughout the day\n7. Remove any uneaten roaches at night before bed\n\n💡 Tip: You can add greens to the same dish - roaches will eat them too!\n\n⚠️ Remember: Roaches should be NO bigger than the space between the eyes!',
+    ('bearded_dragon', 'feeding', 'insects', 'sub_adult'): '**Feeding Sub-Adult Bearded Dragon - Insects**\n\n📋 What you need:\n• 5-7 medium Dubia roaches (1/2 inch) OR 3-5 large roaches (3/4 inch)\n• Calcium powder\n• Escape-proof feeding dish\n\n🥬 Diet balance: 60% veggies, 40% protein (bugs)\n\n📝 Steps:\n1. Put the roaches in a bag or container\n2. Add a pinch of calcium powder\n3. Shake gently so roaches get a light white coating\n4. Put the dusted roaches in the feeding dish\n5. Place dish in tank (NOT under the basking light!)\n6. Let your beardie hunt throughout the day\n7. Remove any uneaten roaches at night before bed\n\n💡 Tip: Add greens to the same dish!',
+    ('bearded_dragon', 'feeding', 'insects', 'adult'): "**Feeding Adult Bearded Dragon - Insects**\n\n📋 What you need:\n• 3-5 adult Dubia roaches (1 inch size)\n• Calcium powder\n• Escape-proof feeding dish\n\n📊 Daily amount: 3-5 large roaches (or skip a day - adults don't need bugs daily!)\n\n📝 Steps:\n1. Put the roaches in a bag or container\n2. Add a small pinch of calcium powder\n3. Shake gently so roaches get a light white coating\n4. Put the dusted roaches in the feeding dish\n5. Place dish in tank (NOT under the basking light!)\n6. Let your beardie hunt throughout the day\n7. Remove any uneaten roaches at night before bed\n\n💡 Tip: Adults need mostly veggies (80%) with only some bugs (20%)!",
+    ('bearded_dragon', 'feeding', 'greens', 'baby'): "**Feeding Baby Bearded Dragon - Greens**\n\n📋 What you need:\n• Fresh greens: collard greens, dandelion greens, or mustard greens\n• Clean food dish\n• Cutting board and knife (ask an adult to help chop)\n\n📝 Steps:\n1. Wash the greens under water\n2. Chop into tiny pieces (easier for babies to eat)\n3. Put a small handful in the food dish\n4. Place dish in the tank\n5. Remove uneaten greens at the end of the day\n\n🥬 Best greens: Collard greens, dandelion greens, mustard greens\n🚫 DON'T feed: Spinach, lettuce, or avocado (these are bad for beardies!)\n\n💡 Babies may not eat much greens - that's okay! Keep offering them.",
+    ('bearded_dragon', 'feeding', 'greens', 'juvenile'): "**Feeding Juvenile Bearded Dragon - Greens**\n\n📋 What you need:\n• Fresh greens: collard greens, dandelion greens, or mustard greens\n• Clean food dish\n\n📊 Diet balance by age:\n• 4-5 months: 10% veggies, 90% protein (bugs)\n• 6-9 months: 20% veggies, 80% protein\n• 10-11 months: 30% veggies, 70% protein\n\n📝 Steps:\n1. Wash the greens under water\n2. Tear or chop into small bite-sized pieces\n3. Make a salad about the size of your beardie's head\n4. Place in the food dish in the tank EVERY MORNING\n5. Remove uneaten greens at the end of the day\n\n🥬 Best greens: Collard greens, dandelion greens, mustard greens, butternut squash\n🚫 DON'T feed: Spinach (blocks calcium!), lettuce (no nutrition), avocado (toxic!)",
+    ('bearded_dragon', 'feeding', 'greens', 'sub_adult'): "**Feeding Sub-Adult Bearded Dragon - Greens**\n\n📋 What you need:\n• Fresh greens: collard greens, dandelion greens, or mustard greens\n• Clean food dish\n\n📝 Steps:\n1. Wash the greens under cold water\n2. Tear or chop into bite-sized pieces\n3. Make a salad about the size of your beardie's head\n4. You can add some butternut squash, bell pepper, or blueberries as treats!\n5. Place in the food dish\n6. Remove uneaten food at the end of the day\n\n🥬 Good greens: Collard greens, dandelion greens, mustard greens\n🍓 Treats (sometimes): Blueberries, strawberries, butternut squash\n🚫 AVOID: Spinach, lettuce, avocado, citrus fruits",
+    ('bearded_dragon', 'feeding', 'greens', 'adult'): "**Feeding Adult Bearded Dragon - Greens**\n\n📋 What you need:\n• Fresh greens: collard greens, dandelion greens, or mustard greens\n• Clean food dish\n\n📝 Steps:\n1. Wash the greens under cold water\n2. Tear or chop into bite-sized pieces\n3. Make a salad about the size of your beardie's head\n4. You can mix in some butternut squash, bell pepper, or a few blueberries!\n5. Place in the food dish\n6. Remove uneaten food at the end of the day\n\n🥬 Best greens (feed daily):\n• Collard greens ⭐\n• Dandelion greens ⭐\n• Mustard greens\n• Turnip greens\n\n🍓 Occasional treats:\n• Blueberries, strawberries (1-2 pieces)\n• Butternut squash\n• Bell peppers\n\n🚫 NEVER feed:\n• Spinach (blocks calcium absorption!)\n• Iceberg lettuce (no nutrition)\n• Avocado (toxic!)\n• Citrus fruits (too acidic)\n\n💡 Adults need 80% greens, only 20% insects!",
+    ('bearded_dragon', 'water', 'default', None): "**Changing Water**\n\n📋 What you need:\n• Fresh filtered or bottled water (room temperature)\n• Clean paper towels\n• Reptile water conditioner\n\n📝 Steps:\n1. Remove the water dish from the tank\n2. Dump out the old water in the sink\n3. Rinse the dish with warm water\n4. Wipe it clean with a paper towel\n5. Fill with fresh filtered or bottled water\n6. Add ONE drop of reptile water conditioner\n7. Put back in the tank (away from the heat lamp!)\n\n💡 Tips:\n• Change water every day - beardies can poop in it!\n• Use room temperature water, not cold\n• Don't put the dish directly under the basking light\n\n⚠️ Note: Beardies don't drink much from dishes - they get most water from their food!",
+    ('bearded_dragon', 'cleaning', 'spot_clean', None): "**Daily Spot Cleaning** ☀️ Do this FIRST thing every morning!\n\n📋 What you need:\n• Paper towels\n• Small trash bag\n\n📝 Steps:\n1. **FIRST: Remove yesterday's uneaten food** - throw away old greens and any dead insects\n2. Check the water dish - dump and refill if it looks dirty\n3. Wipe up any wet spots with a paper towel\n4. Throw away the dirty paper towels\n\n⏰ Do this BEFORE feeding breakfast - start with a clean tank!\n\n💡 Tip: Poop gets cleaned during the weekly deep clean!",
+    ('bearded_dragon', 'cleaning', 'deep_clean', None): '**Weekly Deep Clean** 🧹 The big clean!\n\n📋 What you need:\n• Paper towels\n• Reptile-safe cleaner (or 1 part vinegar + 2 parts water)\n• Clean cloth\n• Temporary container for your beardie\n• Small trash bag\n\n📝 Steps:\n1. **FIRST: Find and remove ALL poop** - look for brownish droppings with white part (urate)\n   👀 Check: under basking spot, near food dish, in corners, on decorations\n2. Safely move your beardie to a temporary container\n3. Remove all decorations, food dish, and water dish\n4. Remove loose substrate or liner\n5. Spray the tank walls and floor with reptile-safe cleaner\n6. Wipe everything down with paper towels\n7. Clean all decorations with the cleaner and rinse well\n8. Let everything dry completely\n9. Put clean substrate/liner back\n10. Return decorations, dishes, and your beardie!\n\n⏱️ This takes about 20-30 minutes\n\n⚠️ Important: Make sure everything is completely dry before putting your beardie back!',
+    ('bearded_dragon', 'dusting', 'calcium', None): "**Calcium Dusting**\n\n📋 What you need:\n• Calcium powder (WITHOUT D3 if your beardie has UVB light, WITH D3 if no UVB)\n• Small container or plastic bag\n• Feeder insects\n\n📝 Steps:\n1. Put insects in a small plastic bag or container\n2. Add a tiny pinch of calcium powder\n3. Shake gently until insects have a light white coating\n4. Feed the dusted insects to your beardie right away!\n\n💡 How much: Just a light coating - like a dusting of powdered sugar!\n⏰ How often: Every feeding for adults (3x per week is fine too)\n\n⚠️ Don't use too much - excess calcium can cause problems!",
+    ('bearded_dragon', 'dusting', 'multivitamin', None): '**Multivitamin Dusting**\n\n📋 What you need:\n• Reptile multivitamin powder\n• Small container or plastic bag\n• Feeder insects\n\n📝 Steps:\n1. Put insects in a small plastic bag or container\n2. Add a tiny pinch of multivitamin powder\n3. Shake gently until insects have a light coating\n4. Feed the dusted insects to your beardie!\n\n⏰ How often: 2 times per week (like Tuesday and Saturday)\n\n💡 Tip: On vitamin days, use multivitamin instead of calcium, not both at once!',
+}
+
+RECOMMENDED_SCHEDULES = {
+    ('bearded_dragon', 'baby'): [
+        {'task_name': 'Feed Dubia Roaches', 'task_type': 'feeding', 'frequency': 'daily', 'points_value': 10, 'description': '**Feeding Baby Bearded Dragon - Insects**\n\n📋 What you need:\n• 30-50 micro Dubia roaches (1/4 inch size - very small!)\n• Calcium powder\n• Escape-proof feeding dish\n\n📊 Daily amount: 30-50 micro roaches\n\n📝 Steps:\n1. Put the roaches in a bag or container\n2. Add a small pinch of calcium powder\n3. Shake gently so roaches get a light white coating\n4. Put ALL the dusted roaches in the feeding dish\n5. Place dish in tank (NOT under the basking light - roaches will overheat!)\n6. Let your beardie hunt throughout the day\n7. Remove any uneaten roaches at night before bed\n\n💡 Tip: You can add greens to the same dish - roaches will eat them too!\n\n⚠️ Remember: Roaches should be NO bigger than the space between the eyes!'},
+        {'task_name': 'Feed Fresh Greens', 'task_type': 'feeding', 'frequency': 'daily', 'points_value': 5, 'description': "**Feeding Baby Bearded Dragon - Greens**\n\n📋 What you need:\n• Fresh greens: collard greens, dandelion greens, or mustard greens\n• Clean food dish\n• Cutting board and knife (ask an adult to help chop)\n\n📝 Steps:\n1. Wash the greens under water\n2. Chop into tiny pieces (easier for babies to eat)\n3. Put a small handful in the food dish\n4. Place dish in the tank\n5. Remove uneaten greens at the end of the day\n\n🥬 Best greens: Collard greens, dandelion greens, mustard greens\n🚫 DON'T feed: Spinach, lettuce, or avocado (these are bad for beardies!)\n\n💡 Babies may not eat much greens - that's okay! Keep offering them."},
+        {'task_name': 'Calcium Dusting', 'task_type': 'feeding', 'frequency': 'daily', 'points_value': 3, 'description': "**Calcium Dusting**\n\n📋 What you need:\n• Calcium powder (WITHOUT D3 if your beardie has UVB light, WITH D3 if no UVB)\n• Small container or plastic bag\n• Feeder insects\n\n📝 Steps:\n1. Put insects in a small plastic bag or container\n2. Add a tiny pinch of calcium powder\n3. Shake gently until insects have a light white coating\n4. Feed the dusted insects to your beardie right away!\n\n💡 How much: Just a light coating - like a dusting of powdered sugar!\n⏰ How often: Every feeding for adults (3x per week is fine too)\n\n⚠️ Don't use too much - excess calcium can cause problems!"},
+        {'task_name': 'Multivitamin Dusting', 'task_type': 'feeding', 'frequency': 'weekly', 'points_value': 5, 'description': '**Multivitamin Dusting**\n\n📋 What you need:\n• Reptile multivitamin powder\n• Small container or plastic bag\n• Feeder insects\n\n📝 Steps:\n1. Put insects in a small plastic bag or container\n2. Add a tiny pinch of multivitamin powder\n3. Shake gently until insects have a light coating\n4. Feed the dusted insects to your beardie!\n\n⏰ How often: 2 times per week (like Tuesday and Saturday)\n\n💡 Tip: On vitamin days, use multivitamin instead of calcium, not both at once!'},
+        {'task_name': 'Change Water', 'task_type': 'water', 'frequency': 'daily', 'points_value': 5, 'description': "**Changing Water**\n\n📋 What you need:\n• Fresh filtered or bottled water (room temperature)\n• Clean paper towels\n• Reptile water conditioner\n\n📝 Steps:\n1. Remove the water dish from the tank\n2. Dump out the old water in the sink\n3. Rinse the dish with warm water\n4. Wipe it clean with a paper towel\n5. Fill with fresh filtered or bottled water\n6. Add ONE drop of reptile water conditioner\n7. Put back in the tank (away from the heat lamp!)\n\n💡 Tips:\n• Change water every day - beardies can poop in it!\n• Use room temperature water, not cold\n• Don't put the dish directly under the basking light\n\n⚠️ Note: Beardies don't drink much from dishes - they get most water from their food!"},
+        {'task_name': 'Daily Spot Clean', 'task_type': 'cleaning', 'frequency': 'daily', 'points_value': 5, 'description': "**Daily Spot Cleaning** ☀️ Do this FIRST thing every morning!\n\n📋 What you need:\n• Paper towels\n• Small trash bag\n\n📝 Steps:\n1. **FIRST: Remove yesterday's uneaten food** - throw away old greens and any dead insects\n2. Check the water dish - dump and refill if it looks dirty\n3. Wipe up any wet spots with a paper towel\n4. Throw away the dirty paper towels\n\n⏰ Do this BEFORE feeding breakfast - start with a clean tank!\n\n💡 Tip: Poop gets cleaned during the weekly deep clean!"},
+        {'task_name': 'Weekly Deep Clean', 'task_type': 'cleaning', 'frequency': 'weekly', 'points_value': 25, 'description': '**Weekly Deep Clean** 🧹 The big clean!\n\n📋 What you need:\n• Paper towels\n• Reptile-safe cleaner (or 1 part vinegar + 2 parts water)\n• Clean cloth\n• Temporary container for your beardie\n• Small trash bag\n\n📝 Steps:\n1. **FIRST: Find and remove ALL poop** - look for brownish droppings with white part (urate)\n   👀 Check: under basking spot, near food dish, in corners, on decorations\n2. Safely move your beardie to a temporary container\n3. Remove all decorations, food dish, and water dish\n4. Remove loose substrate or liner\n5. Spray the tank walls and floor with reptile-safe cleaner\n6. Wipe everything down with paper towels\n7. Clean all decorations with the cleaner and rinse well\n8. Let everything dry completely\n9. Put clean substrate/liner back\n10. Return decorations, dishes, and your beardie!\n\n⏱️ This takes about 20-30 minutes\n\n⚠️ Important: Make sure everything is completely dry before putting your beardie back!'},
+    ],
+    ('bearded_dragon', 'juvenile'): [
+        {'task_name': 'Feed Dubia Roaches', 'task_type': 'feeding', 'frequency': 'daily', 'points_value': 10, 'description': '**Feeding Juvenile Bearded Dragon - Insects**\n\n📋 What you need:\n• Medium Dubia roaches (1/2 inch size)\n• Calcium powder\n• Escape-proof feeding dish\n\n📊 Daily amount (by age):\n• 4-5 months old: 15-25 medium roaches\n• 6-9 months old: 10-15 medium roaches\n• 10-11 months old: 10-13 medium roaches\n\n📝 Steps:\n1. Put the roaches in a bag or container\n2. Add a small pinch of calcium powder\n3. Shake gently so roaches get a light white coating\n4. Put ALL the dusted roaches in the feeding dish\n5. Place dish in tank (NOT under the basking light - roaches will overheat!)\n6. Let your beardie hunt throughout the day\n7. Remove any uneaten roaches at night before bed\n\n💡 Tip: You can add greens to the same dish - roaches will eat them too!\n\n⚠️ Remember: Roaches should be NO bigger than the space between the eyes!'},
+        {'task_name': 'Feed Fresh Greens', 'task_type': 'feeding', 'frequency': 'daily', 'points_value': 5, 'description': "**Feeding Juvenile Bearded Dragon - Greens**\n\n📋 What you need:\n• Fresh greens: collard greens, dandelion greens, or mustard greens\n• Clean food dish\n\n📊 Diet balance by age:\n• 4-5 months: 10% veggies, 90% protein (bugs)\n• 6-9 months: 20% veggies, 80% protein\n• 10-11 months: 30% veggies, 70% protein\n\n📝 Steps:\n1. Wash the greens under water\n2. Tear or chop into small bite-sized pieces\n3. Make a salad about the size of your beardie's head\n4. Place in the food dish in the tank EVERY MORNING\n5. Remove uneaten greens at the end of the day\n\n🥬 Best greens: Collard greens, dandelion greens, mustard greens, butternut squash\n🚫 DON'T feed: Spinach (blocks calcium!), lettuce (no nutrition), avocado (toxic!)"},
+        {'task_name': 'Calcium Dusting', 'task_type': 'feeding', 'frequency': 'daily', 'points_value': 3, 'description': "**Calcium Dusting**\n\n📋 What you need:\n• Calcium powder (WITHOUT D3 if your beardie has UVB light, WITH D3 if no UVB)\n• Small container or plastic bag\n• Feeder insects\n\n📝 Steps:\n1. Put insects in a small plastic bag or container\n2. Add a tiny pinch of calcium powder\n3. Shake gently until insects have a light white coating\n4. Feed the dusted insects to your beardie right away!\n\n💡 How much: Just a light coating - like a dusting of powdered sugar!\n⏰ How often: Every feeding for adults (3x per week is fine too)\n\n⚠️ Don't use too much - excess calcium can cause problems!"},
+        {'task_name': 'Multivitamin Dusting', 'task_type': 'feeding', 'frequency': 'weekly', 'points_value': 5, 'description': '**Multivitamin Dusting**\n\n📋 What you need:\n• Reptile multivitamin powder\n• Small container or plastic bag\n• Feeder insects\n\n📝 Steps:\n1. Put insects in a small plastic bag or container\n2. Add a tiny pinch of multivitamin powder\n3. Shake gently until insects have a light coating\n4. Feed the dusted insects to your beardie!\n\n⏰ How often: 2 times per week (like Tuesday and Saturday)\n\n💡 Tip: On vitamin days, use multivitamin instead of calcium, not both at once!'},
+        {'task_name': 'Change Water', 'task_type': 'water', 'frequency': 'daily', 'points_value': 5, 'description': "**Changing Water**\n\n📋 What you need:\n• Fresh filtered or bottled water (room temperature)\n• Clean paper towels\n• Reptile water conditioner\n\n📝 Steps:\n1. Remove the water dish from the tank\n2. Dump out the old water in the sink\n3. Rinse the dish with warm water\n4. Wipe it clean with a paper towel\n5. Fill with fresh filtered or bottled water\n6. Add ONE drop of reptile water conditioner\n7. Put back in the tank (away from the heat lamp!)\n\n💡 Tips:\n• Change water every day - beardies can poop in it!\n• Use room temperature water, not cold\n• Don't put the dish directly under the basking light\n\n⚠️ Note: Beardies don't drink much from dishes - they get most water from their food!"},
+        {'task_name': 'Daily Spot Clean', 'task_type': 'cleaning', 'frequency': 'daily', 'points_value': 5, 'description': "**Daily Spot Cleaning** ☀️ Do this FIRST thing every morning!\n\n📋 What you need:\n• Paper towels\n• Small trash bag\n\n📝 Steps:\n1. **FIRST: Remove yesterday's uneaten food** - throw away old greens and any dead insects\n2. Check the water dish - dump and refill if it looks dirty\n3. Wipe up any wet spots with a paper towel\n4. Throw away the dirty paper towels\n\n⏰ Do this BEFORE feeding breakfast - start with a clean tank!\n\n💡 Tip: Poop gets cleaned during the weekly deep clean!"},
+        {'task_name': 'Weekly Deep Clean', 'task_type': 'cleaning', 'frequency': 'weekly', 'points_value': 25, 'description': '**Weekly Deep Clean** 🧹 The big clean!\n\n📋 What you need:\n• Paper towels\n• Reptile-safe cleaner (or 1 part vinegar + 2 parts water)\n• Clean cloth\n• Temporary container for your beardie\n• Small trash bag\n\n📝 Steps:\n1. **FIRST: Find and remove ALL poop** - look for brownish droppings with white part (urate)\n   👀 Check: under basking spot, near food dish, in corners, on decorations\n2. Safely move your beardie to a temporary container\n3. Remove all decorations, food dish, and water dish\n4. Remove loose substrate or liner\n5. Spray the tank walls and floor with reptile-safe cleaner\n6. Wipe everything down with paper towels\n7. Clean all decorations with the cleaner and rinse well\n8. Let everything dry completely\n9. Put clean substrate/liner back\n10. Return decorations, dishes, and your beardie!\n\n⏱️ This takes about 20-30 minutes\n\n⚠️ Important: Make sure everything is completely dry before putting your beardie back!'},
+    ],
+    ('bearded_dragon', 'sub_adult'): [
+        {'task_name': 'Feed Dubia Roaches', 'task_type': 'feeding', 'frequency': 'daily', 'points_value': 10, 'description': '**Feeding Sub-Adult Bearded Dragon - Insects**\n\n📋 What you need:\n• 5-7 medium Dubia roaches (1/2 inch) OR 3-5 large roaches (3/4 inch)\n• Calcium powder\n• Escape-proof feeding dish\n\n🥬 Diet balance: 60% veggies, 40% protein (bugs)\n\n📝 Steps:\n1. Put the roaches in a bag or container\n2. Add a pinch of calcium powder\n3. Shake gently so roaches get a light white coating\n4. Put the dusted roaches in the feeding dish\n5. Place dish in tank (NOT under the basking light!)\n6. Let your beardie hunt throughout the day\n7. Remove any uneaten roaches at night before bed\n\n💡 Tip: Add greens to the same dish!'},
+        {'task_name': 'Feed Fresh Greens', 'task_type': 'feeding', 'frequency': 'daily', 'points_value': 5, 'description': "**Feeding Sub-Adult Bearded Dragon - Greens**\n\n📋 What you need:\n• Fresh greens: collard greens, dandelion greens, or mustard greens\n• Clean food dish\n\n📝 Steps:\n1. Wash the greens under cold water\n2. Tear or chop into bite-sized pieces\n3. Make a salad about the size of your beardie's head\n4. You can add some butternut squash, bell pepper, or blueberries as treats!\n5. Place in the food dish\n6. Remove uneaten food at the end of the day\n\n🥬 Good greens: Collard greens, dandelion greens, mustard greens\n🍓 Treats (sometimes): Blueberries, strawberries, butternut squash\n🚫 AVOID: Spinach, lettuce, avocado, citrus fruits"},
+        {'task_name': 'Calcium Dusting', 'task_type': 'feeding', 'frequency': 'daily', 'points_value': 3, 'description': "**Calcium Dusting**\n\n📋 What you need:\n• Calcium powder (WITHOUT D3 if your beardie has UVB light, WITH D3 if no UVB)\n• Small container or plastic bag\n• Feeder insects\n\n📝 Steps:\n1. Put insects in a small plastic bag or container\n2. Add a tiny pinch of calcium powder\n3. Shake gently until insects have a light white coating\n4. Feed the dusted insects to your beardie right away!\n\n💡 How much: Just a light coating - like a dusting of powdered sugar!\n⏰ How often: Every feeding for adults (3x per week is fine too)\n\n⚠️ Don't use too much - excess calcium can cause problems!"},
+        {'task_name': 'Multivitamin Dusting', 'task_type': 'feeding', 'frequency': 'weekly', 'points_value': 5, 'description': '**Multivitamin Dusting**\n\n📋 What you need:\n• Reptile multivitamin powder\n• Small container or plastic bag\n• Feeder insects\n\n📝 Steps:\n1. Put insects in a small plastic bag or container\n2. Add a tiny pinch of multivitamin powder\n3. Shake gently until insects have a light coating\n4. Feed the dusted insects to your beardie!\n\n⏰ How often: 2 times per week (like Tuesday and Saturday)\n\n💡 Tip: On vitamin days, use multivitamin instead of calcium, not both at once!'},
+        {'task_name': 'Change Water', 'task_type': 'water', 'frequency': 'daily', 'points_value': 5, 'description': "**Changing Water**\n\n📋 What you need:\n• Fresh filtered or bottled water (room temperature)\n• Clean paper towels\n• Reptile water conditioner\n\n📝 Steps:\n1. Remove the water dish from the tank\n2. Dump out the old water in the sink\n3. Rinse the dish with warm water\n4. Wipe it clean with a paper towel\n5. Fill with fresh filtered or bottled water\n6. Add ONE drop of reptile water conditioner\n7. Put back in the tank (away from the heat lamp!)\n\n💡 Tips:\n• Change water every day - beardies can poop in it!\n• Use room temperature water, not cold\n• Don't put the dish directly under the basking light\n\n⚠️ Note: Beardies don't drink much from dishes - they get most water from their food!"},
+        {'task_name': 'Daily Spot Clean', 'task_type': 'cleaning', 'frequency': 'daily', 'points_value': 5, 'description': "**Daily Spot Cleaning** ☀️ Do this FIRST thing every morning!\n\n📋 What you need:\n• Paper towels\n• Small trash bag\n\n📝 Steps:\n1. **FIRST: Remove yesterday's uneaten food** - throw away old greens and any dead insects\n2. Check the water dish - dump and refill if it looks dirty\n3. Wipe up any wet spots with a paper towel\n4. Throw away the dirty paper towels\n\n⏰ Do this BEFORE feeding breakfast - start with a clean tank!\n\n💡 Tip: Poop gets cleaned during the weekly deep clean!"},
+        {'task_name': 'Weekly Deep Clean', 'task_type': 'cleaning', 'frequency': 'weekly', 'points_value': 25, 'description': '**Weekly Deep Clean** 🧹 The big clean!\n\n📋 What you need:\n• Paper towels\n• Reptile-safe cleaner (or 1 part vinegar + 2 parts water)\n• Clean cloth\n• Temporary container for your beardie\n• Small trash bag\n\n📝 Steps:\n1. **FIRST: Find and remove ALL poop** - look for brownish droppings with white part (urate)\n   👀 Check: under basking spot, near food dish, in corners, on decorations\n2. Safely move your beardie to a temporary container\n3. Remove all decorations, food dish, and water dish\n4. Remove loose substrate or liner\n5. Spray the tank walls and floor with reptile-safe cleaner\n6. Wipe everything down with paper towels\n7. Clean all decorations with the cleaner and rinse well\n8. Let everything dry completely\n9. Put clean substrate/liner back\n10. Return decorations, dishes, and your beardie!\n\n⏱️ This takes about 20-30 minutes\n\n⚠️ Important: Make sure everything is completely dry before putting your beardie back!'},
+    ],
+    ('bearded_dragon', 'adult'): [
+        {'task_name': 'Feed Dubia Roaches', 'task_type': 'feeding', 'frequency': 'daily', 'points_value': 10, 'description': "**Feeding Adult Bearded Dragon - Insects**\n\n📋 What you need:\n• 3-5 adult Dubia roaches (1 inch size)\n• Calcium powder\n• Escape-proof feeding dish\n\n📊 Daily amount: 3-5 large roaches (or skip a day - adults don't need bugs daily!)\n\n📝 Steps:\n1. Put the roaches in a bag or container\n2. Add a small pinch of calcium powder\n3. Shake gently so roaches get a light white coating\n4. Put the dusted roaches in the feeding dish\n5. Place dish in tank (NOT under the basking light!)\n6. Let your beardie hunt throughout the day\n7. Remove any uneaten roaches at night before bed\n\n💡 Tip: Adults need mostly veggies (80%) with only some bugs (20%)!"},
+        {'task_name': 'Feed Fresh Greens', 'task_type': 'feeding', 'frequency': 'daily', 'points_value': 5, 'description': "**Feeding Adult Bearded Dragon - Greens**\n\n📋 What you need:\n• Fresh greens: collard greens, dandelion greens, or mustard greens\n• Clean food dish\n\n📝 Steps:\n1. Wash the greens under cold water\n2. Tear or chop into bite-sized pieces\n3. Make a salad about the size of your beardie's head\n4. You can mix in some butternut squash, bell pepper, or a few blueberries!\n5. Place in the food dish\n6. Remove uneaten food at the end of the day\n\n🥬 Best greens (feed daily):\n• Collard greens ⭐\n• Dandelion greens ⭐\n• Mustard greens\n• Turnip greens\n\n🍓 Occasional treats:\n• Blueberries, strawberries (1-2 pieces)\n• Butternut squash\n• Bell peppers\n\n🚫 NEVER feed:\n• Spinach (blocks calcium absorption!)\n• Iceberg lettuce (no nutrition)\n• Avocado (toxic!)\n• Citrus fruits (too acidic)\n\n💡 Adults need 80% greens, only 20% insects!"},
+        {'task_name': 'Calcium Dusting', 'task_type': 'feeding', 'frequency': 'daily', 'points_value': 3, 'description': "**Calcium Dusting**\n\n📋 What you need:\n• Calcium powder (WITHOUT D3 if your beardie has UVB light, WITH D3 if no UVB)\n• Small container or plastic bag\n• Feeder insects\n\n📝 Steps:\n1. Put insects in a small plastic bag or container\n2. Add a tiny pinch of calcium powder\n3. Shake gently until insects have a light white coating\n4. Feed the dusted insects to your beardie right away!\n\n💡 How much: Just a light coating - like a dusting of powdered sugar!\n⏰ How often: Every feeding for adults (3x per week is fine too)\n\n⚠️ Don't use too much - excess calcium can cause problems!"},
+        {'task_name': 'Multivitamin Dusting', 'task_type': 'feeding', 'frequency': 'weekly', 'points_value': 5, 'description': '**Multivitamin Dusting**\n\n📋 What you need:\n• Reptile multivitamin powder\n• Small container or plastic bag\n• Feeder insects\n\n📝 Steps:\n1. Put insects in a small plastic bag or container\n2. Add a tiny pinch of multivitamin powder\n3. Shake gently until insects have a light coating\n4. Feed the dusted insects to your beardie!\n\n⏰ How often: 2 times per week (like Tuesday and Saturday)\n\n💡 Tip: On vitamin days, use multivitamin instead of calcium, not both at once!'},
+        {'task_name': 'Change Water', 'task_type': 'water', 'frequency': 'daily', 'points_value': 5, 'description': "**Changing Water**\n\n📋 What you need:\n• Fresh filtered or bottled water (room temperature)\n• Clean paper towels\n• Reptile water conditioner\n\n📝 Steps:\n1. Remove the water dish from the tank\n2. Dump out the old water in the sink\n3. Rinse the dish with warm water\n4. Wipe it clean with a paper towel\n5. Fill with fresh filtered or bottled water\n6. Add ONE drop of reptile water conditioner\n7. Put back in the tank (away from the heat lamp!)\n\n💡 Tips:\n• Change water every day - beardies can poop in it!\n• Use room temperature water, not cold\n• Don't put the dish directly under the basking light\n\n⚠️ Note: Beardies don't drink much from dishes - they get most water from their food!"},
+        {'task_name': 'Daily Spot Clean', 'task_type': 'cleaning', 'frequency': 'daily', 'points_value': 5, 'description': "**Daily Spot Cleaning** ☀️ Do this FIRST thing every morning!\n\n📋 What you need:\n• Paper towels\n• Small trash bag\n\n📝 Steps:\n1. **FIRST: Remove yesterday's uneaten food** - throw away old greens and any dead insects\n2. Check the water dish - dump and refill if it looks dirty\n3. Wipe up any wet spots with a paper towel\n4. Throw away the dirty paper towels\n\n⏰ Do this BEFORE feeding breakfast - start with a clean tank!\n\n💡 Tip: Poop gets cleaned during the weekly deep clean!"},
+        {'task_name': 'Weekly Deep Clean', 'task_type': 'cleaning', 'frequency': 'weekly', 'points_value': 25, 'description': '**Weekly Deep Clean** 🧹 The big clean!\n\n📋 What you need:\n• Paper towels\n• Reptile-safe cleaner (or 1 part vinegar + 2 parts water)\n• Clean cloth\n• Temporary container for your beardie\n• Small trash bag\n\n📝 Steps:\n1. **FIRST: Find and remove ALL poop** - look for brownish droppings with white part (urate)\n   👀 Check: under basking spot, near food dish, in corners, on decorations\n2. Safely move your beardie to a temporary container\n3. Remove all decorations, food dish, and water dish\n4. Remove loose substrate or liner\n5. Spray the tank walls and floor with reptile-safe cleaner\n6. Wipe everything down with paper towels\n7. Clean all decorations with the cleaner and rinse well\n8. Let everything dry completely\n9. Put clean substrate/liner back\n10. Return decorations, dishes, and your beardie!\n\n⏱️ This takes about 20-30 minutes\n\n⚠️ Important: Make sure everything is completely dry before putting your beardie back!'},
+    ],
+    ('bearded_dragon', 'senior'): [
+        {'task_name': 'Feed Dubia Roaches', 'task_type': 'feeding', 'frequency': 'daily', 'points_value': 10, 'description': "**Feeding Adult Bearded Dragon - Insects**\n\n📋 What you need:\n• 3-5 adult Dubia roaches (1 inch size)\n• Calcium powder\n• Escape-proof feeding dish\n\n📊 Daily amount: 3-5 large roaches (or skip a day - adults don't need bugs daily!)\n\n📝 Steps:\n1. Put the roaches in a bag or container\n2. Add a small pinch of calcium powder\n3. Shake gently so roaches get a light white coating\n4. Put the dusted roaches in the feeding dish\n5. Place dish in tank (NOT under the basking light!)\n6. Let your beardie hunt throughout the day\n7. Remove any uneaten roaches at night before bed\n\n💡 Tip: Adults need mostly veggies (80%) with only some bugs (20%)!"},
+        {'task_name': 'Feed Fresh Greens', 'task_type': 'feeding', 'frequency': 'daily', 'points_value': 5, 'description': "**Feeding Adult Bearded Dragon - Greens**\n\n📋 What you need:\n• Fresh greens: collard greens, dandelion greens, or mustard greens\n• Clean food dish\n\n📝 Steps:\n1. Wash the greens under cold water\n2. Tear or chop into bite-sized pieces\n3. Make a salad about the size of your beardie's head\n4. You can mix in some butternut squash, bell pepper, or a few blueberries!\n5. Place in the food dish\n6. Remove uneaten food at the end of the day\n\n🥬 Best greens (feed daily):\n• Collard greens ⭐\n• Dandelion greens ⭐\n• Mustard greens\n• Turnip greens\n\n🍓 Occasional treats:\n• Blueberries, strawberries (1-2 pieces)\n• Butternut squash\n• Bell peppers\n\n🚫 NEVER feed:\n• Spinach (blocks calcium absorption!)\n• Iceberg lettuce (no nutrition)\n• Avocado (toxic!)\n• Citrus fruits (too acidic)\n\n💡 Adults need 80% greens, only 20% insects!"},
+        {'task_name': 'Calcium Dusting', 'task_type': 'feeding', 'frequency': 'daily', 'points_value': 3, 'description': "**Calcium Dusting**\n\n📋 What you need:\n• Calcium powder (WITHOUT D3 if your beardie has UVB light, WITH D3 if no UVB)\n• Small container or plastic bag\n• Feeder insects\n\n📝 Steps:\n1. Put insects in a small plastic bag or container\n2. Add a tiny pinch of calcium powder\n3. Shake gently until insects have a light white coating\n4. Feed the dusted insects to your beardie right away!\n\n💡 How much: Just a light coating - like a dusting of powdered sugar!\n⏰ How often: Every feeding for adults (3x per week is fine too)\n\n⚠️ Don't use too much - excess calcium can cause problems!"},
+        {'task_name': 'Multivitamin Dusting', 'task_type': 'feeding', 'frequency': 'weekly', 'points_value': 5, 'description': '**Multivitamin Dusting**\n\n📋 What you need:\n• Reptile multivitamin powder\n• Small container or plastic bag\n• Feeder insects\n\n📝 Steps:\n1. Put insects in a small plastic bag or container\n2. Add a tiny pinch of multivitamin powder\n3. Shake gently until insects have a light coating\n4. Feed the dusted insects to your beardie!\n\n⏰ How often: 2 times per week (like Tuesday and Saturday)\n\n💡 Tip: On vitamin days, use multivitamin instead of calcium, not both at once!'},
+        {'task_name': 'Change Water', 'task_type': 'water', 'frequency': 'daily', 'points_value': 5, 'description': "**Changing Water**\n\n📋 What you need:\n• Fresh filtered or bottled water (room temperature)\n• Clean paper towels\n• Reptile water conditioner\n\n📝 Steps:\n1. Remove the water dish from the tank\n2. Dump out the old water in the sink\n3. Rinse the dish with warm water\n4. Wipe it clean with a paper towel\n5. Fill with fresh filtered or bottled water\n6. Add ONE drop of reptile water conditioner\n7. Put back in the tank (away from the heat lamp!)\n\n💡 Tips:\n• Change water every day - beardies can poop in it!\n• Use room temperature water, not cold\n• Don't put the dish directly under the basking light\n\n⚠️ Note: Beardies don't drink much from dishes - they get most water from their food!"},
+        {'task_name': 'Daily Spot Clean', 'task_type': 'cleaning', 'frequency': 'daily', 'points_value': 5, 'description': "**Daily Spot Cleaning** ☀️ Do this FIRST thing every morning!\n\n📋 What you need:\n• Paper towels\n• Small trash bag\n\n📝 Steps:\n1. **FIRST: Remove yesterday's uneaten food** - throw away old greens and any dead insects\n2. Check the water dish - dump and refill if it looks dirty\n3. Wipe up any wet spots with a paper towel\n4. Throw away the dirty paper towels\n\n⏰ Do this BEFORE feeding breakfast - start with a clean tank!\n\n💡 Tip: Poop gets cleaned during the weekly deep clean!"},
+        {'task_name': 'Weekly Deep Clean', 'task_type': 'cleaning', 'frequency': 'weekly', 'points_value': 25, 'description': '**Weekly Deep Clean** 🧹 The big clean!\n\n📋 What you need:\n• Paper towels\n• Reptile-safe cleaner (or 1 part vinegar + 2 parts water)\n• Clean cloth\n• Temporary container for your beardie\n• Small trash bag\n\n📝 Steps:\n1. **FIRST: Find and remove ALL poop** - look for brownish droppings with white part (urate)\n   👀 Check: under basking spot, near food dish, in corners, on decorations\n2. Safely move your beardie to a temporary container\n3. Remove all decorations, food dish, and water dish\n4. Remove loose substrate or liner\n5. Spray the tank walls and floor with reptile-safe cleaner\n6. Wipe everything down with paper towels\n7. Clean all decorations with the cleaner and rinse well\n8. Let everything dry completely\n9. Put clean substrate/liner back\n10. Return decorations, dishes, and your beardie!\n\n⏱️ This takes about 20-30 minutes\n\n⚠️ Important: Make sure everything is completely dry before putting your beardie back!'},
+    ],
+}
@@ -1,18 +1,36 @@
 import logging
 import os
+import threading
+import time
 import uuid
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from typing import Any, List, Optional  # noqa: UP035
+from enum import Enum
+from itertools import islice
+from types import UnionType
+from typing import Any, Callable, Iterator, List, Optional, Union, get_args, get_origin  # noqa: UP035
 
 import boto3
-from boto3.dynamodb.conditions import Key  # Adding Key and Attr
+import botocore.session
+from boto3.dynamodb.conditions import Attr, Key
+from boto3.dynamodb.types import TypeDeserializer
+from botocore.config import Config
 from botocore.exceptions import ClientError
+from botocore.parsers import JSONParser, ResponseParserFactory
 from fastapi import HTTPException
 
 import models
 import security
 
+# Log level for the app's loggers, e.g. WARNING to keep INFO/DEBUG records from being formatted at all.
+# An unknown name would make setLevel raise at import and break every cold start, so it falls back to INFO.
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+if LOG_LEVEL not in logging.getLevelNamesMapping():
+    LOG_LEVEL = "INFO"
+
 # --- DynamoDB Setup ---
 DYNAMODB_ENDPOINT_OVERRIDE = os.getenv("DYNAMODB_ENDPOINT_OVERRIDE")  # For local testing e.g. 'http://localhost:8000'
 AWS_REGION = os.getenv("AWS_REGION", "us-west-2")  # Default to us-west-2
@@ -32,10 +50,65 @@ PET_CARE_SCHEDULES_TABLE_NAME = os.getenv("PET_CARE_SCHEDULES_TABLE_NAME", "Kids
 PET_CARE_TASKS_TABLE_NAME = os.getenv("PET_CARE_TASKS_TABLE_NAME", "KidsRewardsPetCareTasks")
 PET_HEALTH_LOGS_TABLE_NAME = os.getenv("PET_HEALTH_LOGS_TABLE_NAME", "KidsRewardsPetHealthLogs")
 
+# Number of parallel segments used for full-table scans
+SCAN_TOTAL_SEGMENTS = int(os.getenv("DYNAMODB_SCAN_SEGMENTS", "8"))
+
+# Larger connection pool for parallel scans, keep-alive so warm Lambda containers reuse connections,
+# and short timeouts with adaptive retries instead of hanging on a slow request
+_DYNAMODB_CONFIG = Config(
+    max_pool_connections=64,
+    retries={"mode": "adaptive", "max_attempts": 10},
+    tcp_keepalive=True,
+    connect_timeout=1,
+    read_timeout=3,
+)
+
 if DYNAMODB_ENDPOINT_OVERRIDE:
-    dynamodb = boto3.resource("dynamodb", endpoint_url=DYNAMODB_ENDPOINT_OVERRIDE, region_name=AWS_REGION)
+    _DYNAMODB_RESOURCE_KWARGS = {
+        "endpoint_url": DYNAMODB_ENDPOINT_OVERRIDE,
+        "region_name": AWS_REGION,
+        "config": _DYNAMODB_CONFIG,
+    }
 else:
-    dynamodb = boto3.resource("dynamodb", region_name=AWS_REGION)
+    _DYNAMODB_RESOURCE_KWARGS = {"region_name": AWS_REGION, "config": _DYNAMODB_CONFIG}
+
+
+class _RawAttributeMapJSONParser(JSONParser):
+    """JSON parser that hands DynamoDB item maps through as the wire JSON.
+
+    The resource layer's TypeDeserializer converts every AttributeValue anyway, so botocore walking
+    each attribute's shape first is pure overhead on large scans. The wire JSON is what the stock
+    parser would produce, except binary (B) values stay base64 strings; no table here stores binary.
+    """
+
+    def _handle_map(self, shape, value):
+        if shape.name == "AttributeMap":
+            return value
+        return super()._handle_map(shape, value)
+
+
+class _DynamoDBResponseParserFactory(ResponseParserFactory):
+    def create_parser(self, protocol_name):
+        if protocol_name == "json":
+            return _RawAttributeMapJSONParser(**self._defaults)
+        return super().create_parser(protocol_name)
+
+
+def _dynamodb_session() -> boto3.session.Session:
+    botocore_session = botocore.session.get_session()
+    botocore_session.register_component("response_parser_factory", _DynamoDBResponseParserFactory())
+    return boto3.session.Session(botocore_session=botocore_session)
+
+
+# Created once at import and shared by every request, so warm Lambda containers keep the same
+# connection pool. Handlers should use these module-level handles rather than creating resources.
+dynamodb = _dynamodb_session().resource("dynamodb", **_DYNAMODB_RESOURCE_KWARGS)
+
+# Low-level client for the hot list scans and user lookups: it skips the resource layer's generic walk over each
+# response, and items are deserialized directly with one shared TypeDeserializer. Clients are
+# thread-safe, so parallel scan workers share it. Expressions passed to it must be strings.
+ddb_client = _dynamodb_session().client("dynamodb", **_DYNAMODB_RESOURCE_KWARGS)
+_type_deserializer = TypeDeserializer()
 
 # Table resources are now initialized after dynamodb client is configured
 users_table = dynamodb.Table(USERS_TABLE_NAME)
@@ -51,55 +124,538 @@ pet_care_tasks_table = dynamodb.Table(PET_CARE_TASKS_TABLE_NAME)
 pet_health_logs_table = dynamodb.Table(PET_HEALTH_LOGS_TABLE_NAME)
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
+logger.setLevel(LOG_LEVEL)
+
+# Condition attributes are built once; call sites only supply the compared value
+_K_ASSIGNED_BY_PARENT_ID = Key("assigned_by_parent_id")
+_K_ASSIGNED_TO_KID_ID = Key("assigned_to_kid_id")
+_K_ASSIGNMENT_STATUS = Key("assignment_status")
+_K_CREATED_BY_PARENT_ID = Key("created_by_parent_id")
+_K_GSI_PK = Key("gsi_pk")
+_K_KID_ID = Key("kid_id")
+_K_PARENT_ID = Key("parent_id")
+_K_PET_ID = Key("pet_id")
+_K_REQUESTER_ID = Key("requester_id")
+_K_STATUS = Key("status")
+_K_STATUS_REVIEWED_AT = Key("status_reviewed_at")
+_K_STATUS_SUBMITTED_AT = Key("status_submitted_at")
+_K_SUBMITTED_AT = Key("submitted_at")
+_K_USER_ID = Key("user_id")
+_A_ASSIGNED_BY_PARENT_ID = Attr("assigned_by_parent_id")
+_A_ASSIGNED_TO_KID_ID = Attr("assigned_to_kid_id")
+_A_ASSIGNMENT_STATUS = Attr("assignment_status")
+_A_CHORE_ID = Attr("chore_id")
+_A_CREATED_BY_PARENT_ID = Attr("created_by_parent_id")
+_A_KID_ID = Attr("kid_id")
+_A_PARENT_ID = Attr("parent_id")
+_A_PET_ID = Attr("pet_id")
+_A_REQUESTER_ID = Attr("requester_id")
+_A_STATUS = Attr("status")
+_ACTIVE_PARTITION = Key("is_active").eq("true")  # Partition key condition for ActivePets/ActiveSchedules GSIs
+_A_ACTIVE = Attr("is_active").eq("true")  # The same condition as a filter, for their scan fallbacks
+
+# Chores store is_active as a native boolean. ActiveChoresIndex is keyed on is_active_pk instead, which
+# only active chores carry (boolean attributes can't be index keys), so inactive chores drop out of it.
+ACTIVE_CHORES_PARTITION = "ACTIVE"
+_ACTIVE_CHORES_PARTITION = Key("is_active_pk").eq(ACTIVE_CHORES_PARTITION)
+# Rows not yet converted by scripts/backfill_chore_is_active.py still hold "true"; _stored_bool reads both
+_A_CHORE_IS_ACTIVE = Attr("is_active").is_in([True, "true"])
+
+
+def _index_missing(e: ClientError) -> bool:
+    """Whether a query failed because its table or index doesn't exist (yet), so a scan fallback applies.
+
+    A missing table is ResourceNotFoundException, but real DynamoDB reports a missing GSI as a
+    ValidationException ("The table does not have the specified index"); moto uses the former for both.
+    """
+    error = e.response["Error"]
+    if error["Code"] == "ResourceNotFoundException":
+        return True
+    return error["Code"] == "ValidationException" and "specified index" in error.get("Message", "")
+
+
+def _decimal_to_number(value: Decimal) -> int | float:
+    return int(value) if value == value.to_integral_value() else float(value)
 
 
 # Helper to convert Decimals from DynamoDB to int/float for Pydantic models
 def replace_decimals(obj: Any) -> Any:
-    if isinstance(obj, list):
-        return [replace_decimals(i) for i in obj]
-    elif isinstance(obj, dict):
-        return {k: replace_decimals(v) for k, v in obj.items()}
-    elif isinstance(obj, Decimal):
-        if obj % 1 == 0:
-            return int(obj)
+    """
+    Return a copy of obj with every Decimal converted to int (if whole) or float.
+
+    Nested dicts and lists are walked with an explicit stack rather than recursion; each
+    (parent, key, value) entry fills in one slot of the copy being built.
+    """
+    _dict, _list, _Decimal = dict, list, Decimal
+    if isinstance(obj, _Decimal):
+        return _decimal_to_number(obj)
+    if not isinstance(obj, (_dict, _list)):
+        return obj
+
+    root = [obj]
+    stack = [(root, 0, obj)]
+    while stack:
+        parent, key, value = stack.pop()
+        if isinstance(value, _dict):
+            copy = dict.fromkeys(value)
+            children = value.items()
         else:
-            return float(obj)
-    return obj
+            copy = [None] * len(value)
+            children = enumerate(value)
+        parent[key] = copy
+        for child_key, child in children:
+            if isinstance(child, _Decimal):
+                copy[child_key] = _decimal_to_number(child)
+            elif isinstance(child, (_dict, _list)):
+                stack.append((copy, child_key, child))
+            else:
+                copy[child_key] = child
+    return root[0]
+
+
+def _number_to_decimal(value: Any) -> Any:
+    if isinstance(value, bool):  # bool is an int subclass, so check it first; stored as-is
+        return value
+    if isinstance(value, int):
+        return Decimal(value)  # Exact, no need for the str round-trip
+    if isinstance(value, float):
+        return Decimal(str(value))  # str() avoids binary artifacts like 0.1000000000000000055...
+    return value
 
 
 # Helper to prepare Python dicts for DynamoDB (convert numbers to Decimal, handle None)
 def prepare_item_for_dynamodb(item: Any) -> Any:
-    if isinstance(item, dict):
-        new_dict = {}
-        for k, v in item.items():
-            if v is not None:  # Skip None values, DynamoDB doesn't store them well unless explicitly needed
-                new_dict[k] = prepare_item_for_dynamodb(v)
-        return new_dict
-    elif isinstance(item, list):
-        new_list = []
-        for i in item:
-            if i is not None:  # Optionally skip None values in lists too
-                new_list.append(prepare_item_for_dynamodb(i))
-        return new_list
-    elif isinstance(item, (int, float)):
-        return Decimal(str(item))
-    return item  # For strings, booleans, Decimals, etc.
+    """
+    Return a copy of item with ints/floats converted to Decimal and None values dropped.
+
+    Uses the same explicit-stack walk as replace_decimals. Booleans are stored as-is.
+    """
+    _dict, _list = dict, list
+    if isinstance(item, (_dict, _list)):
+        root = [item]
+        stack = [(root, 0, item)]
+        while stack:
+            parent, key, value = stack.pop()
+            if isinstance(value, _dict):
+                # Skip None values, DynamoDB doesn't store them well unless explicitly needed
+                copy = {k: v for k, v in value.items() if v is not None}
+                children = copy.items()
+            else:
+                # Optionally skip None values in lists too
+                copy = [v for v in value if v is not None]
+                children = enumerate(copy)
+            parent[key] = copy
+            for child_key, child in children:
+                if isinstance(child, (_dict, _list)):
+                    stack.append((copy, child_key, child))
+                elif isinstance(child, (int, float)):
+                    copy[child_key] = _number_to_decimal(child)
+        return root[0]
+    return _number_to_decimal(item)  # Strings, Decimals etc. pass through unchanged
+
+
+def _model_projection(model: type) -> dict:
+    """
+    ProjectionExpression kwargs that fetch only the attributes model declares.
+
+    Every name goes through a placeholder so reserved words (name, status, role, ...) need no special
+    casing. A fresh dict is returned each call: boto3 merges condition placeholders into it.
+    """
+    fields = model.model_fields
+    return {
+        "ProjectionExpression": ", ".join(f"#{field}" for field in fields),
+        "ExpressionAttributeNames": {f"#{field}": field for field in fields},
+    }
+
+
+# boto3 resources aren't thread-safe, so each worker thread builds its own from a fresh session.
+# The executor runs scan segments and other concurrent reads; it is module-level so its threads
+# (and their resources) survive across warm invocations.
+_scan_thread_local = threading.local()
+_scan_executor = ThreadPoolExecutor(max_workers=SCAN_TOTAL_SEGMENTS, thread_name_prefix="dynamodb-scan")
+
+
+def _thread_table(table_name: str):
+    resource = getattr(_scan_thread_local, "dynamodb", None)
+    if resource is None:
+        resource = _dynamodb_session().resource("dynamodb", **_DYNAMODB_RESOURCE_KWARGS)
+        _scan_thread_local.dynamodb = resource
+    return resource.Table(table_name)
+
+
+def _scan_segment(table_name: str, segment: int, total_segments: int, scan_kwargs: dict) -> list[dict]:
+    table = _thread_table(table_name)
+    scan_kwargs = {**scan_kwargs, "Segment": segment, "TotalSegments": total_segments}
+    response = table.scan(**scan_kwargs)
+    items = response.get("Items", [])
+    while "LastEvaluatedKey" in response:
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+        response = table.scan(**scan_kwargs)
+        items.extend(response.get("Items", []))
+    return items
+
+
+def iter_query(table, **query_kwargs) -> Iterator[dict]:
+    """
+    Yield every item a Query returns, following LastEvaluatedKey one page at a time.
+
+    A single query() call stops at 1 MB, so list reads go through this to see the whole result.
+    Only one page is held at a time; errors surface when the first page is requested.
+    """
+    while True:
+        response = table.query(**query_kwargs)
+        yield from response.get("Items", [])
+        if "LastEvaluatedKey" not in response:
+            return
+        query_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def parallel_scan(table, total_segments: int = SCAN_TOTAL_SEGMENTS, **scan_kwargs) -> list[dict]:
+    """
+    Scan a whole table as parallel segments, each paginated on its own worker thread.
+
+    Extra keyword arguments (e.g. FilterExpression) are passed to every segment's Scan.
+    Raises ClientError from any segment, like a plain scan would.
+    """
+    futures = [
+        _scan_executor.submit(_scan_segment, table.name, segment, total_segments, scan_kwargs)
+        for segment in range(total_segments)
+    ]
+    items = []
+    for future in futures:
+        items.extend(future.result())
+    return items
+
+
+def _deserialize_item(item: dict) -> dict:
+    deserialize = _type_deserializer.deserialize
+    return {name: deserialize(value) for name, value in item.items()}
+
+
+def _client_scan_segment(table_name: str, segment: int, total_segments: int, scan_kwargs: dict) -> list[dict]:
+    scan_kwargs = {**scan_kwargs, "TableName": table_name, "Segment": segment, "TotalSegments": total_segments}
+    response = ddb_client.scan(**scan_kwargs)
+    items = [_deserialize_item(item) for item in response.get("Items", [])]
+    while "LastEvaluatedKey" in response:
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+        response = ddb_client.scan(**scan_kwargs)
+        items.extend(_deserialize_item(item) for item in response.get("Items", []))
+    return items
+
+
+def client_scan(table_name: str, total_segments: int = SCAN_TOTAL_SEGMENTS, **scan_kwargs) -> list[dict]:
+    """
+    parallel_scan over the low-level client, for hot list endpoints.
+
+    Returns the same deserialized items (Decimal numbers) as parallel_scan. Extra keyword arguments
+    go to the client's Scan as-is, so expressions must be strings rather than Attr/Key conditions.
+    """
+    futures = [
+        _scan_executor.submit(_client_scan_segment, table_name, segment, total_segments, scan_kwargs)
+        for segment in range(total_segments)
+    ]
+    items = []
+    for future in futures:
+        items.extend(future.result())
+    return items
+
+
+BATCH_GET_MAX_KEYS = 100  # DynamoDB's per-request limit for BatchGetItem
+BATCH_GET_MAX_RETRIES = 5
+
+
+def batch_get(
+    table_name: str,
+    keys: list[dict],
+    projection: Optional[str] = None,
+    attribute_names: Optional[dict] = None,
+) -> list[dict]:
+    """
+    Fetch items by primary key with BatchGetItem, up to 100 keys per request.
+
+    Duplicate keys are dropped (BatchGetItem rejects them) and unprocessed keys are retried
+    with exponential backoff. Items that don't exist are simply missing from the result.
+    projection/attribute_names become the ProjectionExpression/ExpressionAttributeNames.
+    """
+    keys = list({tuple(sorted(key.items())): key for key in keys}.values())
+    table_request = {}
+    if projection:
+        table_request["ProjectionExpression"] = projection
+    if attribute_names:
+        table_request["ExpressionAttributeNames"] = attribute_names
+
+    items = []
+    for start in range(0, len(keys), BATCH_GET_MAX_KEYS):
+        request_items = {table_name: {**table_request, "Keys": keys[start : start + BATCH_GET_MAX_KEYS]}}
+        attempt = 0
+        while request_items:
+            response = dynamodb.batch_get_item(RequestItems=request_items)
+            items.extend(response.get("Responses", {}).get(table_name, []))
+            request_items = response.get("UnprocessedKeys")
+            if request_items:
+                if attempt >= BATCH_GET_MAX_RETRIES:
+                    logger.warning(
+                        "Giving up on %d unprocessed keys in %s", len(request_items[table_name]["Keys"]), table_name
+                    )
+                    break
+                time.sleep(0.05 * 2**attempt)
+                attempt += 1
+    return items
+
+
+def _utcnow() -> datetime:
+    """Current UTC time as a naive datetime, the form every stored timestamp uses.
+
+    Replaces the deprecated datetime.utcnow(); stays naive so new ISO strings match existing rows
+    and compare cleanly with the naive datetimes models parse them back into.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _iso_now() -> str:
+    """_utcnow() as the stored ISO string, for writes that don't also need the datetime."""
+    return _utcnow().isoformat()
+
+
+# --- Request-scoped cache ---
+# Memoizes lookups for the lifetime of one API request so the auth dependency and the handler
+# don't fetch the same user twice. Outside request_cache() (scripts, tests) nothing is cached.
+_request_cache: ContextVar[Optional[dict]] = ContextVar("request_cache", default=None)
+
+
+@contextmanager
+def request_cache():
+    token = _request_cache.set({})
+    try:
+        yield
+    finally:
+        _request_cache.reset(token)
+
+
+def _cache_users(*users: Optional[models.User]) -> None:
+    cache = _request_cache.get()
+    if cache is None:
+        return
+    for user in users:
+        if user is not None:
+            cache[("user", user.username)] = user
+
+
+def _forget_users(*usernames: str) -> None:
+    cache = _request_cache.get()
+    if cache is None:
+        return
+    for username in usernames:
+        cache.pop(("user", username), None)
+
+
+# --- Process-wide chore cache ---
+# Chores change rarely but are read on every submission, approval and assignment, so a warm Lambda
+# container keeps them for CHORE_CACHE_TTL_SECONDS. Writes through this module invalidate the entry;
+# writes from other containers show up once it expires. Users aren't cached here, since points and
+# roles must not go stale; they only use the request-scoped cache above.
+CHORE_CACHE_TTL_SECONDS = float(os.getenv("CHORE_CACHE_TTL_SECONDS", "60"))
+CHORE_CACHE_MAX_ENTRIES = 1024
+_chore_cache: dict[str, tuple[float, models.Chore]] = {}
+# The active chores listing (every kid's chore page) shares the lock and TTL; any chore write drops it.
+_active_chores_cache: Optional[tuple[float, list[models.Chore]]] = None
+_chore_cache_lock = threading.Lock()
+
+
+def _cached_chore(chore_id: str) -> Optional[models.Chore]:
+    with _chore_cache_lock:
+        entry = _chore_cache.get(chore_id)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del _chore_cache[chore_id]
+            return None
+        return entry[1]
+
+
+def _cache_chores(*chores: models.Chore) -> None:
+    if CHORE_CACHE_TTL_SECONDS <= 0:
+        return
+    expires_at = time.monotonic() + CHORE_CACHE_TTL_SECONDS
+    with _chore_cache_lock:
+        for chore in chores:
+            _chore_cache.pop(chore.id, None)  # Re-insert so dict order stays oldest-first
+            _chore_cache[chore.id] = (expires_at, chore)
+        while len(_chore_cache) > CHORE_CACHE_MAX_ENTRIES:
+            del _chore_cache[next(iter(_chore_cache))]
+
+
+def _cached_active_chores() -> Optional[list[models.Chore]]:
+    with _chore_cache_lock:
+        if _active_chores_cache is None or _active_chores_cache[0] <= time.monotonic():
+            return None
+        return list(_active_chores_cache[1])  # Callers get their own list
+
+
+def _cache_active_chores(chores: list[models.Chore]) -> None:
+    global _active_chores_cache
+    if CHORE_CACHE_TTL_SECONDS <= 0:
+        return
+    with _chore_cache_lock:
+        _active_chores_cache = (time.monotonic() + CHORE_CACHE_TTL_SECONDS, list(chores))
+
+
+def invalidate_chore(chore_id: str) -> None:
+    global _active_chores_cache
+    with _chore_cache_lock:
+        _chore_cache.pop(chore_id, None)
+        _active_chores_cache = None
+
+
+def clear_chore_cache() -> None:
+    global _active_chores_cache
+    with _chore_cache_lock:
+        _chore_cache.clear()
+        _active_chores_cache = None
+
+
+# --- Process-wide store listing cache ---
+# Every kid's store visit scans the whole store items table, and the catalog changes rarely, so a warm
+# container reuses the listing for STORE_ITEMS_CACHE_TTL_SECONDS. Store item writes through this module
+# drop it. Purchases price items with get_store_item_by_id, which always reads the table.
+STORE_ITEMS_CACHE_TTL_SECONDS = float(os.getenv("STORE_ITEMS_CACHE_TTL_SECONDS", "60"))
+_store_items_cache: Optional[tuple[float, list[models.StoreItem]]] = None
+_store_items_cache_lock = threading.Lock()
+
+
+def _cached_store_items() -> Optional[list[models.StoreItem]]:
+    with _store_items_cache_lock:
+        if _store_items_cache is None or _store_items_cache[0] <= time.monotonic():
+            return None
+        return list(_store_items_cache[1])  # Callers get their own list
+
+
+def _cache_store_items(store_items: list[models.StoreItem]) -> None:
+    global _store_items_cache
+    if STORE_ITEMS_CACHE_TTL_SECONDS <= 0:
+        return
+    with _store_items_cache_lock:
+        _store_items_cache = (time.monotonic() + STORE_ITEMS_CACHE_TTL_SECONDS, list(store_items))
+
+
+def clear_store_items_cache() -> None:
+    global _store_items_cache
+    with _store_items_cache_lock:
+        _store_items_cache = None
+
+
+# --- Trusted rows ---
+# Like users below, rows this module wrote were validated on the way in, so list reads rebuild them
+# with model_construct. Only fields whose stored form differs from the model type are converted:
+# Decimals to numbers, ISO strings to datetimes, strings to enums, and "true"/"false" strings (legacy
+# chores; pets and schedules, whose active GSIs key on the string) to booleans. Fields are looked up
+# by model type once, so a load touches only those fields instead of walking the whole item like
+# replace_decimals.
+def _stored_bool(value: Any) -> bool:
+    return value if isinstance(value, bool) else str(value).lower() == "true"
+
+
+def _stored_number(value: Any) -> Any:
+    return _decimal_to_number(value) if isinstance(value, Decimal) else value
+
+
+def _field_loader(annotation: Any) -> Optional[Callable[[Any], Any]]:
+    if get_origin(annotation) in (Union, UnionType):  # Optional[X] -> X
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) != 1:
+            return None
+        annotation = args[0]
+    if annotation is datetime:
+        return datetime.fromisoformat
+    if annotation is bool:
+        return _stored_bool
+    if annotation in (int, float, Decimal):
+        return _stored_number
+    if annotation in (dict, list) or get_origin(annotation) in (dict, list):
+        return replace_decimals
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return annotation
+    return None
+
+
+def _item_loader(model: type) -> Callable[[dict], Any]:
+    """Build a function turning a stored item into model, converting only the fields that need it."""
+    field_loaders = [
+        (name, loader) for name, field in model.model_fields.items() if (loader := _field_loader(field.annotation))
+    ]
+
+    def load(item: dict):
+        data = dict(item)
+        for name, loader in field_loaders:
+            value = data.get(name)
+            if value is not None:
+                data[name] = loader(value)
+        return model.model_construct(**data)
+
+    return load
+
+
+_chore_from_item = _item_loader(models.Chore)
+_chore_assignment_from_item = _item_loader(models.ChoreAssignment)
+_chore_log_from_item = _item_loader(models.ChoreLog)
+_purchase_log_from_item = _item_loader(models.PurchaseLog)
+_request_from_item = _item_loader(models.Request)
+_store_item_from_item = _item_loader(models.StoreItem)
+_pet_from_item = _item_loader(models.Pet)
+_pet_care_schedule_from_item = _item_loader(models.PetCareSchedule)
+_pet_care_task_from_item = _item_loader(models.PetCareTask)
+_pet_health_log_from_item = _item_loader(models.PetHealthLog)
 
 
 # --- User CRUD ---
+# Rows read back from our own users table were validated when written, so they're built with
+# model_construct, skipping per-field validation. Only the role enum needs converting by hand.
+def _user_from_item(item: dict) -> models.User:
+    data = replace_decimals(item)
+    data["role"] = models.UserRole(data["role"])
+    return models.User.model_construct(**data)
+
+
+def _user_summary_from_item(item: dict) -> models.UserSummary:
+    data = replace_decimals(item)
+    data["role"] = models.UserRole(data["role"])
+    return models.UserSummary.model_construct(**data)
+
+
 def get_user_by_username(username: str) -> Optional[models.User]:
+    cache = _request_cache.get()
+    if cache is not None and ("user", username) in cache:
+        return cache[("user", username)]
     try:
-        response = users_table.get_item(Key={"username": username})
+        # Client call with the key marshaled inline: user lookups run on nearly every request
+        response = ddb_client.get_item(
+            TableName=USERS_TABLE_NAME, Key={"username": {"S": username}}, **_model_projection(models.User)
+        )
         item = response.get("Item")
         if item:
-            return models.User(**replace_decimals(item))
+            user = _user_from_item(_deserialize_item(item))
+            _cache_users(user)
+            return user
         return None
     except ClientError as e:
-        print(f"Error getting user {username}: {e}")
+        logger.exception("Error getting user %s: %s", username, e)
         return None
 
 
+def get_users_by_usernames(usernames: list[str]) -> dict[str, models.User]:
+    """Look up many users in one BatchGetItem round trip per 100 usernames, keyed by username."""
+    if not usernames:
+        return {}
+    try:
+        items = batch_get(USERS_TABLE_NAME, [{"username": username} for username in usernames])
+        users = {item["username"]: _user_from_item(item) for item in items}
+        _cache_users(*users.values())  # Later single lookups in this request reuse the batch
+        return users
+    except ClientError as e:
+        logger.error("Error batch getting users %s: %s", usernames, e)
+        return {}
+
+
 def create_user(user_in: models.UserCreate) -> models.User:
     if len(user_in.username) < 3:
         raise HTTPException(status_code=400, detail="Username must be at least 3 characters long.")
@@ -133,71 +689,74 @@ def create_user(user_in: models.UserCreate) -> models.User:
             role=models.UserRole.KID,  # Use the enum member directly
             points=user_data["points"],
         )
+        _cache_users(user_for_response)
         return user_for_response
     except ClientError as e:
-        print(f"Error creating user {user_in.username}: {e}")
+        logger.exception("Error creating user %s: %s", user_in.username, e)
         # Consider raising a custom exception or re-raising
         raise HTTPException(status_code=500, detail="Could not create user in database.") from e
 
 
 def update_user_points(username: str, points_to_add: int) -> Optional[models.User]:
-    user = get_user_by_username(username)
-    if not user or user.role != models.UserRole.KID:
-        return None
-
-    new_points = (user.points or 0) + points_to_add
-
     try:
-        response = users_table.update_item(
-            Key={"username": username},
-            UpdateExpression="SET points = :p",
-            ExpressionAttributeValues={":p": Decimal(new_points)},  # Store numbers as Decimal
+        # ADD is applied atomically server-side (a missing points attribute counts as 0), so
+        # concurrent awards can't overwrite each other; the condition replaces the kid check.
+        # Like get_user_by_username this goes through the client with pre-marshaled values.
+        response = ddb_client.update_item(
+            TableName=USERS_TABLE_NAME,
+            Key={"username": {"S": username}},
+            UpdateExpression="ADD points :p",
+            ConditionExpression="attribute_exists(username) AND #r = :kid",
+            ExpressionAttributeNames={"#r": "role"},
+            ExpressionAttributeValues={
+                ":p": {"N": str(points_to_add)},
+                ":kid": {"S": models.UserRole.KID.value},
+            },
             ReturnValues="ALL_NEW",  # Get the updated item
         )
         updated_attributes = response.get("Attributes")
         if updated_attributes:
-            return models.User(**replace_decimals(updated_attributes))
+            user = _user_from_item(_deserialize_item(updated_attributes))
+            _cache_users(user)
+            return user
         return None  # Should not happen if update is successful
     except ClientError as e:
-        print(f"Error updating points for user {username}: {e}")
+        if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+            return None  # User missing or not a kid
+        logger.exception("Error updating points for user %s: %s", username, e)
         return None
 
 
-def set_user_api_key_hash(username: str, key_hash: str) -> Optional[models.User]:
-    user = get_user_by_username(username)
-    if not user:
-        return None
+def set_user_api_key_hash(username: str, key_hash: str) -> bool:
+    """Store the user's API key hash. The caller only needs success, so nothing is read back."""
     try:
-        response = users_table.update_item(
+        users_table.update_item(
             Key={"username": username},
             UpdateExpression="SET api_key_hash = :h",
+            ConditionExpression="attribute_exists(username)",  # Never create a user; replaces the pre-read
             ExpressionAttributeValues={":h": key_hash},
-            ReturnValues="ALL_NEW",
         )
-        updated = response.get("Attributes")
-        if updated:
-            return models.User(**replace_decimals(updated))
-        return None
     except ClientError as e:
+        if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+            return False  # User not found
         logger.error("Error setting API key hash for %s: %s", username, e)
-        return None
+        return False
+    _forget_users(username)  # The cached user's api_key_hash is stale now
+    return True
 
 
 def promote_user_to_parent(username: str) -> Optional[models.User]:
-    user = get_user_by_username(username)
-    if not user:
-        return None  # User not found
-
-    if user.role == models.UserRole.PARENT:
-        return user  # Already a parent
-
     try:
+        # The condition replaces the pre-read: a missing user or an existing parent fails it,
+        # and ALL_OLD tells the two apart.
         response = users_table.update_item(
             Key={"username": username},
             UpdateExpression="SET #r = :r REMOVE points",  # Set role to parent and remove points attribute
+            ConditionExpression="attribute_exists(username) AND #r <> :r",
             ExpressionAttributeNames={"#r": "role"},  # 'role' is not a reserved keyword but good practice
             ExpressionAttributeValues={":r": models.UserRole.PARENT.value},
             ReturnValues="ALL_NEW",
+            ReturnValuesOnConditionCheckFailure="ALL_OLD",
         )
         updated_attributes = response.get("Attributes")
         if updated_attributes:
@@ -205,59 +764,72 @@ def promote_user_to_parent(username: str) -> Optional[models.User]:
             if "points" in updated_attributes:  # Should have been removed by REMOVE
                 del updated_attributes["points"]
             updated_attributes["points"] = None  # Explicitly set to None for Pydantic model
-            return models.User(**replace_decimals(updated_attributes))
+            user = _user_from_item(updated_attributes)
+            _cache_users(user)
+            return user
         return None
     except ClientError as e:
-        print(f"Error promoting user {username} to parent: {e}")
+        if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+            existing_item = e.response.get("Item")
+            return _user_from_item(_deserialize_item(existing_item)) if existing_item else None  # Already a parent
+        logger.exception("Error promoting user %s to parent: %s", username, e)
         return None
 
 
-def get_all_users() -> list[models.User]:
+def get_all_users() -> list[models.UserSummary]:
     try:
-        response = users_table.scan()
-        items = response.get("Items", [])
-        # Add pagination handling if the table grows large
-        while "LastEvaluatedKey" in response:
-            response = users_table.scan(ExclusiveStartKey=response["LastEvaluatedKey"])
-            items.extend(response.get("Items", []))
-        print(f"Raw data from DynamoDB: {items}")
-        replaced_items = [replace_decimals(item) for item in items]
-        print(f"Data after replace_decimals: {replaced_items}")
-        return [models.User(**item) for item in replaced_items]
+        # Credentials (hashed_password, api_key_hash) are never read for listings
+        items = client_scan(USERS_TABLE_NAME, **_model_projection(models.UserSummary))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Raw data from DynamoDB: %r", items)
+        return [_user_summary_from_item(item) for item in items]
     except ClientError as e:
-        print(f"Error scanning users: {e}")
+        logger.exception("Error scanning users: %s", e)
         return []
 
 
 # --- Store Item CRUD ---
 def get_store_items() -> list[models.StoreItem]:
+    cached = _cached_store_items()
+    if cached is not None:
+        return cached
     try:
-        response = store_items_table.scan()
-        items = response.get("Items", [])
-        # Add pagination handling if the table grows large
-        while "LastEvaluatedKey" in response:
-            response = store_items_table.scan(ExclusiveStartKey=response["LastEvaluatedKey"])
-            items.extend(response.get("Items", []))
-        return [models.StoreItem(**replace_decimals(item)) for item in items]
+        items = client_scan(STORE_ITEMS_TABLE_NAME, **_model_projection(models.StoreItem))
+        store_items = list(map(_store_item_from_item, items))
+        _cache_store_items(store_items)
+        return store_items
     except ClientError as e:
-        print(f"Error scanning store items: {e}")
+        logger.exception("Error scanning store items: %s", e)
         return []
 
 
 def get_store_item_by_id(item_id: str) -> Optional[models.StoreItem]:
     try:
-        response = store_items_table.get_item(Key={"id": item_id})
+        response = store_items_table.get_item(Key={"id": item_id}, **_model_projection(models.StoreItem))
         item = response.get("Item")
         if item:
-            return models.StoreItem(**replace_decimals(item))
+            return _store_item_from_item(item)
         return None
     except ClientError as e:
-        print(f"Error getting store item {item_id}: {e}")
+        logger.exception("Error getting store item %s: %s", item_id, e)
         return None
 
 
-def create_store_item(item_in: models.StoreItemCreate) -> models.StoreItem:
-    item_id = str(uuid.uuid4())  # Generate a unique ID for the store item
+def get_store_items_by_ids(item_ids: list[str]) -> dict[str, models.StoreItem]:
+    """Look up many store items with BatchGetItem, keyed by item id."""
+    if not item_ids:
+        return {}
+    try:
+        items = batch_get(STORE_ITEMS_TABLE_NAME, [{"id": item_id} for item_id in item_ids])
+        return {item["id"]: _store_item_from_item(item) for item in items}
+    except ClientError as e:
+        logger.exception("Error batch getting store items %s: %s", item_ids, e)
+        return {}
+
+
+def create_store_item(item_in: models.StoreItemCreate, item_id: Optional[str] = None) -> models.StoreItem:
+    """Create a store item. Callers may pass a deterministic item_id; creating it again is then a no-op."""
+    item_id = item_id or str(uuid.uuid4())  # Generate a unique ID for the store item
     item_data = {
         "id": item_id,
         "name": item_in.name,
@@ -267,11 +839,14 @@ def create_store_item(item_in: models.StoreItemCreate) -> models.StoreItem:
     item_item = {k: v for k, v in item_data.items() if v is not None}
 
     try:
-        store_items_table.put_item(Item=item_item)
-        return models.StoreItem(**item_data)  # Construct from item_data
+        store_items_table.put_item(Item=item_item, ConditionExpression="attribute_not_exists(id)")
     except ClientError as e:
-        print(f"Error creating store item {item_in.name}: {e}")
-        raise HTTPException(status_code=500, detail="Could not create store item in database.") from e
+        if e.response["Error"]["Code"] != "ConditionalCheckFailedException":  # Else already created under item_id
+            logger.exception("Error creating store item %s: %s", item_in.name, e)
+            raise HTTPException(status_code=500, detail="Could not create store item in database.") from e
+    finally:
+        clear_store_items_cache()  # After the write, so a listing racing it can't re-cache the old catalog
+    return models.StoreItem(**item_data)  # Construct from item_data
 
 
 def update_store_item(item_id: str, item_in: models.StoreItemCreate) -> Optional[models.StoreItem]:
@@ -279,6 +854,7 @@ def update_store_item(item_id: str, item_in: models.StoreItemCreate) -> Optional
         response = store_items_table.update_item(
             Key={"id": item_id},
             UpdateExpression="SET #n = :n, description = :d, points_cost = :pc",
+            ConditionExpression="attribute_exists(id)",  # Update only; a missing item is a 404, not an upsert
             ExpressionAttributeNames={"#n": "name"},  # 'name' is a reserved keyword
             ExpressionAttributeValues={
                 ":n": item_in.name,
@@ -292,14 +868,16 @@ def update_store_item(item_id: str, item_in: models.StoreItemCreate) -> Optional
             # Ensure description is handled correctly if it's None from DB
             if "description" not in updated_attributes or updated_attributes["description"] is None:
                 updated_attributes["description"] = None  # Pydantic expects None, not missing
-            return models.StoreItem(**replace_decimals(updated_attributes))
+            return _store_item_from_item(updated_attributes)
         return None  # Item not found or update failed silently (should be caught by ClientError)
     except ClientError as e:
         if e.response["Error"]["Code"] == "ConditionalCheckFailedException":  # Or if item doesn't exist
-            print(f"Store item {item_id} not found for update.")  # Item not found
+            logger.info("Store item %s not found for update.", item_id)  # Item not found
             return None
-        print(f"Error updating store item {item_id}: {e}")
+        logger.exception("Error updating store item %s: %s", item_id, e)
         return None
+    finally:
+        clear_store_items_cache()
 
 
 def delete_store_item(item_id: str) -> bool:
@@ -309,8 +887,10 @@ def delete_store_item(item_id: str) -> bool:
         store_items_table.delete_item(Key={"id": item_id})
         return True  # Assume success if no error, or add a get_item check
     except ClientError as e:
-        print(f"Error deleting store item {item_id}: {e}")
+        logger.exception("Error deleting store item %s: %s", item_id, e)
         return False
+    finally:
+        clear_store_items_cache()
 
 
 # --- Import HTTPException for create_user and create_store_item ---
@@ -331,6 +911,7 @@ def create_purchase_log(log_in: models.PurchaseLogCreate) -> models.PurchaseLog:
         "points_spent": Decimal(log_in.points_spent),  # Store as Decimal
         "timestamp": log_in.timestamp.isoformat(),  # Store ISO format string
         "status": log_in.status.value,
+        "gsi_pk": PURCHASE_LOGS_ALL_PARTITION,  # Partition key for AllLogsByTimestamp
     }
     try:
         purchase_logs_table.put_item(Item=log_data)
@@ -346,7 +927,7 @@ def create_purchase_log(log_in: models.PurchaseLogCreate) -> models.PurchaseLog:
             status=log_in.status,
         )
     except ClientError as e:
-        print(f"Error creating purchase log for user {log_in.username}, item {log_in.item_name}: {e}")
+        logger.exception("Error creating purchase log for user %s, item %s: %s", log_in.username, log_in.item_name, e)
         raise HTTPException(status_code=500, detail="Could not create purchase log in database.") from e
 
 
@@ -358,43 +939,75 @@ def get_purchase_logs_by_user_id(user_id: str) -> List[models.PurchaseLog]:  # n
         # If you don't have a GSI, you might need to use a scan or reconsider the query.
         # A more common pattern might be to query by username if that's indexed.
         # Let's use a GSI named 'UserIdTimestampIndex' with user_id as HASH and timestamp as RANGE for sorting.
-        response = purchase_logs_table.query(
+        items = iter_query(
+            purchase_logs_table,
             IndexName="UserIdTimestampIndex",  # Assuming this GSI exists
-            KeyConditionExpression=Key("user_id").eq(user_id),
+            KeyConditionExpression=_K_USER_ID.eq(user_id),
             ScanIndexForward=False,  # Sort by timestamp descending (newest first)
+            **_model_projection(models.PurchaseLog),
         )
-        items = response.get("Items", [])
-        return [models.PurchaseLog(**replace_decimals(item)) for item in items]
+        return list(map(_purchase_log_from_item, items))
     except ClientError as e:
         # Handle case where GSI might not exist or other errors
-        if e.response["Error"]["Code"] == "ResourceNotFoundException":
-            print("Warning: GSI 'UserIdTimestampIndex' not found for purchase_logs_table. Falling back to scan.")
+        if _index_missing(e):
+            logger.warning("GSI 'UserIdTimestampIndex' not found for purchase_logs_table. Falling back to scan.")
             # Fallback to scan if GSI doesn't exist (less efficient)
             return get_all_purchase_logs(filter_user_id=user_id)
-        print(f"Error getting purchase logs for user_id {user_id}: {e}")
+        logger.exception("Error getting purchase logs for user_id %s: %s", user_id, e)
         return []
 
 
-def get_all_purchase_logs(filter_user_id: Optional[str] = None) -> List[models.PurchaseLog]:  # noqa: UP006
-    try:
-        scan_kwargs = {}
-        if filter_user_id:
-            scan_kwargs["FilterExpression"] = Key("user_id").eq(filter_user_id)
+# Every purchase log carries the same gsi_pk so AllLogsByTimestamp can return them all newest-first
+PURCHASE_LOGS_ALL_PARTITION = "ALL"
+
 
-        response = purchase_logs_table.scan(**scan_kwargs)
-        items = response.get("Items", [])
-        while "LastEvaluatedKey" in response:
-            scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
-            response = purchase_logs_table.scan(**scan_kwargs)
-            items.extend(response.get("Items", []))
+def get_all_purchase_logs(
+    filter_user_id: Optional[str] = None,
+    filter_status: Optional[models.PurchaseStatus] = None,
+    limit: Optional[int] = None,
+) -> List[models.PurchaseLog]:  # noqa: UP006
+    """
+    Purchase logs newest first, optionally filtered by user and status.
+
+    With limit, only the newest limit logs are returned, and the index is read in pages of that size,
+    stopping once enough have matched. Without it every log is returned.
+    """
+    filter_expression = None
+    if filter_user_id:
+        filter_expression = _K_USER_ID.eq(filter_user_id)
+    if filter_status:
+        status_filter = _A_STATUS.eq(filter_status.value)
+        filter_expression = filter_expression & status_filter if filter_expression is not None else status_filter
+    filter_kwargs = {"FilterExpression": filter_expression} if filter_expression is not None else {}
+
+    try:
+        # The index's timestamp range key returns the logs already sorted newest first
+        items = iter_query(
+            purchase_logs_table,
+            IndexName="AllLogsByTimestamp",
+            KeyConditionExpression=_K_GSI_PK.eq(PURCHASE_LOGS_ALL_PARTITION),
+            ScanIndexForward=False,
+            **({"Limit": limit} if limit else {}),  # Page size; filters apply after it, so keep paging
+            **filter_kwargs,
+            **_model_projection(models.PurchaseLog),
+        )
+        return list(map(_purchase_log_from_item, islice(items, limit)))
+    except ClientError as e:
+        if not _index_missing(e):
+            logger.exception("Error querying all purchase logs: %s", e)
+            return []
+        logger.warning("GSI 'AllLogsByTimestamp' not found. Falling back to scan.")
+
+    try:
+        items = parallel_scan(purchase_logs_table, **filter_kwargs, **_model_projection(models.PurchaseLog))
 
         # Sort by timestamp client-side if not using a query with sort key
         # DynamoDB scan doesn't guarantee order unless you sort after fetching
-        parsed_items = [models.PurchaseLog(**replace_decimals(item)) for item in items]
+        parsed_items = list(map(_purchase_log_from_item, items))
         parsed_items.sort(key=lambda x: x.timestamp, reverse=True)  # Sort newest first
-        return parsed_items
+        return parsed_items[:limit]
     except ClientError as e:
-        print(f"Error scanning all purchase logs: {e}")
+        logger.exception("Error scanning all purchase logs: %s", e)
         return []
 
 
@@ -402,65 +1015,146 @@ def get_purchase_logs_by_status(status: models.PurchaseStatus) -> List[models.Pu
     try:
         # This query assumes 'status' is a Global Secondary Index (GSI) on the purchase_logs_table
         # For example, a GSI named 'StatusTimestampIndex' with 'status' as HASH and 'timestamp' as RANGE.
-        response = purchase_logs_table.query(
+        items = iter_query(
+            purchase_logs_table,
             IndexName="StatusTimestampIndex",  # Assuming this GSI exists
-            KeyConditionExpression=Key("status").eq(status.value),
+            KeyConditionExpression=_K_STATUS.eq(status.value),
             ScanIndexForward=False,  # Sort by timestamp descending (newest first)
+            **_model_projection(models.PurchaseLog),
         )
-        items = response.get("Items", [])
-        return [models.PurchaseLog(**replace_decimals(item)) for item in items]
+        return list(map(_purchase_log_from_item, items))
     except ClientError as e:
-        if e.response["Error"]["Code"] == "ResourceNotFoundException":
-            print(f"Warning: GSI 'StatusTimestampIndex' not found. Falling back to scan for status '{status.value}'.")
-            # Fallback to scan if GSI doesn't exist (less efficient)
-            all_logs = get_all_purchase_logs()
-            return sorted([log for log in all_logs if log.status == status], key=lambda x: x.timestamp, reverse=True)
-        print(f"Error getting purchase logs by status {status.value}: {e}")
+        if _index_missing(e):
+            logger.warning("GSI 'StatusTimestampIndex' not found. Falling back to scan for status '%s'.", status.value)
+            # Fallback to scan if GSI doesn't exist (less efficient), filtering server-side
+            return get_all_purchase_logs(filter_status=status)
+        logger.exception("Error getting purchase logs by status %s: %s", status.value, e)
         return []
 
 
-def update_purchase_log_status(log_id: str, new_status: models.PurchaseStatus) -> Optional[models.PurchaseLog]:
+def update_purchase_log_status(
+    log_id: str, new_status: models.PurchaseStatus, expected_status: Optional[models.PurchaseStatus] = None
+) -> Optional[models.PurchaseLog]:
+    """Set a purchase log's status; with expected_status, raises 400 if the log has moved on since it was read."""
+    update_args = {
+        "Key": {"id": log_id},
+        "UpdateExpression": "SET #s = :s",
+        "ExpressionAttributeNames": {"#s": "status"},
+        "ExpressionAttributeValues": {":s": new_status.value},
+        "ReturnValues": "ALL_NEW",
+    }
+    if expected_status is not None:
+        update_args["ConditionExpression"] = "#s = :expected"
+        update_args["ExpressionAttributeValues"][":expected"] = expected_status.value
     try:
-        response = purchase_logs_table.update_item(
-            Key={"id": log_id},
-            UpdateExpression="SET #s = :s",
-            ExpressionAttributeNames={"#s": "status"},
-            ExpressionAttributeValues={":s": new_status.value},
-            ReturnValues="ALL_NEW",
-        )
+        response = purchase_logs_table.update_item(**update_args)
         updated_attributes = response.get("Attributes")
         if updated_attributes:
-            return models.PurchaseLog(**replace_decimals(updated_attributes))
+            return _purchase_log_from_item(updated_attributes)
         return None  # Log not found or update failed
     except ClientError as e:
-        print(f"Error updating status for purchase log {log_id}: {e}")
+        if expected_status is not None and e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+            raise HTTPException(status_code=400, detail=f"Purchase request is not {expected_status.value}.") from e
+        logger.exception("Error updating status for purchase log %s: %s", log_id, e)
         return None
 
 
+# --- Transactional point changes ---
+def _kid_points_update(kid_username: str, points_to_add: int, require_balance: bool = False) -> dict:
+    """TransactWriteItems Update that adds points to a kid, with the same condition as update_user_points."""
+    condition = "attribute_exists(username) AND #r = :kid"
+    values = {":p": Decimal(points_to_add), ":kid": models.UserRole.KID.value}
+    if require_balance:  # Never let a deduction take the kid below zero
+        condition += " AND points >= :cost"
+        values[":cost"] = Decimal(-points_to_add)
+    return {
+        "Update": {
+            "TableName": USERS_TABLE_NAME,
+            "Key": {"username": kid_username},
+            "UpdateExpression": "ADD points :p",
+            "ConditionExpression": condition,
+            "ExpressionAttributeNames": {"#r": "role"},
+            "ExpressionAttributeValues": values,
+        }
+    }
+
+
+def _write_with_points(
+    log_item: dict, kid_username: str, points_to_add: int, require_balance: bool = False
+) -> Optional[list[str]]:
+    """Apply a log write and a kid's points change in one TransactWriteItems call.
+
+    Returns None on success, or the cancellation codes (log write first, points second) when the
+    transaction was cancelled. Any other ClientError is raised.
+    """
+    try:
+        dynamodb.meta.client.transact_write_items(
+            TransactItems=[log_item, _kid_points_update(kid_username, points_to_add, require_balance)]
+        )
+    except ClientError as e:
+        if e.response["Error"]["Code"] != "TransactionCanceledException":
+            raise
+        return [reason.get("Code", "None") for reason in e.response.get("CancellationReasons", [])]
+    _forget_users(kid_username)  # The cached user's points are stale now
+    return None
+
+
+def approve_purchase(log: models.PurchaseLog) -> Optional[models.PurchaseLog]:
+    """Deduct the purchase's points from the kid and mark the log approved atomically.
+
+    Returns None if the kid no longer has enough points; raises 400 if the log is no longer pending.
+    """
+    log_update = {
+        "Update": {
+            "TableName": PURCHASE_LOGS_TABLE_NAME,
+            "Key": {"id": log.id},
+            "UpdateExpression": "SET #s = :approved",
+            "ConditionExpression": "#s = :pending",
+            "ExpressionAttributeNames": {"#s": "status"},
+            "ExpressionAttributeValues": {
+                ":approved": models.PurchaseStatus.APPROVED.value,
+                ":pending": models.PurchaseStatus.PENDING.value,
+            },
+        }
+    }
+    try:
+        failed = _write_with_points(log_update, log.username, -log.points_spent, require_balance=True)
+    except ClientError as e:
+        logger.exception("Error approving purchase log %s: %s", log.id, e)
+        raise HTTPException(status_code=500, detail="Failed to approve purchase request.") from e
+
+    if failed:
+        if failed[0] == "ConditionalCheckFailed":
+            raise HTTPException(status_code=400, detail="Purchase request is not pending.")
+        if len(failed) > 1 and failed[1] == "ConditionalCheckFailed":
+            return None
+        raise HTTPException(status_code=500, detail="Failed to approve purchase request.")
+    return log.model_copy(update={"status": models.PurchaseStatus.APPROVED})
+
+
 def get_purchase_log_by_id(log_id: str) -> Optional[models.PurchaseLog]:
     try:
-        response = purchase_logs_table.get_item(Key={"id": log_id})
+        response = purchase_logs_table.get_item(Key={"id": log_id}, **_model_projection(models.PurchaseLog))
         item = response.get("Item")
         if item:
-            # Ensure timestamp is parsed correctly if stored as string
-            if isinstance(item.get("timestamp"), str):
-                item["timestamp"] = datetime.fromisoformat(item["timestamp"])
-            return models.PurchaseLog(**replace_decimals(item))
+            # Pydantic parses the stored ISO timestamp string directly, no pre-parse needed
+            return _purchase_log_from_item(item)
         return None
     except ClientError as e:
-        print(f"Error getting purchase log {log_id}: {e}")
+        logger.exception("Error getting purchase log %s: %s", log_id, e)
         return None
-    except Exception as e:  # Catch potential isoformat or Pydantic errors
-        print(f"Error parsing purchase log {log_id} (possibly timestamp or model validation): {e}")
+    except Exception as e:  # Catch potential Pydantic errors, e.g. a malformed timestamp
+        logger.exception("Error parsing purchase log %s (possibly timestamp or model validation): %s", log_id, e)
         return None
 
 
 # --- Chore CRUD ---
 
 
-def create_chore(chore_in: models.ChoreCreate, parent_id: str) -> models.Chore:
-    chore_id = str(uuid.uuid4())
-    timestamp = datetime.utcnow()
+def create_chore(chore_in: models.ChoreCreate, parent_id: str, chore_id: Optional[str] = None) -> models.Chore:
+    """Create a chore. Callers may pass a deterministic chore_id; creating it again is then a no-op."""
+    chore_id = chore_id or str(uuid.uuid4())
+    timestamp = _utcnow()
     chore_data = {
         "id": chore_id,
         "name": chore_in.name,
@@ -469,59 +1163,129 @@ def create_chore(chore_in: models.ChoreCreate, parent_id: str) -> models.Chore:
         "created_by_parent_id": parent_id,
         "created_at": timestamp.isoformat(),
         "updated_at": timestamp.isoformat(),
-        "is_active": "true",  # Store as string "true"
+        "is_active": True,
+        "is_active_pk": ACTIVE_CHORES_PARTITION,  # Puts the chore in the sparse ActiveChoresIndex
     }
     # Remove None values for DynamoDB. If description is None, it will be omitted.
     chore_item = {k: v for k, v in chore_data.items() if v is not None}
 
     try:
-        chores_table.put_item(Item=chore_item)
-        # Construct model for response
-        return models.Chore(
-            id=chore_id,
-            name=chore_in.name,
-            description=chore_in.description,
-            points_value=chore_in.points_value,
-            created_by_parent_id=parent_id,
-            created_at=timestamp,
-            updated_at=timestamp,
-            is_active=True,
-        )
-    except ClientError as e:
-        print(f"Error creating chore {chore_in.name}: {e}")
-        raise HTTPException(status_code=500, detail="Could not create chore in database.") from e
+        chores_table.put_item(Item=chore_item, ConditionExpression="attribute_not_exists(id)")
+    except ClientError as e:
+        if e.response["Error"]["Code"] != "ConditionalCheckFailedException":  # Else already created under chore_id
+            logger.exception("Error creating chore %s: %s", chore_in.name, e)
+            raise HTTPException(status_code=500, detail="Could not create chore in database.") from e
+    invalidate_chore(chore_id)  # The new chore belongs in the active listing
+    # Construct model for response
+    return models.Chore(
+        id=chore_id,
+        name=chore_in.name,
+        description=chore_in.description,
+        points_value=chore_in.points_value,
+        created_by_parent_id=parent_id,
+        created_at=timestamp,
+        updated_at=timestamp,
+        is_active=True,
+    )
 
 
 def get_chore_by_id(chore_id: str) -> Optional[models.Chore]:
+    cached = _cached_chore(chore_id)
+    if cached is not None:
+        return cached
     try:
-        response = chores_table.get_item(Key={"id": chore_id})
+        response = chores_table.get_item(Key={"id": chore_id}, **_model_projection(models.Chore))
         item = response.get("Item")
         if item:
-            return models.Chore(**replace_decimals(item))
+            chore = _chore_from_item(item)
+            _cache_chores(chore)
+            return chore
         return None
     except ClientError as e:
-        print(f"Error getting chore {chore_id}: {e}")
+        logger.exception("Error getting chore %s: %s", chore_id, e)
         return None
 
 
-def get_all_active_chores() -> List[models.Chore]:  # noqa: UP006
+def get_chores_by_ids(chore_ids: list[str]) -> dict[str, models.Chore]:
+    """Look up many chores with BatchGetItem, keyed by chore id."""
+    if not chore_ids:
+        return {}
     try:
-        # This requires a GSI on 'is_active' or a filter expression.
-        # For simplicity, scanning and filtering. For production, a GSI is better.
-        # GSI: IndexName='ActiveChoresIndex', KeySchema=[{AttributeName: 'is_active', KeyType: 'HASH'}]
-        # ProjectionType='ALL'. Query where is_active = True.
-        # For now, using a FilterExpression.
-        response = chores_table.scan(FilterExpression=boto3.dynamodb.conditions.Attr("is_active").eq("true"))
-        items = response.get("Items", [])
-        while "LastEvaluatedKey" in response:
-            response = chores_table.scan(
-                FilterExpression=boto3.dynamodb.conditions.Attr("is_active").eq("true"),
-                ExclusiveStartKey=response["LastEvaluatedKey"],
-            )
-            items.extend(response.get("Items", []))
-        return [models.Chore(**replace_decimals(item)) for item in items]
-    except ClientError as e:
-        print(f"Error scanning active chores: {e}")
+        chores = {}
+        missing_ids = []
+        for chore_id in chore_ids:
+            cached = _cached_chore(chore_id)
+            if cached is not None:
+                chores[chore_id] = cached
+            else:
+                missing_ids.append(chore_id)
+        if missing_ids:
+            items = batch_get(CHORES_TABLE_NAME, [{"id": chore_id} for chore_id in missing_ids])
+            fetched = list(map(_chore_from_item, items))
+            _cache_chores(*fetched)
+            chores.update((chore.id, chore) for chore in fetched)
+        return chores
+    except ClientError as e:
+        logger.exception("Error batch getting chores %s: %s", chore_ids, e)
+        return {}
+
+
+def get_chore_parent_ids(chore_ids: list[str]) -> dict[str, str]:
+    """Map chore ids to the id of the parent who created them, fetching only those two attributes."""
+    parent_ids = {}
+    missing_ids = []
+    for chore_id in chore_ids:
+        cached = _cached_chore(chore_id)
+        if cached is not None:
+            parent_ids[chore_id] = cached.created_by_parent_id
+        else:
+            missing_ids.append(chore_id)
+    if missing_ids:
+        items = batch_get(CHORES_TABLE_NAME, [{"id": chore_id} for chore_id in missing_ids], "id, created_by_parent_id")
+        parent_ids.update((item["id"], item["created_by_parent_id"]) for item in items)
+    return parent_ids
+
+
+def _logs_for_parent_chores(logs: list[models.ChoreLog], parent_id: str) -> list[models.ChoreLog]:
+    """Keep the chore logs whose chore was created by parent_id, with one batched chore lookup."""
+    chore_parent_ids = get_chore_parent_ids([log.chore_id for log in logs if log.created_by_parent_id is None])
+    return [log for log in logs if (log.created_by_parent_id or chore_parent_ids.get(log.chore_id)) == parent_id]
+
+
+def get_all_active_chores() -> List[models.Chore]:  # noqa: UP006
+    cached = _cached_active_chores()
+    if cached is not None:
+        return cached
+    chores = _query_active_chores()
+    _cache_active_chores(chores)
+    return chores
+
+
+def _query_active_chores() -> List[models.Chore]:  # noqa: UP006
+    try:
+        # Query the sparse ActiveChoresIndex so only active chores are read,
+        # instead of scanning every chore and filtering.
+        items = iter_query(
+            chores_table,
+            IndexName="ActiveChoresIndex",
+            KeyConditionExpression=_ACTIVE_CHORES_PARTITION,
+            **_model_projection(models.Chore),
+        )
+        return list(map(_chore_from_item, items))
+    except ClientError as e:
+        if _index_missing(e):
+            logger.warning("GSI 'ActiveChoresIndex' not found. Falling back to scan.")
+            try:
+                items = parallel_scan(
+                    chores_table,
+                    FilterExpression=_A_CHORE_IS_ACTIVE,
+                    **_model_projection(models.Chore),
+                )
+                return list(map(_chore_from_item, items))
+            except ClientError as scan_error:
+                logger.exception("Error scanning active chores: %s", scan_error)
+                return []
+        logger.exception("Error querying active chores: %s", e)
         return []
 
 
@@ -530,42 +1294,43 @@ def get_chores_by_parent(parent_id: str) -> List[models.Chore]:  # noqa: UP006
         # Requires a GSI on 'created_by_parent_id'.
         # GSI: IndexName='ParentChoresIndex', KeySchema=[{AttributeName: 'created_by_parent_id', KeyType: 'HASH'}]
         # ProjectionType='ALL'.
-        response = chores_table.query(
+        items = iter_query(
+            chores_table,
             IndexName="ParentChoresIndex",  # Assumed GSI
-            KeyConditionExpression=Key("created_by_parent_id").eq(parent_id),
+            KeyConditionExpression=_K_CREATED_BY_PARENT_ID.eq(parent_id),
+            **_model_projection(models.Chore),
         )
-        items = response.get("Items", [])
-        return [models.Chore(**replace_decimals(item)) for item in items]
+        return list(map(_chore_from_item, items))
     except ClientError as e:
-        if e.response["Error"]["Code"] == "ResourceNotFoundException":
-            print("Warning: GSI 'ParentChoresIndex' not found for chores_table. Falling back to scan.")
-            all_chores = get_all_chores_scan_fallback()  # Implement a full scan if GSI fails
-            return [c for c in all_chores if c.created_by_parent_id == parent_id]
-        print(f"Error getting chores for parent {parent_id}: {e}")
+        if _index_missing(e):
+            logger.warning("GSI 'ParentChoresIndex' not found for chores_table. Falling back to scan.")
+            return get_all_chores_scan_fallback(_A_CREATED_BY_PARENT_ID.eq(parent_id))
+        logger.exception("Error getting chores for parent %s: %s", parent_id, e)
         return []
 
 
-def get_all_chores_scan_fallback() -> List[models.Chore]:  # noqa: UP006
+def get_all_chores_scan_fallback(filter_expression=None) -> List[models.Chore]:  # noqa: UP006
+    """Scan chores, optionally filtered server-side, fetching only Chore's attributes."""
     try:
-        response = chores_table.scan()
-        items = response.get("Items", [])
-        while "LastEvaluatedKey" in response:
-            response = chores_table.scan(ExclusiveStartKey=response["LastEvaluatedKey"])
-            items.extend(response.get("Items", []))
-        return [models.Chore(**replace_decimals(item)) for item in items]
+        filter_kwargs = {"FilterExpression": filter_expression} if filter_expression is not None else {}
+        items = parallel_scan(chores_table, **filter_kwargs, **_model_projection(models.Chore))
+        return list(map(_chore_from_item, items))
     except ClientError as e:
-        print(f"Error scanning all chores (fallback): {e}")
+        logger.exception("Error scanning all chores (fallback): %s", e)
         return []
 
 
-def update_chore(chore_id: str, chore_in: models.ChoreCreate, current_parent_id: str) -> Optional[models.Chore]:
-    existing_chore = get_chore_by_id(chore_id)
-    if not existing_chore:
-        return None  # Chore not found
-    if existing_chore.created_by_parent_id != current_parent_id:
-        raise HTTPException(status_code=403, detail="Not authorized to update this chore.")
+# Ownership is enforced by the write's ConditionExpression rather than a pre-read. On failure,
+# DynamoDB returns the existing item (if any) so a missing chore can be told apart from another parent's.
+_OWNED_CHORE_CONDITION = "attribute_exists(id) AND created_by_parent_id = :cpid"
+
+
+def _chore_exists_on_condition_failure(e: ClientError) -> bool:
+    return "Item" in e.response
+
 
-    timestamp = datetime.utcnow().isoformat()
+def update_chore(chore_id: str, chore_in: models.ChoreCreate, current_parent_id: str) -> Optional[models.Chore]:
+    timestamp = _iso_now()
     try:
         response = chores_table.update_item(
             Key={"id": chore_id},
@@ -578,81 +1343,117 @@ def update_chore(chore_id: str, chore_in: models.ChoreCreate, current_parent_id:
                 ":ua": timestamp,
                 ":cpid": current_parent_id,  # Merged :cpid here
             },
-            ConditionExpression="created_by_parent_id = :cpid",  # Ensure parent owns it
+            ConditionExpression=_OWNED_CHORE_CONDITION,  # Ensure the chore exists and parent owns it
             ReturnValues="ALL_NEW",
+            ReturnValuesOnConditionCheckFailure="ALL_OLD",
         )
         updated_attributes = response.get("Attributes")
         if updated_attributes:
-            return models.Chore(**replace_decimals(updated_attributes))
+            return _chore_from_item(updated_attributes)
         return None
     except ClientError as e:
         if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
-            raise HTTPException(
-                status_code=403, detail="Conditional check failed. Not authorized or chore changed."
-            ) from e
-        print(f"Error updating chore {chore_id}: {e}")
+            if not _chore_exists_on_condition_failure(e):
+                return None  # Chore not found
+            raise HTTPException(status_code=403, detail="Not authorized to update this chore.") from e
+        logger.exception("Error updating chore %s: %s", chore_id, e)
         return None
+    finally:
+        invalidate_chore(chore_id)  # After the write, so a read racing it can't re-cache the old row
 
 
 def deactivate_chore(chore_id: str, current_parent_id: str) -> Optional[models.Chore]:
-    existing_chore = get_chore_by_id(chore_id)
-    if not existing_chore:
-        return None
-    if existing_chore.created_by_parent_id != current_parent_id:
-        raise HTTPException(status_code=403, detail="Not authorized to deactivate this chore.")
-
-    timestamp = datetime.utcnow().isoformat()
+    timestamp = _iso_now()
     try:
         response = chores_table.update_item(
             Key={"id": chore_id},
-            UpdateExpression="SET is_active = :ia, updated_at = :ua",
+            UpdateExpression="SET is_active = :ia, updated_at = :ua REMOVE is_active_pk",  # Leave ActiveChoresIndex
             ExpressionAttributeValues={
-                ":ia": "false",  # Store as string "false"
+                ":ia": False,
                 ":ua": timestamp,
                 ":cpid": current_parent_id,  # For condition
             },
-            ConditionExpression="created_by_parent_id = :cpid",
+            ConditionExpression=_OWNED_CHORE_CONDITION,
             ReturnValues="ALL_NEW",
+            ReturnValuesOnConditionCheckFailure="ALL_OLD",
         )
         updated_attributes = response.get("Attributes")
         if updated_attributes:
-            return models.Chore(**replace_decimals(updated_attributes))
+            return _chore_from_item(updated_attributes)
         return None
     except ClientError as e:
         if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
-            raise HTTPException(
-                status_code=403, detail="Conditional check failed. Not authorized or chore changed."
-            ) from e
-        print(f"Error deactivating chore {chore_id}: {e}")
+            if not _chore_exists_on_condition_failure(e):
+                return None
+            raise HTTPException(status_code=403, detail="Not authorized to deactivate this chore.") from e
+        logger.exception("Error deactivating chore %s: %s", chore_id, e)
         return None
+    finally:
+        invalidate_chore(chore_id)
 
 
 def delete_chore(chore_id: str, current_parent_id: str) -> bool:
     # Consider implications: what if chore logs exist?
     # For now, direct delete if parent matches.
-    existing_chore = get_chore_by_id(chore_id)
-    if not existing_chore:
-        return False  # Chore not found
-    if existing_chore.created_by_parent_id != current_parent_id:
-        raise HTTPException(status_code=403, detail="Not authorized to delete this chore.")
-
     try:
         chores_table.delete_item(
             Key={"id": chore_id},
-            ConditionExpression="created_by_parent_id = :cpid",
+            ConditionExpression=_OWNED_CHORE_CONDITION,
             ExpressionAttributeValues={":cpid": current_parent_id},
+            ReturnValuesOnConditionCheckFailure="ALL_OLD",
         )
         return True
     except ClientError as e:
         if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
-            raise HTTPException(
-                status_code=403, detail="Conditional check failed. Not authorized or chore changed."
-            ) from e
-        print(f"Error deleting chore {chore_id}: {e}")
+            if not _chore_exists_on_condition_failure(e):
+                return False  # Chore not found
+            raise HTTPException(status_code=403, detail="Not authorized to delete this chore.") from e
+        logger.exception("Error deleting chore %s: %s", chore_id, e)
         return False
+    finally:
+        invalidate_chore(chore_id)
 
 
 # --- Chore Log CRUD ---
+# Each log carries its chore's created_by_parent_id plus a "<status>#<submitted_at>" sort key, so
+# ParentStatusIndex can answer "this parent's logs in this status, newest first" with one query.
+
+
+def _chore_log_status_sort_key(status: models.ChoreStatus, submitted_at: datetime) -> str:
+    return f"{status.value}#{submitted_at.isoformat()}"
+
+
+_RETRY_CHORE_STATUSES = (models.ChoreStatus.REJECTED, models.ChoreStatus.PENDING_APPROVAL)
+
+
+def _count_retry_submissions(kid_id: str, chore_id: str, since: datetime) -> int:
+    """
+    Count the kid's rejected or pending submissions of chore_id made after since.
+
+    KidChoreLogIndex is ranged on submitted_at, so only the window is read and only a count comes back.
+    """
+    query_kwargs = {
+        "IndexName": "KidChoreLogIndex",
+        "KeyConditionExpression": _K_KID_ID.eq(kid_id) & _K_SUBMITTED_AT.gt(since.isoformat()),
+        "FilterExpression": _A_CHORE_ID.eq(chore_id) & _A_STATUS.is_in([s.value for s in _RETRY_CHORE_STATUSES]),
+        "Select": "COUNT",
+    }
+    try:
+        count = 0
+        while True:
+            response = chore_logs_table.query(**query_kwargs)
+            count += response.get("Count", 0)
+            if "LastEvaluatedKey" not in response:
+                return count
+            query_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+    except ClientError as e:
+        if not _index_missing(e):
+            raise
+        return sum(
+            1
+            for log in get_chore_logs_by_kid_id(kid_id)
+            if log.chore_id == chore_id and log.submitted_at > since and log.status in _RETRY_CHORE_STATUSES
+        )
 
 
 def create_chore_log_submission(
@@ -665,23 +1466,13 @@ def create_chore_log_submission(
         raise HTTPException(status_code=403, detail="Only kids can submit chores.")
 
     log_id = str(uuid.uuid4())
-    timestamp = datetime.utcnow()
+    timestamp = _utcnow()
 
     # Check for retry attempts (same chore by same kid within 24 hours)
-    is_retry = False
-    retry_count = 0
     twenty_four_hours_ago = timestamp - timedelta(hours=24)
 
-    # Get recent chore logs for this kid and chore
-    recent_logs = get_chore_logs_by_kid_id(kid_user.id)
-    for log in recent_logs:
-        if (
-            log.chore_id == chore_id
-            and log.submitted_at > twenty_four_hours_ago
-            and log.status in [models.ChoreStatus.REJECTED, models.ChoreStatus.PENDING_APPROVAL]
-        ):
-            is_retry = True
-            retry_count += 1
+    retry_count = _count_retry_submissions(kid_user.id, chore_id, twenty_four_hours_ago)
+    is_retry = retry_count > 0
 
     # Calculate effort points (0.5 points per minute, max 10 points)
     effort_points = min(int((effort_minutes or 0) * 0.5), 10) if effort_minutes else 0
@@ -689,20 +1480,26 @@ def create_chore_log_submission(
     # Log effort metrics
     if effort_minutes and effort_minutes > 0:
         logger.info(
-            f"Effort tracking - Kid: {kid_user.username}, Chore: {chore.name}, "
-            f"Minutes: {effort_minutes}, Points: {effort_points}, "
-            f"Is Retry: {is_retry}, Retry Count: {retry_count}"
+            "Effort tracking - Kid: %s, Chore: %s, Minutes: %s, Points: %s, Is Retry: %s, Retry Count: %s",
+            kid_user.username,
+            chore.name,
+            effort_minutes,
+            effort_points,
+            is_retry,
+            retry_count,
         )
 
     log_data = {
         "id": log_id,
         "chore_id": chore.id,
         "chore_name": chore.name,
+        "created_by_parent_id": chore.created_by_parent_id,
         "kid_id": kid_user.id,  # kid_user.id is username
         "kid_username": kid_user.username,
         "points_value": Decimal(chore.points_value),
         "status": models.ChoreStatus.PENDING_APPROVAL.value,
         "submitted_at": timestamp.isoformat(),
+        "status_submitted_at": _chore_log_status_sort_key(models.ChoreStatus.PENDING_APPROVAL, timestamp),
         "reviewed_by_parent_id": None,
         "reviewed_at": None,
         "effort_minutes": effort_minutes or 0,
@@ -716,6 +1513,7 @@ def create_chore_log_submission(
             id=log_id,
             chore_id=chore.id,
             chore_name=chore.name,
+            created_by_parent_id=chore.created_by_parent_id,
             kid_id=kid_user.id,
             kid_username=kid_user.username,
             points_value=chore.points_value,  # int for model
@@ -729,23 +1527,23 @@ def create_chore_log_submission(
             is_retry=is_retry,
         )
     except ClientError as e:
-        print(f"Error creating chore log for kid {kid_user.username}, chore {chore.name}: {e}")
+        logger.exception("Error creating chore log for kid %s, chore %s: %s", kid_user.username, chore.name, e)
         raise HTTPException(status_code=500, detail="Could not submit chore.") from e
 
 
 def get_chore_log_by_id(log_id: str) -> Optional[models.ChoreLog]:
     try:
-        response = chore_logs_table.get_item(Key={"id": log_id})
+        response = chore_logs_table.get_item(Key={"id": log_id}, **_model_projection(models.ChoreLog))
         item = response.get("Item")
         if item:
-            return models.ChoreLog(**replace_decimals(item))
+            return _chore_log_from_item(item)
         return None
     except ClientError as e:
-        print(f"Error getting chore log {log_id}: {e}")
+        logger.exception("Error getting chore log %s: %s", log_id, e)
         return None
 
 
-def _validate_chore_log_for_update(chore_log: Optional[models.ChoreLog], parent_user: models.User) -> models.Chore:
+def _validate_chore_log_for_update(chore_log: Optional[models.ChoreLog], parent_user: models.User) -> None:
     """Validate chore log can be updated by the parent user."""
     if not chore_log:
         raise HTTPException(status_code=404, detail="Chore log not found.")
@@ -755,43 +1553,44 @@ def _validate_chore_log_for_update(chore_log: Optional[models.ChoreLog], parent_
             status_code=400, detail=f"Chore log is not pending approval. Current status: {chore_log.status}"
         )
 
-    # Verify the parent reviewing is the one who created the original chore
-    original_chore = get_chore_by_id(chore_log.chore_id)
-    if not original_chore or original_chore.created_by_parent_id != parent_user.id:
+    # Verify the parent reviewing is the one who created the original chore. Logs carry the parent id;
+    # only logs written before it was denormalized need the chore itself.
+    chore_parent_id = chore_log.created_by_parent_id
+    if chore_parent_id is None:
+        original_chore = get_chore_by_id(chore_log.chore_id)
+        chore_parent_id = original_chore.created_by_parent_id if original_chore else None
+    if chore_parent_id != parent_user.id:
         raise HTTPException(
             status_code=403, detail="Not authorized to review this chore log. Chore created by another parent."
         )
 
-    return original_chore
-
 
-def _award_points_and_streak_bonus(kid_username: str, points_value: int) -> None:
-    """Award points to kid and check for streak bonuses."""
-    kid_user_to_update = get_user_by_username(kid_username)
-    if not kid_user_to_update:
-        raise HTTPException(status_code=404, detail=f"Kid user {kid_username} not found for point update.")
-
-    updated_kid = update_user_points(kid_username, points_value)
-    if not updated_kid:
-        raise HTTPException(status_code=500, detail="Failed to award points to the kid.")
-
-    # Check for streak milestone and award bonus points
+def _award_streak_bonus(kid_username: str) -> None:
+    """Check for a streak milestone and award bonus points."""
     streak_data = calculate_streak_for_kid(kid_username)
     if streak_data["streak_active"]:
         bonus_points = award_streak_bonus_points(kid_username, streak_data["current_streak"])
         if bonus_points:
-            logger.info(f"Awarded {bonus_points} streak bonus points to {kid_username}")
+            logger.info("Awarded %s streak bonus points to %s", bonus_points, kid_username)
+
+
+# A review only applies while the log is still pending and still points at the chore whose owner was
+# checked, so a concurrent review (or a changed log) fails the write instead of being overwritten.
+_PENDING_CHORE_LOG_CONDITION = "#s = :pending AND chore_id = :cid"
 
 
 def _build_chore_log_update_expression(
-    new_status: models.ChoreStatus, parent_id: str, reviewed_at: datetime
+    chore_log: models.ChoreLog, new_status: models.ChoreStatus, parent_id: str, reviewed_at: datetime
 ) -> tuple[str, dict, dict]:
-    """Build DynamoDB update expression for chore log status update."""
-    update_expression = "SET #s = :s, reviewed_by_parent_id = :pid, reviewed_at = :rat"
+    """Build DynamoDB update expression for chore log status update, with values for the pending condition."""
+    update_expression = "SET #s = :s, status_submitted_at = :ssa, reviewed_by_parent_id = :pid, reviewed_at = :rat"
     expression_attribute_values = {
         ":s": new_status.value,
+        ":ssa": _chore_log_status_sort_key(new_status, chore_log.submitted_at),
         ":pid": parent_id,
         ":rat": reviewed_at.isoformat(),
+        ":pending": models.ChoreStatus.PENDING_APPROVAL.value,
+        ":cid": chore_log.chore_id,
     }
     expression_attribute_names = {"#s": "status"}
     return update_expression, expression_attribute_values, expression_attribute_names
@@ -807,14 +1606,21 @@ def update_chore_log_status(
     _validate_chore_log_for_update(chore_log, parent_user)
 
     # Build update expression
-    reviewed_at_ts = datetime.utcnow()
+    reviewed_at_ts = _utcnow()
     update_expression, expression_attribute_values, expression_attribute_names = _build_chore_log_update_expression(
-        new_status, parent_user.id, reviewed_at_ts
+        chore_log, new_status, parent_user.id, reviewed_at_ts
     )
 
-    # Award points if approved
+    # Approval updates the log and awards the points in one transaction
     if new_status == models.ChoreStatus.APPROVED:
-        _award_points_and_streak_bonus(chore_log.kid_username, chore_log.points_value)
+        return _approve_chore_log(
+            chore_log,
+            update_expression,
+            expression_attribute_values,
+            expression_attribute_names,
+            parent_user,
+            reviewed_at_ts,
+        )
 
     # Update database
     try:
@@ -823,120 +1629,202 @@ def update_chore_log_status(
             UpdateExpression=update_expression,
             ExpressionAttributeNames=expression_attribute_names,
             ExpressionAttributeValues=expression_attribute_values,
+            ConditionExpression=_PENDING_CHORE_LOG_CONDITION,
             ReturnValues="ALL_NEW",
+            ReturnValuesOnConditionCheckFailure="ALL_OLD",
         )
         updated_attributes = response.get("Attributes")
         if updated_attributes:
-            return models.ChoreLog(**replace_decimals(updated_attributes))
+            return _chore_log_from_item(updated_attributes)
         return None
     except ClientError as e:
-        print(f"Error updating chore log {log_id} status: {e}")
-        # If points were awarded but this failed, there's an inconsistency.
-        # More robust transaction handling might be needed for production (e.g. DynamoDB Transactions).
+        if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+            if "Item" not in e.response:
+                raise HTTPException(status_code=404, detail="Chore log not found.") from e
+            raise HTTPException(status_code=400, detail="Chore log is not pending approval.") from e
+        logger.exception("Error updating chore log %s status: %s", log_id, e)
+        return None
+
+
+def _approve_chore_log(
+    chore_log: models.ChoreLog,
+    update_expression: str,
+    expression_attribute_values: dict,
+    expression_attribute_names: dict,
+    parent_user: models.User,
+    reviewed_at: datetime,
+) -> Optional[models.ChoreLog]:
+    """Mark a chore log approved and award its points atomically, then check for a streak bonus."""
+    log_update = {
+        "Update": {
+            "TableName": CHORE_LOGS_TABLE_NAME,
+            "Key": {"id": chore_log.id},
+            "UpdateExpression": update_expression,
+            "ConditionExpression": _PENDING_CHORE_LOG_CONDITION,  # Two approvals at once can't both award points
+            "ExpressionAttributeNames": expression_attribute_names,
+            "ExpressionAttributeValues": expression_attribute_values,
+        }
+    }
+    try:
+        failed = _write_with_points(log_update, chore_log.kid_username, chore_log.points_value)
+    except ClientError as e:
+        logger.exception("Error approving chore log %s: %s", chore_log.id, e)
         return None
 
+    if failed:
+        if failed[0] == "ConditionalCheckFailed":
+            raise HTTPException(status_code=400, detail="Chore log is not pending approval.")
+        if len(failed) > 1 and failed[1] == "ConditionalCheckFailed":
+            raise HTTPException(
+                status_code=404, detail=f"Kid user {chore_log.kid_username} not found for point update."
+            )
+        raise HTTPException(status_code=500, detail="Failed to award points to the kid.")
+
+    _award_streak_bonus(chore_log.kid_username)
+    return chore_log.model_copy(
+        update={
+            "status": models.ChoreStatus.APPROVED,
+            "reviewed_by_parent_id": parent_user.id,
+            "reviewed_at": reviewed_at,
+        }
+    )
+
 
 def get_chore_logs_by_kid_id(kid_id: str) -> List[models.ChoreLog]:  # noqa: UP006
-    chore_logs = []
+    # The two reads are independent: the approved-assignments query runs on a worker thread
+    # while this thread queries the chore logs, so their round trips overlap.
+    assignment_logs = _scan_executor.submit(_approved_assignment_logs_for_kid, kid_id)
+    chore_logs = _chore_logs_for_kid(kid_id)
+    chore_logs.extend(assignment_logs.result())
+    chore_logs.sort(key=lambda x: x.submitted_at, reverse=True)
+    return chore_logs
+
+
+def _chore_logs_for_kid(kid_id: str) -> List[models.ChoreLog]:  # noqa: UP006
     try:
         # Fetch from chore_logs_table
-        response_logs = chore_logs_table.query(
+        items_logs = iter_query(
+            chore_logs_table,
             IndexName="KidChoreLogIndex",  # Assumed GSI
-            KeyConditionExpression=Key("kid_id").eq(kid_id),
+            KeyConditionExpression=_K_KID_ID.eq(kid_id),
             ScanIndexForward=False,  # Newest first
+            **_model_projection(models.ChoreLog),
         )
-        items_logs = response_logs.get("Items", [])
-        chore_logs.extend([models.ChoreLog(**replace_decimals(item)) for item in items_logs])
+        return list(map(_chore_log_from_item, items_logs))
     except ClientError as e:
-        if e.response["Error"]["Code"] == "ResourceNotFoundException":
-            print(
-                f"Warning: GSI 'KidChoreLogIndex' not found for chore_logs_table. Falling back to scan for kid_id '{kid_id}'."
+        if _index_missing(e):
+            logger.warning(
+                "GSI 'KidChoreLogIndex' not found for chore_logs_table. Falling back to scan for kid_id '%s'.", kid_id
             )
-            # Assuming get_all_chore_logs_scan_fallback is defined elsewhere in the file
-            all_logs_from_scan = get_all_chore_logs_scan_fallback()
-            chore_logs.extend([log for log in all_logs_from_scan if log.kid_id == kid_id])
-        else:
-            print(f"Error getting chore logs for kid {kid_id}: {e}")
-            # Don't return yet, try to get assignments
-
-    try:
-        # Fetch approved chore assignments from chore_assignments_table
-        response_assignments = chore_assignments_table.query(
-            IndexName="KidAssignmentsIndex",  # Assumed GSI
-            KeyConditionExpression=Key("assigned_to_kid_id").eq(kid_id),
-            FilterExpression=boto3.dynamodb.conditions.Attr("assignment_status").eq(
-                models.ChoreAssignmentStatus.APPROVED.value
-            ),
-        )
-        items_assignments = response_assignments.get("Items", [])
-        for item_assignment in items_assignments:
-            assignment = models.ChoreAssignment(**replace_decimals(item_assignment))
-            if assignment.reviewed_at:  # Only include if it has been reviewed (i.e., approved)
-                transformed_assignment = models.ChoreLog(
-                    id=f"assignment_{assignment.id}",
-                    chore_id=assignment.chore_id,
-                    chore_name=assignment.chore_name,
-                    kid_id=assignment.assigned_to_kid_id,
-                    kid_username=assignment.kid_username,
-                    points_value=assignment.points_value,
-                    status=models.ChoreStatus.APPROVED,
-                    submitted_at=assignment.reviewed_at,
-                    reviewed_by_parent_id=assignment.reviewed_by_parent_id,
-                    reviewed_at=assignment.reviewed_at,
-                )
-                chore_logs.append(transformed_assignment)
+            return get_all_chore_logs_scan_fallback(_A_KID_ID.eq(kid_id))
+        logger.exception("Error getting chore logs for kid %s: %s", kid_id, e)
+        return []  # Still return the kid's approved assignments
+
+
+def _approved_assignment_logs_for_kid(kid_id: str) -> List[models.ChoreLog]:  # noqa: UP006
+    """Approved chore assignments for a kid, shaped as chore logs. Runs on a worker thread."""
+    try:
+        items = _approved_assignment_items_for_kid(_thread_table(CHORE_ASSIGNMENTS_TABLE_NAME), kid_id)
     except ClientError as e:
-        if e.response["Error"]["Code"] == "ResourceNotFoundException":
-            print(
-                f"Warning: GSI 'KidAssignmentsIndex' not found for chore_assignments_table. Cannot fetch approved assignments for kid_id '{kid_id}'."
+        if _index_missing(e):
+            logger.warning(
+                "GSI 'KidAssignmentsIndex' not found for chore_assignments_table. Cannot fetch approved assignments for kid_id '%s'.",
+                kid_id,
             )
         else:
-            print(f"Error getting approved chore assignments for kid {kid_id}: {e}")
-
-    chore_logs.sort(key=lambda x: x.submitted_at, reverse=True)
+            logger.exception("Error getting approved chore assignments for kid %s: %s", kid_id, e)
+        return []
+    chore_logs = []
+    for item_assignment in items:
+        assignment = _chore_assignment_from_item(item_assignment)
+        transformed_assignment = models.ChoreLog(
+            id=f"assignment_{assignment.id}",
+            chore_id=assignment.chore_id,
+            chore_name=assignment.chore_name,
+            kid_id=assignment.assigned_to_kid_id,
+            kid_username=assignment.kid_username,
+            points_value=assignment.points_value,
+            status=models.ChoreStatus.APPROVED,
+            submitted_at=assignment.reviewed_at,
+            reviewed_by_parent_id=assignment.reviewed_by_parent_id,
+            reviewed_at=assignment.reviewed_at,
+        )
+        chore_logs.append(transformed_assignment)
     return chore_logs
 
 
+def _approved_assignment_items_for_kid(table, kid_id: str) -> list:
+    """Reads the kid's approved assignments by key, so only matching items are read and billed."""
+    query_kwargs = {
+        "IndexName": "KidAssignmentsByStatusIndex",
+        "KeyConditionExpression": _K_ASSIGNED_TO_KID_ID.eq(kid_id)
+        & _K_STATUS_REVIEWED_AT.begins_with(f"{models.ChoreAssignmentStatus.APPROVED.value}#"),
+        **_model_projection(models.ChoreAssignment),
+    }
+    try:
+        return list(iter_query(table, **query_kwargs))
+    except ClientError as e:
+        if not _index_missing(e):
+            raise
+        logger.warning(
+            "GSI 'KidAssignmentsByStatusIndex' not found. Filtering kid_id '%s' assignments by status.", kid_id
+        )
+    query_kwargs.update(
+        IndexName="KidAssignmentsIndex",
+        KeyConditionExpression=_K_ASSIGNED_TO_KID_ID.eq(kid_id),
+        FilterExpression=_A_ASSIGNMENT_STATUS.eq(models.ChoreAssignmentStatus.APPROVED.value),
+    )
+    return list(iter_query(table, **query_kwargs))
+
+
 def get_chore_logs_by_status_for_parent(status: models.ChoreStatus, parent_id: str) -> List[models.ChoreLog]:  # noqa: UP006
     try:
-        response = chore_logs_table.query(
+        items = iter_query(
+            chore_logs_table,
+            IndexName="ParentStatusIndex",
+            KeyConditionExpression=_K_CREATED_BY_PARENT_ID.eq(parent_id)
+            & _K_STATUS_SUBMITTED_AT.begins_with(f"{status.value}#"),
+            ScanIndexForward=False,  # Newest first
+            **_model_projection(models.ChoreLog),
+        )
+        return list(map(_chore_log_from_item, items))
+    except ClientError as e:
+        if _index_missing(e):
+            logger.warning("GSI 'ParentStatusIndex' not found. Joining status '%s' logs to their chores.", status.value)
+            return _chore_logs_by_status_joined_to_chores(status, parent_id)
+        logger.exception("Error getting chore logs by status %s for parent %s: %s", status.value, parent_id, e)
+        return []
+
+
+def _chore_logs_by_status_joined_to_chores(status: models.ChoreStatus, parent_id: str) -> List[models.ChoreLog]:  # noqa: UP006
+    try:
+        items = iter_query(
+            chore_logs_table,
             IndexName="ChoreLogStatusIndex",
-            KeyConditionExpression=Key("status").eq(status.value),
+            KeyConditionExpression=_K_STATUS.eq(status.value),
             ScanIndexForward=False,
+            **_model_projection(models.ChoreLog),
         )
-        items = response.get("Items", [])
-        parent_chore_logs = []
-        for item in items:
-            log = models.ChoreLog(**replace_decimals(item))
-            chore = get_chore_by_id(log.chore_id)
-            if chore and chore.created_by_parent_id == parent_id:
-                parent_chore_logs.append(log)
-        return parent_chore_logs
-    except ClientError as e:
-        if e.response["Error"]["Code"] == "ResourceNotFoundException":
-            print(f"Warning: GSI 'ChoreLogStatusIndex' not found. Falling back to scan for status '{status.value}'.")
-            all_logs = get_all_chore_logs_scan_fallback()
-            filtered_logs = []
-            for log in all_logs:
-                if log.status == status:
-                    chore = get_chore_by_id(log.chore_id)
-                    if chore and chore.created_by_parent_id == parent_id:
-                        filtered_logs.append(log)
+        logs = list(map(_chore_log_from_item, items))
+        return _logs_for_parent_chores(logs, parent_id)
+    except ClientError as e:
+        if _index_missing(e):
+            logger.warning("GSI 'ChoreLogStatusIndex' not found. Falling back to scan for status '%s'.", status.value)
+            status_logs = get_all_chore_logs_scan_fallback(_A_STATUS.eq(status.value))
+            filtered_logs = _logs_for_parent_chores(status_logs, parent_id)
             return sorted(filtered_logs, key=lambda x: x.submitted_at, reverse=True)
-        print(f"Error getting chore logs by status {status.value} for parent {parent_id}: {e}")
+        logger.exception("Error getting chore logs by status %s for parent %s: %s", status.value, parent_id, e)
         return []
 
 
-def get_all_chore_logs_scan_fallback() -> List[models.ChoreLog]:  # noqa: UP006
+def get_all_chore_logs_scan_fallback(filter_expression=None) -> List[models.ChoreLog]:  # noqa: UP006
+    """Scan chore logs, optionally filtered server-side, fetching only ChoreLog's attributes."""
     try:
-        response = chore_logs_table.scan()
-        items = response.get("Items", [])
-        while "LastEvaluatedKey" in response:
-            response = chore_logs_table.scan(ExclusiveStartKey=response["LastEvaluatedKey"])
-            items.extend(response.get("Items", []))
-        return [models.ChoreLog(**replace_decimals(item)) for item in items]
+        filter_kwargs = {"FilterExpression": filter_expression} if filter_expression is not None else {}
+        items = parallel_scan(chore_logs_table, **filter_kwargs, **_model_projection(models.ChoreLog))
+        return list(map(_chore_log_from_item, items))
     except ClientError as e:
-        print(f"Error scanning all chore logs (fallback): {e}")
+        logger.exception("Error scanning all chore logs (fallback): %s", e)
         return []
 
 
@@ -945,7 +1833,7 @@ def get_all_chore_logs_scan_fallback() -> List[models.ChoreLog]:  # noqa: UP006
 
 def create_request(request_in: models.RequestCreate) -> models.Request:
     request_id = str(uuid.uuid4())
-    timestamp = datetime.utcnow()
+    timestamp = _utcnow()
 
     request_data = {
         "id": request_id,
@@ -981,13 +1869,16 @@ def create_request(request_in: models.RequestCreate) -> models.Request:
             reviewed_at=None,
         )
     except ClientError as e:
-        error_log_message = f"DynamoDB ClientError creating request for user {request_in.requester_username}. "
-        error_log_message += f"Attempted item: {prepared_request_data}. Error details: {e!s}. "
-        if hasattr(e, "response") and e.response and "Error" in e.response:
-            error_log_message += (
-                f"DynamoDB Error Code: {e.response['Error'].get('Code')}, Message: {e.response['Error'].get('Message')}"
-            )
-        print(error_log_message)
+        error = e.response.get("Error", {}) if getattr(e, "response", None) else {}
+        logger.exception(
+            "DynamoDB ClientError creating request for user %s. Attempted item: %s. Error details: %s. "
+            "DynamoDB Error Code: %s, Message: %s",
+            request_in.requester_username,
+            prepared_request_data,
+            e,
+            error.get("Code"),
+            error.get("Message"),
+        )
         raise HTTPException(
             status_code=500,
             detail="Could not create request in database. Please check backend logs for specific DynamoDB error.",
@@ -996,69 +1887,65 @@ def create_request(request_in: models.RequestCreate) -> models.Request:
 
 def get_request_by_id(request_id: str) -> Optional[models.Request]:
     try:
-        response = requests_table.get_item(Key={"id": request_id})
+        response = requests_table.get_item(Key={"id": request_id}, **_model_projection(models.Request))
         item = response.get("Item")
         if item:
-            return models.Request(**replace_decimals(item))
+            return _request_from_item(item)
         return None
     except ClientError as e:
-        print(f"Error getting request {request_id}: {e}")
+        logger.exception("Error getting request %s: %s", request_id, e)
         return None
 
 
-def get_requests_by_status(status: models.RequestStatus) -> List[models.Request]:  # noqa: UP006
-    try:
-        # This scan can be inefficient. Consider a GSI on 'status' and 'created_at' for production.
-        # GSI: IndexName='RequestStatusIndex', KeySchema=[{AttributeName: 'status', KeyType: 'HASH'}, {AttributeName: 'created_at', KeyType: 'RANGE'}]
-        response = requests_table.scan(FilterExpression=boto3.dynamodb.conditions.Attr("status").eq(status.value))
-        items = response.get("Items", [])
-        while "LastEvaluatedKey" in response:
-            response = requests_table.scan(
-                FilterExpression=boto3.dynamodb.conditions.Attr("status").eq(status.value),
-                ExclusiveStartKey=response["LastEvaluatedKey"],
-            )
-            items.extend(response.get("Items", []))
+def _query_requests_newest_first(index_name: str, key_condition, fallback_filter) -> List[models.Request]:  # noqa: UP006
+    """
+    Read every request in one partition of a created_at-sorted GSI, newest first.
 
-        parsed_items = [models.Request(**replace_decimals(item)) for item in items]
+    Falls back to a filtered scan (sorted in Python) when the index doesn't exist yet.
+    """
+    try:
+        items = iter_query(
+            requests_table,
+            IndexName=index_name,
+            KeyConditionExpression=key_condition,
+            ScanIndexForward=False,
+            **_model_projection(models.Request),
+        )
+        return list(map(_request_from_item, items))
+    except ClientError as e:
+        if not _index_missing(e):
+            raise
+        logger.warning("GSI '%s' not found. Falling back to scan.", index_name)
+        items = parallel_scan(requests_table, FilterExpression=fallback_filter, **_model_projection(models.Request))
+        parsed_items = list(map(_request_from_item, items))
         parsed_items.sort(key=lambda x: x.created_at, reverse=True)  # Sort newest first
         return parsed_items
+
+
+def get_requests_by_status(status: models.RequestStatus) -> List[models.Request]:  # noqa: UP006
+    try:
+        return _query_requests_newest_first(
+            "StatusCreatedAtGSI", _K_STATUS.eq(status.value), _A_STATUS.eq(status.value)
+        )
     except ClientError as e:
-        print(f"Error scanning requests by status {status.value}: {e}")
+        logger.exception("Error getting requests by status %s: %s", status.value, e)
         return []
 
 
 def get_requests_by_requester_id(requester_id: str) -> List[models.Request]:  # noqa: UP006
     try:
-        # This scan can be inefficient. Consider a GSI on 'requester_id' and 'created_at' for production.
-        # GSI: IndexName='RequesterIdIndex', KeySchema=[{AttributeName: 'requester_id', KeyType: 'HASH'}, {AttributeName: 'created_at', KeyType: 'RANGE'}]
-        response = requests_table.scan(FilterExpression=boto3.dynamodb.conditions.Attr("requester_id").eq(requester_id))
-        items = response.get("Items", [])
-        while "LastEvaluatedKey" in response:
-            response = requests_table.scan(
-                FilterExpression=boto3.dynamodb.conditions.Attr("requester_id").eq(requester_id),
-                ExclusiveStartKey=response["LastEvaluatedKey"],
-            )
-            items.extend(response.get("Items", []))
-
-        parsed_items = [models.Request(**replace_decimals(item)) for item in items]
-        parsed_items.sort(key=lambda x: x.created_at, reverse=True)  # Sort newest first
-        return parsed_items
+        return _query_requests_newest_first(
+            "RequesterIdCreatedAtGSI", _K_REQUESTER_ID.eq(requester_id), _A_REQUESTER_ID.eq(requester_id)
+        )
     except ClientError as e:
-        print(f"Error scanning requests by requester_id {requester_id}: {e}")
+        logger.exception("Error getting requests by requester_id %s: %s", requester_id, e)
         return []
 
 
 def update_request_status(
     request_id: str, new_status: models.RequestStatus, parent_id: str
 ) -> Optional[models.Request]:
-    request_to_update = get_request_by_id(request_id)
-    if not request_to_update:
-        return None  # Request not found
-
-    if request_to_update.status == new_status:  # No change needed
-        return request_to_update
-
-    timestamp = datetime.utcnow()
+    timestamp = _utcnow()
     update_expression = "SET #s = :s, reviewed_by_parent_id = :pid, reviewed_at = :rat"
     expression_attribute_values = {
         ":s": new_status.value,
@@ -1068,82 +1955,94 @@ def update_request_status(
     expression_attribute_names = {"#s": "status"}
 
     try:
+        # The condition replaces the pre-read: a missing request or one already in new_status fails it,
+        # and ALL_OLD tells the two apart without another round trip.
         response = requests_table.update_item(
             Key={"id": request_id},
             UpdateExpression=update_expression,
+            ConditionExpression="attribute_exists(id) AND #s <> :s",
             ExpressionAttributeNames=expression_attribute_names,
             ExpressionAttributeValues=expression_attribute_values,
             ReturnValues="ALL_NEW",
+            ReturnValuesOnConditionCheckFailure="ALL_OLD",
         )
         updated_attributes = response.get("Attributes")
         if not updated_attributes:
             return None  # Should not happen if update is successful
 
-        updated_request = models.Request(**replace_decimals(updated_attributes))
-
-        # If approved, and it's an ADD_STORE_ITEM or ADD_CHORE request, create the item/chore.
-        if new_status == models.RequestStatus.APPROVED:
-            if updated_request.request_type == models.RequestType.ADD_STORE_ITEM:
-                details = updated_request.details
-                store_item_create = models.StoreItemCreate(
-                    name=details.get("name"),
-                    description=details.get("description"),
-                    points_cost=int(details.get("points_cost", 0)),  # Ensure points_cost is int
-                )
-                create_store_item(item_in=store_item_create)  # Assuming parent_id is not needed for create_store_item
-                print(f"Store item '{store_item_create.name}' created from approved request {request_id}.")
-
-            elif updated_request.request_type == models.RequestType.ADD_CHORE:
-                details = updated_request.details
-                chore_create = models.ChoreCreate(
-                    name=details.get("name"),
-                    description=details.get("description"),
-                    points_value=int(details.get("points_value", 0)),  # Ensure points_value is int
-                )
-                # create_chore requires parent_id, which we have from the function argument
-                create_chore(chore_in=chore_create, parent_id=parent_id)
-                print(f"Chore '{chore_create.name}' created from approved request {request_id}.")
-
-        return updated_request
+        updated_request = _request_from_item(updated_attributes)
     except ClientError as e:
-        print(f"Error updating status for request {request_id}: {e}")
-        return None
-    except Exception as e:  # Catch other potential errors like Pydantic validation from create_store_item/create_chore
-        print(f"Error processing post-approval for request {request_id}: {e}")
-        # The request status itself was updated, but the secondary action (creating item/chore) might have failed.
-        # Depending on desired transactional behavior, you might want to revert the status or log this specifically.
-        # For now, return the updated request object, but log the error.
-        if "updated_request" in locals():
-            return updated_request
-        return None
+        if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+            logger.exception("Error updating status for request %s: %s", request_id, e)
+            return None
+        existing_item = e.response.get("Item")
+        if not existing_item:
+            return None  # Request not found
+        updated_request = _request_from_item(_deserialize_item(existing_item))  # Already in new_status
+
+    # Creating the item/chore is idempotent, so re-approving an approved request retries a creation that failed
+    if new_status == models.RequestStatus.APPROVED:
+        try:
+            _create_from_approved_request(updated_request, parent_id)
+        # Catch other potential errors like Pydantic validation from create_store_item/create_chore
+        except Exception as e:
+            # The request status itself was updated, but the secondary action (creating item/chore) failed.
+            # Return the updated request object, but log the error.
+            logger.exception("Error processing post-approval for request %s: %s", request_id, e)
+    return updated_request
+
+
+def _approved_request_item_id(approved_request: models.Request) -> str:
+    """The store item/chore created for a request is keyed by the request, so it is only ever created once."""
+    return f"request_{approved_request.id}"
+
+
+def _create_from_approved_request(approved_request: models.Request, parent_id: str) -> None:
+    """If it's an ADD_STORE_ITEM or ADD_CHORE request, create the item/chore."""
+    details = approved_request.details
+    if approved_request.request_type == models.RequestType.ADD_STORE_ITEM:
+        store_item_create = models.StoreItemCreate(
+            name=details.get("name"),
+            description=details.get("description"),
+            points_cost=int(details.get("points_cost", 0)),  # Ensure points_cost is int
+        )
+        # Assuming parent_id is not needed for create_store_item
+        create_store_item(item_in=store_item_create, item_id=_approved_request_item_id(approved_request))
+        logger.info("Store item '%s' created from approved request %s.", store_item_create.name, approved_request.id)
+
+    elif approved_request.request_type == models.RequestType.ADD_CHORE:
+        chore_create = models.ChoreCreate(
+            name=details.get("name"),
+            description=details.get("description"),
+            points_value=int(details.get("points_value", 0)),  # Ensure points_value is int
+        )
+        # create_chore requires parent_id, which we have from the function argument
+        create_chore(chore_in=chore_create, parent_id=parent_id, chore_id=_approved_request_item_id(approved_request))
+        logger.info("Chore '%s' created from approved request %s.", chore_create.name, approved_request.id)
 
 
 # --- Chore Assignment CRUD ---
 
 
 def create_chore_assignment(assignment_in: models.ChoreAssignmentCreate, parent_id: str) -> models.ChoreAssignment:
-    # Verify the chore exists and is active
+    # The chore's name and points are copied onto the assignment, so it is still read (usually from cache)
     chore = get_chore_by_id(assignment_in.chore_id)
     if not chore or not chore.is_active:
         raise HTTPException(status_code=404, detail="Active chore not found.")
 
-    # Verify the kid exists and is a kid
-    kid_user = get_user_by_username(assignment_in.assigned_to_kid_id)  # Using username as kid_id
-    if not kid_user or kid_user.role != models.UserRole.KID:
-        raise HTTPException(status_code=404, detail="Kid user not found.")
-
+    kid_username = assignment_in.assigned_to_kid_id  # Using username as kid_id
     assignment_id = str(uuid.uuid4())
-    timestamp = datetime.utcnow()
+    timestamp = _utcnow()
 
     assignment_data = {
         "id": assignment_id,
         "chore_id": assignment_in.chore_id,
-        "assigned_to_kid_id": assignment_in.assigned_to_kid_id,
+        "assigned_to_kid_id": kid_username,
         "due_date": assignment_in.due_date.isoformat(),
         "notes": assignment_in.notes,
         "assigned_by_parent_id": parent_id,
         "chore_name": chore.name,
-        "kid_username": kid_user.username,
+        "kid_username": kid_username,
         "points_value": Decimal(chore.points_value),
         "assignment_status": models.ChoreAssignmentStatus.ASSIGNED.value,
         "created_at": timestamp.isoformat(),
@@ -1155,88 +2054,123 @@ def create_chore_assignment(assignment_in: models.ChoreAssignmentCreate, parent_
     # Remove None values for DynamoDB
     assignment_item = {k: v for k, v in assignment_data.items() if v is not None}
 
-    try:
-        chore_assignments_table.put_item(Item=assignment_item)
-        return models.ChoreAssignment(
-            id=assignment_id,
-            chore_id=assignment_in.chore_id,
-            assigned_to_kid_id=assignment_in.assigned_to_kid_id,
-            due_date=assignment_in.due_date,
-            notes=assignment_in.notes,
-            assigned_by_parent_id=parent_id,
-            chore_name=chore.name,
-            kid_username=kid_user.username,
-            points_value=chore.points_value,
-            assignment_status=models.ChoreAssignmentStatus.ASSIGNED,
-            created_at=timestamp,
-            submitted_at=None,
-            reviewed_by_parent_id=None,
-            reviewed_at=None,
+    # The kid check and the chore's active check ride in the same transaction as the put, so neither
+    # needs its own read and a chore deactivated in between can't still be assigned.
+    try:
+        dynamodb.meta.client.transact_write_items(
+            TransactItems=[
+                {
+                    "ConditionCheck": {
+                        "TableName": CHORES_TABLE_NAME,
+                        "Key": {"id": assignment_in.chore_id},
+                        # Accepts legacy "true" rows too, matching what get_chore_by_id reads as active
+                        "ConditionExpression": "is_active IN (:t, :ts)",
+                        "ExpressionAttributeValues": {":t": True, ":ts": "true"},
+                    }
+                },
+                {
+                    "ConditionCheck": {
+                        "TableName": USERS_TABLE_NAME,
+                        "Key": {"username": kid_username},
+                        "ConditionExpression": "#r = :kid",
+                        "ExpressionAttributeNames": {"#r": "role"},
+                        "ExpressionAttributeValues": {":kid": models.UserRole.KID.value},
+                    }
+                },
+                {"Put": {"TableName": CHORE_ASSIGNMENTS_TABLE_NAME, "Item": assignment_item}},
+            ]
         )
     except ClientError as e:
-        print(f"Error creating chore assignment: {e}")
+        if e.response["Error"]["Code"] == "TransactionCanceledException":
+            failed = [reason.get("Code", "None") for reason in e.response.get("CancellationReasons", [])]
+            if failed[:1] == ["ConditionalCheckFailed"]:
+                invalidate_chore(assignment_in.chore_id)  # The cached chore was stale
+                raise HTTPException(status_code=404, detail="Active chore not found.") from e
+            if failed[1:2] == ["ConditionalCheckFailed"]:
+                raise HTTPException(status_code=404, detail="Kid user not found.") from e
+        logger.exception("Error creating chore assignment: %s", e)
         raise HTTPException(status_code=500, detail="Could not create chore assignment in database.") from e
 
+    return models.ChoreAssignment(
+        id=assignment_id,
+        chore_id=assignment_in.chore_id,
+        assigned_to_kid_id=kid_username,
+        due_date=assignment_in.due_date,
+        notes=assignment_in.notes,
+        assigned_by_parent_id=parent_id,
+        chore_name=chore.name,
+        kid_username=kid_username,
+        points_value=chore.points_value,
+        assignment_status=models.ChoreAssignmentStatus.ASSIGNED,
+        created_at=timestamp,
+        submitted_at=None,
+        reviewed_by_parent_id=None,
+        reviewed_at=None,
+    )
+
 
 def get_assignment_by_id(assignment_id: str) -> Optional[models.ChoreAssignment]:
     try:
-        response = chore_assignments_table.get_item(Key={"id": assignment_id})
+        response = chore_assignments_table.get_item(
+            Key={"id": assignment_id}, **_model_projection(models.ChoreAssignment)
+        )
         item = response.get("Item")
         if item:
-            return models.ChoreAssignment(**replace_decimals(item))
+            return _chore_assignment_from_item(item)
         return None
     except ClientError as e:
-        print(f"Error getting assignment {assignment_id}: {e}")
+        logger.exception("Error getting assignment %s: %s", assignment_id, e)
         return None
 
 
 def get_assignments_by_kid_id(kid_id: str) -> List[models.ChoreAssignment]:  # noqa: UP006
     try:
         # Use GSI on 'assigned_to_kid_id' and 'due_date' for sorting.
-        response = chore_assignments_table.query(
+        items = iter_query(
+            chore_assignments_table,
             IndexName="KidAssignmentsIndex",
-            KeyConditionExpression=Key("assigned_to_kid_id").eq(kid_id),
+            KeyConditionExpression=_K_ASSIGNED_TO_KID_ID.eq(kid_id),
             ScanIndexForward=True,  # Earliest due dates first
+            **_model_projection(models.ChoreAssignment),
         )
-        items = response.get("Items", [])
-        chore_assignments = [models.ChoreAssignment(**replace_decimals(item)) for item in items]
-        logger.info(
-            f"Querying assignments for kid_id {kid_id} using GSI 'KidAssignmentsIndex' response: {chore_assignments}"
-        )
+        chore_assignments = list(map(_chore_assignment_from_item, items))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Querying assignments for kid_id %s using GSI 'KidAssignmentsIndex' response: %r",
+                kid_id,
+                chore_assignments,
+            )
         return chore_assignments
     except ClientError as e:
-        if e.response["Error"]["Code"] == "ResourceNotFoundException":
-            print(f"Warning: GSI 'KidAssignmentsIndex' not found. Falling back to scan for kid_id '{kid_id}'.")
+        if _index_missing(e):
+            logger.warning("GSI 'KidAssignmentsIndex' not found. Falling back to scan for kid_id '%s'.", kid_id)
             # Fallback to scan if GSI doesn't exist
-            all_assignments = get_all_assignments_scan_fallback()
-            filtered_assignments = [
-                assignment for assignment in all_assignments if assignment.assigned_to_kid_id == kid_id
-            ]
+            filtered_assignments = get_all_assignments_scan_fallback(_A_ASSIGNED_TO_KID_ID.eq(kid_id))
             return sorted(filtered_assignments, key=lambda x: x.due_date)
-        print(f"Error getting assignments for kid {kid_id}: {e}")
+        logger.exception("Error getting assignments for kid %s: %s", kid_id, e)
         return []
 
 
 def get_assignments_by_parent_id(parent_id: str) -> List[models.ChoreAssignment]:  # noqa: UP006
     try:
         # Use GSI on 'assigned_by_parent_id' and 'due_date' for sorting.
-        response = chore_assignments_table.query(
+        items = iter_query(
+            chore_assignments_table,
             IndexName="ParentAssignmentsIndex",
-            KeyConditionExpression=Key("assigned_by_parent_id").eq(parent_id),
+            KeyConditionExpression=_K_ASSIGNED_BY_PARENT_ID.eq(parent_id),
             ScanIndexForward=True,  # Earliest due dates first
+            **_model_projection(models.ChoreAssignment),
         )
-        items = response.get("Items", [])
-        return [models.ChoreAssignment(**replace_decimals(item)) for item in items]
+        return list(map(_chore_assignment_from_item, items))
     except ClientError as e:
-        if e.response["Error"]["Code"] == "ResourceNotFoundException":
-            print(f"Warning: GSI 'ParentAssignmentsIndex' not found. Falling back to scan for parent_id '{parent_id}'.")
+        if _index_missing(e):
+            logger.warning(
+                "GSI 'ParentAssignmentsIndex' not found. Falling back to scan for parent_id '%s'.", parent_id
+            )
             # Fallback to scan if GSI doesn't exist
-            all_assignments = get_all_assignments_scan_fallback()
-            filtered_assignments = [
-                assignment for assignment in all_assignments if assignment.assigned_by_parent_id == parent_id
-            ]
+            filtered_assignments = get_all_assignments_scan_fallback(_A_ASSIGNED_BY_PARENT_ID.eq(parent_id))
             return sorted(filtered_assignments, key=lambda x: x.due_date)
-        print(f"Error getting assignments for parent {parent_id}: {e}")
+        logger.exception("Error getting assignments for parent %s: %s", parent_id, e)
         return []
 
 
@@ -1244,38 +2178,34 @@ def get_assignments_by_status_for_parent(
     status: models.ChoreAssignmentStatus, parent_id: str
 ) -> List[models.ChoreAssignment]:  # noqa: UP006
     try:
-        response = chore_assignments_table.query(
+        items = iter_query(
+            chore_assignments_table,
             IndexName="StatusAssignmentsIndex",
-            KeyConditionExpression=Key("assignment_status").eq(status.value),
-            FilterExpression=boto3.dynamodb.conditions.Attr("assigned_by_parent_id").eq(parent_id),
+            KeyConditionExpression=_K_ASSIGNMENT_STATUS.eq(status.value),
+            FilterExpression=_A_ASSIGNED_BY_PARENT_ID.eq(parent_id),
             ScanIndexForward=True,
+            **_model_projection(models.ChoreAssignment),
         )
-        items = response.get("Items", [])
-        return [models.ChoreAssignment(**replace_decimals(item)) for item in items]
+        return list(map(_chore_assignment_from_item, items))
     except ClientError as e:
-        if e.response["Error"]["Code"] == "ResourceNotFoundException":
-            print("Warning: GSI 'StatusAssignmentsIndex' not found. Falling back to scan.")
-            all_assignments = get_all_assignments_scan_fallback()
-            filtered_assignments = [
-                assignment
-                for assignment in all_assignments
-                if assignment.assignment_status == status and assignment.assigned_by_parent_id == parent_id
-            ]
+        if _index_missing(e):
+            logger.warning("GSI 'StatusAssignmentsIndex' not found. Falling back to scan.")
+            filtered_assignments = get_all_assignments_scan_fallback(
+                _A_ASSIGNMENT_STATUS.eq(status.value) & _A_ASSIGNED_BY_PARENT_ID.eq(parent_id)
+            )
             return sorted(filtered_assignments, key=lambda x: x.due_date)
-        print(f"Error getting assignments by status {status} for parent {parent_id}: {e}")
+        logger.exception("Error getting assignments by status %s for parent %s: %s", status, parent_id, e)
         return []
 
 
-def get_all_assignments_scan_fallback() -> List[models.ChoreAssignment]:  # noqa: UP006
+def get_all_assignments_scan_fallback(filter_expression=None) -> List[models.ChoreAssignment]:  # noqa: UP006
+    """Scan chore assignments, optionally filtered server-side, fetching only ChoreAssignment's attributes."""
     try:
-        response = chore_assignments_table.scan()
-        items = response.get("Items", [])
-        while "LastEvaluatedKey" in response:
-            response = chore_assignments_table.scan(ExclusiveStartKey=response["LastEvaluatedKey"])
-            items.extend(response.get("Items", []))
-        return [models.ChoreAssignment(**replace_decimals(item)) for item in items]
+        filter_kwargs = {"FilterExpression": filter_expression} if filter_expression is not None else {}
+        items = parallel_scan(chore_assignments_table, **filter_kwargs, **_model_projection(models.ChoreAssignment))
+        return list(map(_chore_assignment_from_item, items))
     except ClientError as e:
-        print(f"Error scanning all assignments (fallback): {e}")
+        logger.exception("Error scanning all assignments (fallback): %s", e)
         return []
 
 
@@ -1326,7 +2256,7 @@ def calculate_streak_for_kid(kid_id: str) -> dict:
 
     # Calculate current streak
     current_streak = 0
-    today = datetime.utcnow().date()
+    today = _utcnow().date()
     yesterday = today - timedelta(days=1)
 
     # Check if the streak is still active (completed today or yesterday)
@@ -1384,10 +2314,12 @@ def award_streak_bonus_points(kid_username: str, current_streak: int) -> Optiona
         # Award the bonus points
         updated_user = update_user_points(kid_username, bonus_points)
         if updated_user:
-            logger.info(f"Awarded {bonus_points} streak bonus points to {kid_username} for {current_streak}-day streak")
+            logger.info(
+                "Awarded %s streak bonus points to %s for %s-day streak", bonus_points, kid_username, current_streak
+            )
             return bonus_points
         else:
-            logger.error(f"Failed to award streak bonus points to {kid_username}")
+            logger.error("Failed to award streak bonus points to %s", kid_username)
             return None
 
     return None
@@ -1409,7 +2341,7 @@ def submit_assignment_completion(
             detail=f"Assignment is not in assigned status. Current status: {assignment.assignment_status}",
         )
 
-    submitted_at_ts = datetime.utcnow()
+    submitted_at_ts = _utcnow()
 
     try:
         # Build the update expression dynamically based on whether submission_notes is provided
@@ -1433,14 +2365,14 @@ def submit_assignment_completion(
         )
         updated_attributes = response.get("Attributes")
         if updated_attributes:
-            return models.ChoreAssignment(**replace_decimals(updated_attributes))
+            return _chore_assignment_from_item(updated_attributes)
         return None
     except ClientError as e:
         if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
             raise HTTPException(
                 status_code=403, detail="Conditional check failed. Not authorized or assignment changed."
             ) from e
-        print(f"Error submitting assignment {assignment_id}: {e}")
+        logger.exception("Error submitting assignment %s: %s", assignment_id, e)
         return None
 
 
@@ -1462,19 +2394,73 @@ def _validate_assignment_for_update(assignment: Optional[models.ChoreAssignment]
         )
 
 
+def _assignment_status_sort_key(status: models.ChoreAssignmentStatus, reviewed_at: datetime) -> str:
+    return f"{status.value}#{reviewed_at.isoformat()}"
+
+
+# Like chore log reviews, the write only applies to a still-submitted assignment of the reviewing parent
+_SUBMITTED_ASSIGNMENT_CONDITION = "assignment_status = :submitted AND assigned_by_parent_id = :pid"
+
+
 def _build_assignment_update_expression(
     new_status: models.ChoreAssignmentStatus, parent_id: str, reviewed_at: datetime
 ) -> tuple[str, dict]:
-    """Build DynamoDB update expression for assignment status update."""
-    update_expression = "SET assignment_status = :s, reviewed_by_parent_id = :pid, reviewed_at = :rat"
+    """Build DynamoDB update expression for assignment status update, with values for the submitted condition."""
+    update_expression = (
+        "SET assignment_status = :s, status_reviewed_at = :sra, reviewed_by_parent_id = :pid, reviewed_at = :rat"
+    )
     expression_attribute_values = {
         ":s": new_status.value,
+        ":sra": _assignment_status_sort_key(new_status, reviewed_at),
         ":pid": parent_id,
         ":rat": reviewed_at.isoformat(),
+        ":submitted": models.ChoreAssignmentStatus.SUBMITTED.value,
     }
     return update_expression, expression_attribute_values
 
 
+def _approve_assignment(
+    assignment: models.ChoreAssignment,
+    update_expression: str,
+    expression_attribute_values: dict,
+    parent_user: models.User,
+    reviewed_at: datetime,
+) -> Optional[models.ChoreAssignment]:
+    """Mark an assignment approved and award its points atomically, then check for a streak bonus."""
+    assignment_update = {
+        "Update": {
+            "TableName": CHORE_ASSIGNMENTS_TABLE_NAME,
+            "Key": {"id": assignment.id},
+            "UpdateExpression": update_expression,
+            "ConditionExpression": _SUBMITTED_ASSIGNMENT_CONDITION,
+            "ExpressionAttributeValues": expression_attribute_values,
+        }
+    }
+    try:
+        failed = _write_with_points(assignment_update, assignment.kid_username, assignment.points_value)
+    except ClientError as e:
+        logger.exception("Error approving assignment %s: %s", assignment.id, e)
+        return None
+
+    if failed:
+        if failed[0] == "ConditionalCheckFailed":
+            raise HTTPException(status_code=400, detail="Assignment is not pending approval.")
+        if len(failed) > 1 and failed[1] == "ConditionalCheckFailed":
+            raise HTTPException(
+                status_code=404, detail=f"Kid user {assignment.kid_username} not found for point update."
+            )
+        raise HTTPException(status_code=500, detail="Failed to award points to the kid.")
+
+    _award_streak_bonus(assignment.kid_username)
+    return assignment.model_copy(
+        update={
+            "assignment_status": models.ChoreAssignmentStatus.APPROVED,
+            "reviewed_by_parent_id": parent_user.id,
+            "reviewed_at": reviewed_at,
+        }
+    )
+
+
 def update_assignment_status(
     assignment_id: str,
     new_status: models.ChoreAssignmentStatus,
@@ -1485,14 +2471,16 @@ def update_assignment_status(
     _validate_assignment_for_update(assignment, parent_user)
 
     # Build update expression
-    reviewed_at_ts = datetime.utcnow()
+    reviewed_at_ts = _utcnow()
     update_expression, expression_attribute_values = _build_assignment_update_expression(
         new_status, parent_user.id, reviewed_at_ts
     )
 
-    # Award points if approved (reuse same function)
+    # Approval updates the assignment and awards the points in one transaction
     if new_status == models.ChoreAssignmentStatus.APPROVED:
-        _award_points_and_streak_bonus(assignment.kid_username, assignment.points_value)
+        return _approve_assignment(
+            assignment, update_expression, expression_attribute_values, parent_user, reviewed_at_ts
+        )
 
     # Update database
     try:
@@ -1500,16 +2488,20 @@ def update_assignment_status(
             Key={"id": assignment_id},
             UpdateExpression=update_expression,
             ExpressionAttributeValues=expression_attribute_values,
+            ConditionExpression=_SUBMITTED_ASSIGNMENT_CONDITION,
             ReturnValues="ALL_NEW",
+            ReturnValuesOnConditionCheckFailure="ALL_OLD",
         )
         updated_attributes = response.get("Attributes")
         if updated_attributes:
-            return models.ChoreAssignment(**replace_decimals(updated_attributes))
+            return _chore_assignment_from_item(updated_attributes)
         return None
     except ClientError as e:
-        print(f"Error updating assignment {assignment_id} status: {e}")
-        # If points were awarded but this failed, there's an inconsistency.
-        # More robust transaction handling might be needed for production (e.g. DynamoDB Transactions).
+        if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+            if "Item" not in e.response:
+                raise HTTPException(status_code=404, detail="Assignment not found.") from e
+            raise HTTPException(status_code=400, detail="Assignment is not pending approval.") from e
+        logger.exception("Error updating assignment %s status: %s", assignment_id, e)
         return None
 
 
@@ -1518,7 +2510,7 @@ def update_assignment_status(
 
 def create_pet(pet_in: models.PetCreate, parent_id: str) -> models.Pet:
     pet_id = str(uuid.uuid4())
-    timestamp = datetime.utcnow()
+    timestamp = _utcnow()
 
     pet_data = {
         "id": pet_id,
@@ -1549,69 +2541,78 @@ def create_pet(pet_in: models.PetCreate, parent_id: str) -> models.Pet:
             updated_at=timestamp,
         )
     except ClientError as e:
-        print(f"Error creating pet {pet_in.name}: {e}")
+        logger.exception("Error creating pet %s: %s", pet_in.name, e)
         raise HTTPException(status_code=500, detail="Could not create pet in database.") from e
 
 
 def get_pet_by_id(pet_id: str) -> Optional[models.Pet]:
     try:
-        response = pets_table.get_item(Key={"id": pet_id})
+        response = pets_table.get_item(Key={"id": pet_id}, **_model_projection(models.Pet))
         item = response.get("Item")
         if item:
-            return models.Pet(**replace_decimals(item))
+            return _pet_from_item(item)
         return None
     except ClientError as e:
-        print(f"Error getting pet {pet_id}: {e}")
+        logger.exception("Error getting pet %s: %s", pet_id, e)
         return None
 
 
 def get_pets_by_parent_id(parent_id: str) -> List[models.Pet]:  # noqa: UP006
     try:
-        response = pets_table.query(
+        items = iter_query(
+            pets_table,
             IndexName="ParentPetsIndex",
-            KeyConditionExpression=Key("parent_id").eq(parent_id),
+            KeyConditionExpression=_K_PARENT_ID.eq(parent_id),
+            **_model_projection(models.Pet),
         )
-        items = response.get("Items", [])
-        return [models.Pet(**replace_decimals(item)) for item in items]
+        return list(map(_pet_from_item, items))
     except ClientError as e:
-        if e.response["Error"]["Code"] == "ResourceNotFoundException":
-            print("Warning: GSI 'ParentPetsIndex' not found. Falling back to scan.")
-            all_pets = get_all_pets_scan_fallback()
-            return [p for p in all_pets if p.parent_id == parent_id]
-        print(f"Error getting pets for parent {parent_id}: {e}")
+        if _index_missing(e):
+            logger.warning("GSI 'ParentPetsIndex' not found. Falling back to scan.")
+            return get_all_pets_scan_fallback(_A_PARENT_ID.eq(parent_id))
+        logger.exception("Error getting pets for parent %s: %s", parent_id, e)
         return []
 
 
 def get_active_pets() -> List[models.Pet]:  # noqa: UP006
     try:
-        response = pets_table.query(
+        items = iter_query(
+            pets_table,
             IndexName="ActivePetsIndex",
-            KeyConditionExpression=Key("is_active").eq("true"),
+            KeyConditionExpression=_ACTIVE_PARTITION,
+            **_model_projection(models.Pet),
         )
-        items = response.get("Items", [])
-        return [models.Pet(**replace_decimals(item)) for item in items]
+        return list(map(_pet_from_item, items))
     except ClientError as e:
-        if e.response["Error"]["Code"] == "ResourceNotFoundException":
-            print("Warning: GSI 'ActivePetsIndex' not found. Falling back to scan.")
-            all_pets = get_all_pets_scan_fallback()
-            return [p for p in all_pets if p.is_active]
-        print(f"Error getting active pets: {e}")
+        if _index_missing(e):
+            logger.warning("GSI 'ActivePetsIndex' not found. Falling back to scan.")
+            return get_all_pets_scan_fallback(_A_ACTIVE)
+        logger.exception("Error getting active pets: %s", e)
         return []
 
 
-def get_all_pets_scan_fallback() -> List[models.Pet]:  # noqa: UP006
+def get_all_pets_scan_fallback(filter_expression=None) -> List[models.Pet]:  # noqa: UP006
+    """Scan pets, optionally filtered server-side."""
     try:
-        response = pets_table.scan()
-        items = response.get("Items", [])
-        while "LastEvaluatedKey" in response:
-            response = pets_table.scan(ExclusiveStartKey=response["LastEvaluatedKey"])
-            items.extend(response.get("Items", []))
-        return [models.Pet(**replace_decimals(item)) for item in items]
+        filter_kwargs = {"FilterExpression": filter_expression} if filter_expression is not None else {}
+        items = parallel_scan(pets_table, **filter_kwargs, **_model_projection(models.Pet))
+        return list(map(_pet_from_item, items))
     except ClientError as e:
-        print(f"Error scanning all pets (fallback): {e}")
+        logger.exception("Error scanning all pets (fallback): %s", e)
         return []
 
 
+def _pet_stored_attributes(pet: models.PetBase) -> dict:
+    """The editable pet attributes as they are stored."""
+    return {
+        "name": pet.name,
+        "species": pet.species.value,
+        "birthday": pet.birthday.isoformat(),
+        "photo_url": pet.photo_url,
+        "care_notes": pet.care_notes,
+    }
+
+
 def update_pet(pet_id: str, pet_in: models.PetCreate, parent_id: str) -> Optional[models.Pet]:
     existing_pet = get_pet_by_id(pet_id)
     if not existing_pet:
@@ -1619,18 +2620,23 @@ def update_pet(pet_id: str, pet_in: models.PetCreate, parent_id: str) -> Optiona
     if existing_pet.parent_id != parent_id:
         raise HTTPException(status_code=403, detail="Not authorized to update this pet.")
 
-    timestamp = datetime.utcnow().isoformat()
+    # Write only the attributes that differ from the pet already read; cleared optionals are removed
+    current = _pet_stored_attributes(existing_pet)
+    changes = {k: v for k, v in _pet_stored_attributes(pet_in).items() if v != current[k]}
+    if not changes:
+        return existing_pet
+
+    timestamp = _iso_now()
+    set_parts = [f"#{k} = :{k}" for k, v in changes.items() if v is not None] + ["updated_at = :ua"]
+    removed = [f"#{k}" for k, v in changes.items() if v is None]
+    update_expression = "SET " + ", ".join(set_parts) + (" REMOVE " + ", ".join(removed) if removed else "")
     try:
         response = pets_table.update_item(
             Key={"id": pet_id},
-            UpdateExpression="SET #n = :n, species = :sp, birthday = :bd, photo_url = :pu, care_notes = :cn, updated_at = :ua",
-            ExpressionAttributeNames={"#n": "name"},
+            UpdateExpression=update_expression,
+            ExpressionAttributeNames={f"#{k}": k for k in changes},
             ExpressionAttributeValues={
-                ":n": pet_in.name,
-                ":sp": pet_in.species.value,
-                ":bd": pet_in.birthday.isoformat(),
-                ":pu": pet_in.photo_url,
-                ":cn": pet_in.care_notes,
+                **{f":{k}": v for k, v in changes.items() if v is not None},
                 ":ua": timestamp,
                 ":pid": parent_id,
             },
@@ -1639,12 +2645,12 @@ def update_pet(pet_id: str, pet_in: models.PetCreate, parent_id: str) -> Optiona
         )
         updated_attributes = response.get("Attributes")
         if updated_attributes:
-            return models.Pet(**replace_decimals(updated_attributes))
+            return _pet_from_item(updated_attributes)
         return None
     except ClientError as e:
         if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
             raise HTTPException(status_code=403, detail="Not authorized to update this pet.") from e
-        print(f"Error updating pet {pet_id}: {e}")
+        logger.exception("Error updating pet %s: %s", pet_id, e)
         return None
 
 
@@ -1655,27 +2661,24 @@ def deactivate_pet(pet_id: str, parent_id: str) -> Optional[models.Pet]:
     if existing_pet.parent_id != parent_id:
         raise HTTPException(status_code=403, detail="Not authorized to deactivate this pet.")
 
-    timestamp = datetime.utcnow().isoformat()
+    timestamp = _utcnow()
     try:
-        response = pets_table.update_item(
+        pets_table.update_item(
             Key={"id": pet_id},
             UpdateExpression="SET is_active = :ia, updated_at = :ua",
             ExpressionAttributeValues={
                 ":ia": "false",
-                ":ua": timestamp,
+                ":ua": timestamp.isoformat(),
                 ":pid": parent_id,
             },
             ConditionExpression="parent_id = :pid",
-            ReturnValues="ALL_NEW",
         )
-        updated_attributes = response.get("Attributes")
-        if updated_attributes:
-            return models.Pet(**replace_decimals(updated_attributes))
-        return None
+        # Only the two written attributes changed, so the pet already read is updated instead of read back
+        return existing_pet.model_copy(update={"is_active": False, "updated_at": timestamp})
     except ClientError as e:
         if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
             raise HTTPException(status_code=403, detail="Not authorized to deactivate this pet.") from e
-        print(f"Error deactivating pet {pet_id}: {e}")
+        logger.exception("Error deactivating pet %s: %s", pet_id, e)
         return None
 
 
@@ -1690,7 +2693,7 @@ def create_pet_care_schedule(schedule_in: models.PetCareScheduleCreate, parent_i
         raise HTTPException(status_code=403, detail="Not authorized to create schedule for this pet.")
 
     schedule_id = str(uuid.uuid4())
-    timestamp = datetime.utcnow()
+    timestamp = _utcnow()
 
     schedule_data = {
         "id": schedule_id,
@@ -1729,87 +2732,83 @@ def create_pet_care_schedule(schedule_in: models.PetCareScheduleCreate, parent_i
             updated_at=timestamp,
         )
     except ClientError as e:
-        print(f"Error creating pet care schedule: {e}")
+        logger.exception("Error creating pet care schedule: %s", e)
         raise HTTPException(status_code=500, detail="Could not create pet care schedule.") from e
 
 
 def get_schedule_by_id(schedule_id: str) -> Optional[models.PetCareSchedule]:
     try:
-        response = pet_care_schedules_table.get_item(Key={"id": schedule_id})
+        response = pet_care_schedules_table.get_item(
+            Key={"id": schedule_id}, **_model_projection(models.PetCareSchedule)
+        )
         item = response.get("Item")
         if item:
-            return models.PetCareSchedule(**replace_decimals(item))
+            return _pet_care_schedule_from_item(item)
         return None
     except ClientError as e:
-        print(f"Error getting schedule {schedule_id}: {e}")
+        logger.exception("Error getting schedule %s: %s", schedule_id, e)
         return None
 
 
 def get_schedules_by_pet_id(pet_id: str) -> List[models.PetCareSchedule]:  # noqa: UP006
     try:
-        response = pet_care_schedules_table.query(
+        items = iter_query(
+            pet_care_schedules_table,
             IndexName="PetSchedulesIndex",
-            KeyConditionExpression=Key("pet_id").eq(pet_id),
+            KeyConditionExpression=_K_PET_ID.eq(pet_id),
+            **_model_projection(models.PetCareSchedule),
         )
-        items = response.get("Items", [])
-        return [models.PetCareSchedule(**replace_decimals(item)) for item in items]
+        return list(map(_pet_care_schedule_from_item, items))
     except ClientError as e:
-        if e.response["Error"]["Code"] == "ResourceNotFoundException":
-            print("Warning: GSI 'PetSchedulesIndex' not found. Falling back to scan.")
-            all_schedules = get_all_schedules_scan_fallback()
-            return [s for s in all_schedules if s.pet_id == pet_id]
-        print(f"Error getting schedules for pet {pet_id}: {e}")
+        if _index_missing(e):
+            logger.warning("GSI 'PetSchedulesIndex' not found. Falling back to scan.")
+            return get_all_schedules_scan_fallback(_A_PET_ID.eq(pet_id))
+        logger.exception("Error getting schedules for pet %s: %s", pet_id, e)
         return []
 
 
 def get_active_schedules() -> List[models.PetCareSchedule]:  # noqa: UP006
     try:
-        response = pet_care_schedules_table.query(
+        items = iter_query(
+            pet_care_schedules_table,
             IndexName="ActiveSchedulesIndex",
-            KeyConditionExpression=Key("is_active").eq("true"),
+            KeyConditionExpression=_ACTIVE_PARTITION,
+            **_model_projection(models.PetCareSchedule),
         )
-        items = response.get("Items", [])
-        return [models.PetCareSchedule(**replace_decimals(item)) for item in items]
+        return list(map(_pet_care_schedule_from_item, items))
     except ClientError as e:
-        if e.response["Error"]["Code"] == "ResourceNotFoundException":
-            print("Warning: GSI 'ActiveSchedulesIndex' not found. Falling back to scan.")
-            all_schedules = get_all_schedules_scan_fallback()
-            return [s for s in all_schedules if s.is_active]
-        print(f"Error getting active schedules: {e}")
+        if _index_missing(e):
+            logger.warning("GSI 'ActiveSchedulesIndex' not found. Falling back to scan.")
+            return get_all_schedules_scan_fallback(_A_ACTIVE)
+        logger.exception("Error getting active schedules: %s", e)
         return []
 
 
-def get_all_schedules_scan_fallback() -> List[models.PetCareSchedule]:  # noqa: UP006
+def get_all_schedules_scan_fallback(filter_expression=None) -> List[models.PetCareSchedule]:  # noqa: UP006
+    """Scan schedules, optionally filtered server-side."""
     try:
-        response = pet_care_schedules_table.scan()
-        items = response.get("Items", [])
-        while "LastEvaluatedKey" in response:
-            response = pet_care_schedules_table.scan(ExclusiveStartKey=response["LastEvaluatedKey"])
-            items.extend(response.get("Items", []))
-        return [models.PetCareSchedule(**replace_decimals(item)) for item in items]
+        filter_kwargs = {"FilterExpression": filter_expression} if filter_expression is not None else {}
+        items = parallel_scan(pet_care_schedules_table, **filter_kwargs, **_model_projection(models.PetCareSchedule))
+        return list(map(_pet_care_schedule_from_item, items))
     except ClientError as e:
-        print(f"Error scanning all schedules (fallback): {e}")
+        logger.exception("Error scanning all schedules (fallback): %s", e)
         return []
 
 
-def update_schedule_rotation_index(schedule_id: str, new_index: int) -> Optional[models.PetCareSchedule]:
+def update_schedule_rotation_index(schedule_id: str, new_index: int) -> bool:
     try:
-        response = pet_care_schedules_table.update_item(
+        pet_care_schedules_table.update_item(
             Key={"id": schedule_id},
             UpdateExpression="SET rotation_index = :ri, updated_at = :ua",
             ExpressionAttributeValues={
                 ":ri": Decimal(new_index),
-                ":ua": datetime.utcnow().isoformat(),
+                ":ua": _iso_now(),
             },
-            ReturnValues="ALL_NEW",
         )
-        updated_attributes = response.get("Attributes")
-        if updated_attributes:
-            return models.PetCareSchedule(**replace_decimals(updated_attributes))
-        return None
+        return True
     except ClientError as e:
-        print(f"Error updating schedule rotation index {schedule_id}: {e}")
-        return None
+        logger.exception("Error updating schedule rotation index %s: %s", schedule_id, e)
+        return False
 
 
 def deactivate_schedule(schedule_id: str, parent_id: str) -> Optional[models.PetCareSchedule]:
@@ -1819,36 +2818,33 @@ def deactivate_schedule(schedule_id: str, parent_id: str) -> Optional[models.Pet
     if existing_schedule.parent_id != parent_id:
         raise HTTPException(status_code=403, detail="Not authorized to deactivate this schedule.")
 
-    timestamp = datetime.utcnow().isoformat()
+    timestamp = _utcnow()
     try:
-        response = pet_care_schedules_table.update_item(
+        pet_care_schedules_table.update_item(
             Key={"id": schedule_id},
             UpdateExpression="SET is_active = :ia, updated_at = :ua",
             ExpressionAttributeValues={
                 ":ia": "false",
-                ":ua": timestamp,
+                ":ua": timestamp.isoformat(),
                 ":pid": parent_id,
             },
             ConditionExpression="parent_id = :pid",
-            ReturnValues="ALL_NEW",
         )
-        updated_attributes = response.get("Attributes")
-        if updated_attributes:
-            return models.PetCareSchedule(**replace_decimals(updated_attributes))
-        return None
+        return existing_schedule.model_copy(update={"is_active": False, "updated_at": timestamp})
     except ClientError as e:
         if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
             raise HTTPException(status_code=403, detail="Not authorized to deactivate this schedule.") from e
-        print(f"Error deactivating schedule {schedule_id}: {e}")
+        logger.exception("Error deactivating schedule %s: %s", schedule_id, e)
         return None
 
 
 # --- Pet Care Task CRUD ---
 
 
-def create_pet_care_task(task_in: models.PetCareTaskCreate) -> models.PetCareTask:
+def _new_pet_care_task(task_in: models.PetCareTaskCreate) -> tuple[dict, models.PetCareTask]:
+    """Build the DynamoDB item and response model for a new ASSIGNED task."""
     task_id = str(uuid.uuid4())
-    timestamp = datetime.utcnow()
+    timestamp = _utcnow()
 
     task_data = {
         "id": task_id,
@@ -1869,104 +2865,158 @@ def create_pet_care_task(task_in: models.PetCareTaskCreate) -> models.PetCareTas
         "reviewed_at": None,
     }
     task_item = {k: v for k, v in task_data.items() if v is not None}
+    task = models.PetCareTask(
+        id=task_id,
+        schedule_id=task_in.schedule_id,
+        pet_id=task_in.pet_id,
+        pet_name=task_in.pet_name,
+        task_name=task_in.task_name,
+        description=task_in.description,
+        points_value=task_in.points_value,
+        assigned_to_kid_id=task_in.assigned_to_kid_id,
+        assigned_to_kid_username=task_in.assigned_to_kid_username,
+        due_date=task_in.due_date,
+        status=models.PetCareTaskStatus.ASSIGNED,
+        created_at=timestamp,
+    )
+    return task_item, task
 
+
+def create_pet_care_task(task_in: models.PetCareTaskCreate) -> models.PetCareTask:
+    task_item, task = _new_pet_care_task(task_in)
     try:
         pet_care_tasks_table.put_item(Item=task_item)
-        return models.PetCareTask(
-            id=task_id,
-            schedule_id=task_in.schedule_id,
-            pet_id=task_in.pet_id,
-            pet_name=task_in.pet_name,
-            task_name=task_in.task_name,
-            description=task_in.description,
-            points_value=task_in.points_value,
-            assigned_to_kid_id=task_in.assigned_to_kid_id,
-            assigned_to_kid_username=task_in.assigned_to_kid_username,
-            due_date=task_in.due_date,
-            status=models.PetCareTaskStatus.ASSIGNED,
-            created_at=timestamp,
-        )
+        return task
     except ClientError as e:
-        print(f"Error creating pet care task: {e}")
+        logger.exception("Error creating pet care task: %s", e)
         raise HTTPException(status_code=500, detail="Could not create pet care task.") from e
 
 
+def bulk_create_pet_care_tasks(tasks_in: list[models.PetCareTaskCreate]) -> list[models.PetCareTask]:
+    """Create many tasks through a batch writer: 25 puts per BatchWriteItem, unprocessed items retried."""
+    new_tasks = [_new_pet_care_task(task_in) for task_in in tasks_in]
+    try:
+        with pet_care_tasks_table.batch_writer(overwrite_by_pkeys=["id"]) as batch:
+            for task_item, _ in new_tasks:
+                batch.put_item(Item=task_item)
+        return [task for _, task in new_tasks]
+    except ClientError as e:
+        logger.exception("Error bulk creating pet care tasks: %s", e)
+        raise HTTPException(status_code=500, detail="Could not create pet care tasks.") from e
+
+
 def get_task_by_id(task_id: str) -> Optional[models.PetCareTask]:
     try:
-        response = pet_care_tasks_table.get_item(Key={"id": task_id})
+        response = pet_care_tasks_table.get_item(Key={"id": task_id}, **_model_projection(models.PetCareTask))
         item = response.get("Item")
         if item:
-            return models.PetCareTask(**replace_decimals(item))
+            return _pet_care_task_from_item(item)
         return None
     except ClientError as e:
-        print(f"Error getting task {task_id}: {e}")
+        logger.exception("Error getting task %s: %s", task_id, e)
         return None
 
 
 def get_tasks_by_kid_id(kid_id: str) -> List[models.PetCareTask]:  # noqa: UP006
     try:
-        response = pet_care_tasks_table.query(
+        items = iter_query(
+            pet_care_tasks_table,
             IndexName="KidTasksIndex",
-            KeyConditionExpression=Key("assigned_to_kid_id").eq(kid_id),
+            KeyConditionExpression=_K_ASSIGNED_TO_KID_ID.eq(kid_id),
             ScanIndexForward=True,
+            **_model_projection(models.PetCareTask),
         )
-        items = response.get("Items", [])
-        return [models.PetCareTask(**replace_decimals(item)) for item in items]
+        return list(map(_pet_care_task_from_item, items))
     except ClientError as e:
-        if e.response["Error"]["Code"] == "ResourceNotFoundException":
-            print("Warning: GSI 'KidTasksIndex' not found. Falling back to scan.")
-            all_tasks = get_all_tasks_scan_fallback()
-            return sorted([t for t in all_tasks if t.assigned_to_kid_id == kid_id], key=lambda x: x.due_date)
-        print(f"Error getting tasks for kid {kid_id}: {e}")
+        if _index_missing(e):
+            logger.warning("GSI 'KidTasksIndex' not found. Falling back to scan.")
+            return sorted(get_all_tasks_scan_fallback(_A_ASSIGNED_TO_KID_ID.eq(kid_id)), key=lambda x: x.due_date)
+        logger.exception("Error getting tasks for kid %s: %s", kid_id, e)
         return []
 
 
 def get_tasks_by_pet_id(pet_id: str) -> List[models.PetCareTask]:  # noqa: UP006
     try:
-        response = pet_care_tasks_table.query(
+        items = iter_query(
+            pet_care_tasks_table,
             IndexName="PetTasksIndex",
-            KeyConditionExpression=Key("pet_id").eq(pet_id),
+            KeyConditionExpression=_K_PET_ID.eq(pet_id),
             ScanIndexForward=True,
+            **_model_projection(models.PetCareTask),
         )
-        items = response.get("Items", [])
-        return [models.PetCareTask(**replace_decimals(item)) for item in items]
+        return list(map(_pet_care_task_from_item, items))
     except ClientError as e:
-        if e.response["Error"]["Code"] == "ResourceNotFoundException":
-            print("Warning: GSI 'PetTasksIndex' not found. Falling back to scan.")
-            all_tasks = get_all_tasks_scan_fallback()
-            return sorted([t for t in all_tasks if t.pet_id == pet_id], key=lambda x: x.due_date)
-        print(f"Error getting tasks for pet {pet_id}: {e}")
+        if _index_missing(e):
+            logger.warning("GSI 'PetTasksIndex' not found. Falling back to scan.")
+            return sorted(get_all_tasks_scan_fallback(_A_PET_ID.eq(pet_id)), key=lambda x: x.due_date)
+        logger.exception("Error getting tasks for pet %s: %s", pet_id, e)
         return []
 
 
 def get_tasks_by_status(status: models.PetCareTaskStatus) -> List[models.PetCareTask]:  # noqa: UP006
     try:
-        response = pet_care_tasks_table.query(
+        items = iter_query(
+            pet_care_tasks_table,
             IndexName="TaskStatusIndex",
-            KeyConditionExpression=Key("status").eq(status.value),
+            KeyConditionExpression=_K_STATUS.eq(status.value),
             ScanIndexForward=True,
+            **_model_projection(models.PetCareTask),
         )
-        items = response.get("Items", [])
-        return [models.PetCareTask(**replace_decimals(item)) for item in items]
+        return list(map(_pet_care_task_from_item, items))
     except ClientError as e:
-        if e.response["Error"]["Code"] == "ResourceNotFoundException":
-            print("Warning: GSI 'TaskStatusIndex' not found. Falling back to scan.")
-            all_tasks = get_all_tasks_scan_fallback()
-            return sorted([t for t in all_tasks if t.status == status], key=lambda x: x.due_date)
-        print(f"Error getting tasks by status {status}: {e}")
+        if _index_missing(e):
+            logger.warning("GSI 'TaskStatusIndex' not found. Falling back to scan.")
+            return sorted(get_all_tasks_scan_fallback(_A_STATUS.eq(status.value)), key=lambda x: x.due_date)
+        logger.exception("Error getting tasks by status %s: %s", status, e)
         return []
 
 
-def get_all_tasks_scan_fallback() -> List[models.PetCareTask]:  # noqa: UP006
+def get_task_ids_by_status_for_pets(status: models.PetCareTaskStatus, pet_ids: set[str]) -> list[str]:
+    """
+    Ids of tasks in status that belong to pet_ids, reading only id and pet_id from the index.
+
+    Callers that only gate or count on ownership never build a PetCareTask for tasks they would discard.
+    """
+    if not pet_ids:
+        return []
     try:
-        response = pet_care_tasks_table.scan()
-        items = response.get("Items", [])
-        while "LastEvaluatedKey" in response:
-            response = pet_care_tasks_table.scan(ExclusiveStartKey=response["LastEvaluatedKey"])
-            items.extend(response.get("Items", []))
-        return [models.PetCareTask(**replace_decimals(item)) for item in items]
+        items = iter_query(
+            pet_care_tasks_table,
+            IndexName="TaskStatusIndex",
+            KeyConditionExpression=_K_STATUS.eq(status.value),
+            ProjectionExpression="id, pet_id",
+        )
+        return [item["id"] for item in items if item.get("pet_id") in pet_ids]
     except ClientError as e:
-        print(f"Error scanning all tasks (fallback): {e}")
+        if _index_missing(e):
+            return [task.id for task in get_tasks_by_status(status) if task.pet_id in pet_ids]
+        logger.exception("Error getting task ids by status %s: %s", status, e)
+        return []
+
+
+def get_tasks_by_status_for_pets(status: models.PetCareTaskStatus, pet_ids: set[str]) -> List[models.PetCareTask]:  # noqa: UP006
+    """Tasks in status for pet_ids, hydrating only the tasks that pass the ownership gate."""
+    task_ids = get_task_ids_by_status_for_pets(status, pet_ids)
+    if not task_ids:
+        return []
+    try:
+        items = batch_get(PET_CARE_TASKS_TABLE_NAME, [{"id": task_id} for task_id in task_ids])
+    except ClientError as e:
+        logger.exception("Error batch getting tasks %s: %s", task_ids, e)
+        return []
+    tasks = list(map(_pet_care_task_from_item, items))
+    # BatchGetItem returns items in no particular order; keep the index's due_date order
+    return sorted(tasks, key=lambda x: x.due_date)
+
+
+def get_all_tasks_scan_fallback(filter_expression=None) -> List[models.PetCareTask]:  # noqa: UP006
+    """Scan tasks, optionally filtered server-side."""
+    try:
+        filter_kwargs = {"FilterExpression": filter_expression} if filter_expression is not None else {}
+        items = parallel_scan(pet_care_tasks_table, **filter_kwargs, **_model_projection(models.PetCareTask))
+        return list(map(_pet_care_task_from_item, items))
+    except ClientError as e:
+        logger.exception("Error scanning all tasks (fallback): %s", e)
         return []
 
 
@@ -1988,7 +3038,7 @@ def submit_pet_care_task(  # noqa: C901
     if task.status != models.PetCareTaskStatus.ASSIGNED:
         raise HTTPException(status_code=400, detail=f"Task is not in assigned status. Current status: {task.status}")
 
-    submitted_at_ts = datetime.utcnow()
+    submitted_at_ts = _utcnow()
 
     # Check if this is a Spike feeding task (auto-approve)
     is_spike_feeding = task.task_name == "Feed Spike"
@@ -1997,40 +3047,39 @@ def submit_pet_care_task(  # noqa: C901
         # AUTO-APPROVE: Award points immediately and mark as approved
         reviewed_at_ts = submitted_at_ts
 
-        # Award points with streak bonus (existing function)
-        _award_points_and_streak_bonus(kid_user.username, task.points_value)
-
-        # Update task: ASSIGNED → APPROVED (skip PENDING_APPROVAL)
+        # Update task: ASSIGNED → APPROVED (skip PENDING_APPROVAL), awarding the points in the same transaction
         update_expression = "SET #s = :s, submitted_at = :sat, reviewed_at = :rat"
         expression_attribute_values = {
             ":s": models.PetCareTaskStatus.APPROVED.value,
             ":sat": submitted_at_ts.isoformat(),
             ":rat": reviewed_at_ts.isoformat(),
             ":kid_id": kid_user.username,
+            ":assigned": models.PetCareTaskStatus.ASSIGNED.value,
         }
 
         if notes is not None:
             update_expression += ", submission_notes = :notes"
             expression_attribute_values[":notes"] = notes
 
-        try:
-            response = pet_care_tasks_table.update_item(
-                Key={"id": task_id},
-                UpdateExpression=update_expression,
-                ExpressionAttributeNames={"#s": "status"},
-                ExpressionAttributeValues=expression_attribute_values,
-                ConditionExpression="assigned_to_kid_id = :kid_id",
-                ReturnValues="ALL_NEW",
-            )
-            updated_attributes = response.get("Attributes")
-            if updated_attributes:
-                return models.PetCareTask(**replace_decimals(updated_attributes))
-            return None
-        except ClientError as e:
-            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
-                raise HTTPException(status_code=403, detail="Not authorized to submit this task.") from e
-            print(f"Error auto-approving Spike feeding task {task_id}: {e}")
-            return None
+        task_update = {
+            "Update": {
+                "TableName": PET_CARE_TASKS_TABLE_NAME,
+                "Key": {"id": task_id},
+                "UpdateExpression": update_expression,
+                "ConditionExpression": "assigned_to_kid_id = :kid_id AND #s = :assigned",  # Award only once
+                "ExpressionAttributeNames": {"#s": "status"},
+                "ExpressionAttributeValues": expression_attribute_values,
+            }
+        }
+        _approve_pet_care_task(task, task_update, "Task is not in assigned status.")
+        return task.model_copy(
+            update={
+                "status": models.PetCareTaskStatus.APPROVED,
+                "submitted_at": submitted_at_ts,
+                "reviewed_at": reviewed_at_ts,
+                "submission_notes": notes if notes is not None else task.submission_notes,
+            }
+        )
 
     else:
         # NORMAL FLOW: Go to PENDING_APPROVAL (existing behavior for other tasks)
@@ -2056,15 +3105,35 @@ def submit_pet_care_task(  # noqa: C901
             )
             updated_attributes = response.get("Attributes")
             if updated_attributes:
-                return models.PetCareTask(**replace_decimals(updated_attributes))
+                return _pet_care_task_from_item(updated_attributes)
             return None
         except ClientError as e:
             if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
                 raise HTTPException(status_code=403, detail="Not authorized to submit this task.") from e
-            print(f"Error submitting task {task_id}: {e}")
+            logger.exception("Error submitting task %s: %s", task_id, e)
             return None
 
 
+def _approve_pet_care_task(task: models.PetCareTask, task_update: dict, not_updatable_detail: str) -> None:
+    """Apply a task's approval and award its points in one transaction, then check for a streak bonus."""
+    try:
+        failed = _write_with_points(task_update, task.assigned_to_kid_username, task.points_value)
+    except ClientError as e:
+        logger.exception("Error approving task %s: %s", task.id, e)
+        raise HTTPException(status_code=500, detail="Failed to award points to the kid.") from e
+
+    if failed:
+        if failed[0] == "ConditionalCheckFailed":
+            raise HTTPException(status_code=400, detail=not_updatable_detail)
+        if len(failed) > 1 and failed[1] == "ConditionalCheckFailed":
+            raise HTTPException(
+                status_code=404, detail=f"Kid user {task.assigned_to_kid_username} not found for point update."
+            )
+        raise HTTPException(status_code=500, detail="Failed to award points to the kid.")
+
+    _award_streak_bonus(task.assigned_to_kid_username)
+
+
 def update_pet_care_task_status(
     task_id: str,
     new_status: models.PetCareTaskStatus,
@@ -2081,10 +3150,28 @@ def update_pet_care_task_status(
     if not pet or pet.parent_id != parent_user.id:
         raise HTTPException(status_code=403, detail="Not authorized to review this task.")
 
-    reviewed_at_ts = datetime.utcnow()
+    reviewed_at_ts = _utcnow()
 
     if new_status == models.PetCareTaskStatus.APPROVED:
-        _award_points_and_streak_bonus(task.assigned_to_kid_username, task.points_value)
+        task_update = {
+            "Update": {
+                "TableName": PET_CARE_TASKS_TABLE_NAME,
+                "Key": {"id": task_id},
+                "UpdateExpression": "SET #s = :s, reviewed_by_parent_id = :pid, reviewed_at = :rat",
+                "ConditionExpression": "#s = :pending",
+                "ExpressionAttributeNames": {"#s": "status"},
+                "ExpressionAttributeValues": {
+                    ":s": new_status.value,
+                    ":pid": parent_user.id,
+                    ":rat": reviewed_at_ts.isoformat(),
+                    ":pending": models.PetCareTaskStatus.PENDING_APPROVAL.value,
+                },
+            }
+        }
+        _approve_pet_care_task(task, task_update, "Task is not pending approval.")
+        return task.model_copy(
+            update={"status": new_status, "reviewed_by_parent_id": parent_user.id, "reviewed_at": reviewed_at_ts}
+        )
 
     try:
         response = pet_care_tasks_table.update_item(
@@ -2100,27 +3187,20 @@ def update_pet_care_task_status(
         )
         updated_attributes = response.get("Attributes")
         if updated_attributes:
-            return models.PetCareTask(**replace_decimals(updated_attributes))
+            return _pet_care_task_from_item(updated_attributes)
         return None
     except ClientError as e:
-        print(f"Error updating task {task_id} status: {e}")
+        logger.exception("Error updating task %s status: %s", task_id, e)
         return None
 
 
 def get_all_pet_care_tasks() -> list[models.PetCareTask]:
     """Get all pet care tasks (for HA integration)"""
     try:
-        response = pet_care_tasks_table.scan()
-        tasks = response.get("Items", [])
-
-        # Handle pagination
-        while "LastEvaluatedKey" in response:
-            response = pet_care_tasks_table.scan(ExclusiveStartKey=response["LastEvaluatedKey"])
-            tasks.extend(response.get("Items", []))
-
-        return [models.PetCareTask(**replace_decimals(task)) for task in tasks]
+        tasks = parallel_scan(pet_care_tasks_table, **_model_projection(models.PetCareTask))
+        return list(map(_pet_care_task_from_item, tasks))
     except Exception as e:
-        logger.error(f"Error getting all pet care tasks: {e}")
+        logger.exception("Error getting all pet care tasks: %s", e)
         return []
 
 
@@ -2135,7 +3215,7 @@ def create_pet_health_log(log_in: models.PetHealthLogCreate, user: models.User)
         raise HTTPException(status_code=404, detail="Active pet not found.")
 
     log_id = str(uuid.uuid4())
-    logged_at = datetime.utcnow()
+    logged_at = _utcnow()
 
     age_months = pet_care.calculate_age_months(pet.birthday, logged_at)
     life_stage = pet_care.calculate_life_stage(pet.species, age_months)
@@ -2168,36 +3248,35 @@ def create_pet_health_log(log_in: models.PetHealthLogCreate, user: models.User)
             life_stage_at_log=life_stage,
         )
     except ClientError as e:
-        print(f"Error creating health log: {e}")
+        logger.exception("Error creating health log: %s", e)
         raise HTTPException(status_code=500, detail="Could not create health log.") from e
 
 
 def get_health_logs_by_pet_id(pet_id: str) -> List[models.PetHealthLog]:  # noqa: UP006
     try:
-        response = pet_health_logs_table.query(
+        items = iter_query(
+            pet_health_logs_table,
             IndexName="PetHealthLogsIndex",
-            KeyConditionExpression=Key("pet_id").eq(pet_id),
+            KeyConditionExpression=_K_PET_ID.eq(pet_id),
             ScanIndexForward=False,
+            **_model_projection(models.PetHealthLog),
         )
-        items = response.get("Items", [])
-        return [models.PetHealthLog(**replace_decimals(item)) for item in items]
+        return list(map(_pet_health_log_from_item, items))
     except ClientError as e:
-        if e.response["Error"]["Code"] == "ResourceNotFoundException":
-            print("Warning: GSI 'PetHealthLogsIndex' not found. Falling back to scan.")
-            all_logs = get_all_health_logs_scan_fallback()
-            return sorted([log for log in all_logs if log.pet_id == pet_id], key=lambda x: x.logged_at, reverse=True)
-        print(f"Error getting health logs for pet {pet_id}: {e}")
+        if _index_missing(e):
+            logger.warning("GSI 'PetHealthLogsIndex' not found. Falling back to scan.")
+            logs = get_all_health_logs_scan_fallback(_A_PET_ID.eq(pet_id))
+            return sorted(logs, key=lambda x: x.logged_at, reverse=True)
+        logger.exception("Error getting health logs for pet %s: %s", pet_id, e)
         return []
 
 
-def get_all_health_logs_scan_fallback() -> List[models.PetHealthLog]:  # noqa: UP006
+def get_all_health_logs_scan_fallback(filter_expression=None) -> List[models.PetHealthLog]:  # noqa: UP006
+    """Scan health logs, optionally filtered server-side."""
     try:
-        response = pet_health_logs_table.scan()
-        items = response.get("Items", [])
-        while "LastEvaluatedKey" in response:
-            response = pet_health_logs_table.scan(ExclusiveStartKey=response["LastEvaluatedKey"])
-            items.extend(response.get("Items", []))
-        return [models.PetHealthLog(**replace_decimals(item)) for item in items]
+        filter_kwargs = {"FilterExpression": filter_expression} if filter_expression is not None else {}
+        items = parallel_scan(pet_health_logs_table, **filter_kwargs, **_model_projection(models.PetHealthLog))
+        return list(map(_pet_health_log_from_item, items))
     except ClientError as e:
-        print(f"Error scanning all health logs (fallback): {e}")
+        logger.exception("Error scanning all health logs (fallback): %s", e)
         return []
@@ -5,6 +5,7 @@ This Lambda function runs daily at 2 AM Mountain Time (9 AM UTC) to automaticall
 generate Spike feeding tasks for the next 7 days.
 """
 
+import logging
 import os
 import sys
 from datetime import datetime
@@ -15,6 +16,9 @@ sys.path.insert(0, os.path.dirname(__file__))
 import crud
 from pet_care import generate_spike_feeding_tasks
 
+logger = logging.getLogger(__name__)
+logger.setLevel(crud.LOG_LEVEL)
+
 
 def lambda_handler(event, context):
     """
@@ -31,7 +35,7 @@ def lambda_handler(event, context):
         dict: Response with status code and message
     """
     try:
-        print(f"[{datetime.utcnow().isoformat()}] Starting daily Spike feeding task generation")
+        logger.info("Starting daily Spike feeding task generation")
 
         # Get parent ID from environment variable
         # This should be set in template.yaml
@@ -39,14 +43,14 @@ def lambda_handler(event, context):
 
         if not parent_id:
             error_msg = "SPIKE_PARENT_ID environment variable not set"
-            print(f"ERROR: {error_msg}")
+            logger.error(error_msg)
             return {"statusCode": 500, "body": error_msg}
 
-        print(f"Using parent ID: {parent_id}")
+        logger.info("Using parent ID: %s", parent_id)
 
         # Get all parent's pets
         parent_pets = crud.get_pets_by_parent_id(parent_id)
-        print(f"Found {len(parent_pets)} pets for parent")
+        logger.info("Found %d pets for parent", len(parent_pets))
 
         # Find Spike (case-insensitive)
         spike = None
@@ -57,16 +61,16 @@ def lambda_handler(event, context):
 
         if not spike:
             error_msg = f"Spike not found in parent's pets. Available pets: {[p.name for p in parent_pets]}"
-            print(f"WARNING: {error_msg}")
+            logger.warning(error_msg)
             return {"statusCode": 404, "body": error_msg}
 
-        print(f"Found Spike: {spike.id} (name: {spike.name})")
+        logger.info("Found Spike: %s (name: %s)", spike.id, spike.name)
 
         # Get existing "Feed Spike" task dates to avoid duplicates
         all_spike_tasks = crud.get_tasks_by_pet_id(spike.id)
         existing_dates = {task.due_date.date() for task in all_spike_tasks if task.task_name == "Feed Spike"}
 
-        print(f"Found {len(all_spike_tasks)} total tasks for Spike, {len(existing_dates)} are feeding tasks")
+        logger.info("Found %d total tasks for Spike, %d are feeding tasks", len(all_spike_tasks), len(existing_dates))
 
         # Generate tasks for next 7 days
         new_tasks = generate_spike_feeding_tasks(
@@ -77,7 +81,7 @@ def lambda_handler(event, context):
             existing_task_dates=existing_dates,
         )
 
-        print(f"Generated {len(new_tasks)} new feeding tasks")
+        logger.info("Generated %d new feeding tasks", len(new_tasks))
 
         # Save to database
         created_count = 0
@@ -88,22 +92,23 @@ def lambda_handler(event, context):
                 created_task = crud.create_pet_care_task(task_create)
                 if created_task:
                     created_count += 1
-                    print(
-                        f"Created task for {task_create.due_date.date()} "
-                        f"assigned to {task_create.assigned_to_kid_username}"
+                    logger.info(
+                        "Created task for %s assigned to %s",
+                        task_create.due_date.date(),
+                        task_create.assigned_to_kid_username,
                     )
                 else:
                     failed_count += 1
-                    print(f"Failed to create task for {task_create.due_date.date()}")
+                    logger.warning("Failed to create task for %s", task_create.due_date.date())
             except Exception as e:
                 failed_count += 1
-                print(f"Error creating task for {task_create.due_date.date()}: {e}")
+                logger.exception("Error creating task for %s: %s", task_create.due_date.date(), e)
 
         success_msg = (
             f"Daily task generation complete: "
             f"{created_count} created, {failed_count} failed, {len(existing_dates)} already existed"
         )
-        print(f"SUCCESS: {success_msg}")
+        logger.info(success_msg)
 
         return {
             "statusCode": 200,
@@ -120,10 +125,7 @@ def lambda_handler(event, context):
 
     except Exception as e:
         error_msg = f"Unexpected error in daily task generation: {str(e)}"
-        print(f"ERROR: {error_msg}")
-        import traceback
-
-        traceback.print_exc()
+        logger.exception(error_msg)
 
         return {"statusCode": 500, "body": error_msg}
 
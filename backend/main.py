@@ -2,9 +2,12 @@
 # and __init__.py makes this directory a package.
 # For Lambda containers, often direct imports work if LAMBDA_TASK_ROOT is in sys.path.
 import asyncio
+import atexit
 import logging
 import os
+import queue
 from datetime import timedelta
+from logging.handlers import QueueHandler, QueueListener
 from typing import List, Optional  # noqa: UP035
 
 from dotenv import load_dotenv
@@ -21,13 +24,34 @@ import care_guide  # noqa: E402
 import crud  # noqa: E402
 import models  # noqa: E402
 import security  # noqa: E402
-from models import User  # noqa: E402
+from models import UserSummary  # noqa: E402
 
 # Configure logging
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logging.basicConfig(level=crud.LOG_LEVEL, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
 
+def _log_off_request_threads() -> None:
+    """Route root log records through a queue so the configured handlers write them on a listener thread.
+
+    Not on Lambda: the process is frozen as soon as a handler returns, so queued records would be written
+    late under the next invocation's request id, or lost with the container.
+    """
+    if os.getenv("AWS_LAMBDA_FUNCTION_NAME"):
+        return
+    root = logging.getLogger()
+    if not root.handlers or any(isinstance(handler, QueueHandler) for handler in root.handlers):
+        return
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    atexit.register(listener.stop)
+
+
+_log_off_request_threads()
+
+
 # --- Authentication Setup ---
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
@@ -92,6 +116,14 @@ from envelope import EnvelopeMiddleware, register_exception_handlers, success_re
 app.add_middleware(EnvelopeMiddleware)
 register_exception_handlers(app)
 
+
+# --- Request-scoped cache Middleware ---
+@app.middleware("http")
+async def request_cache_middleware(request, call_next):
+    with crud.request_cache():
+        return await call_next(request)
+
+
 # --- CORS Middleware (must be outermost to add headers AFTER envelope wrapping) ---
 origins = [
     "http://localhost:3000",
@@ -130,9 +162,9 @@ handler = Mangum(app)
 async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends()):  # noqa: B008
     username = form_data.username
     user = crud.get_user_by_username(username)
-    logger.info(f"Login attempt for user: {username}, User found: {user is not None}")
+    logger.info("Login attempt for user: %s, User found: %s", username, user is not None)
     if not user or not security.verify_password(form_data.password, user.hashed_password):
-        logger.warning(f"Login failed for user: {username}")
+        logger.warning("Login failed for user: %s", username)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -245,7 +277,7 @@ async def request_redeem_store_item(  # Renamed function for clarity
         created_log = crud.create_purchase_log(purchase_log_entry)
         return created_log  # Return the created log entry
     except Exception as e:
-        print(f"Error creating PENDING purchase log: {e}")
+        logger.exception("Error creating PENDING purchase log: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Could not create purchase request."
         ) from e
@@ -392,9 +424,9 @@ async def get_available_chores(
     offset: int = Query(0, ge=0),
 ):
     if include_inactive:
-        items = crud.get_all_chores_scan_fallback()
+        items = await asyncio.to_thread(crud.get_all_chores_scan_fallback)
     else:
-        items = crud.get_all_active_chores()
+        items = await asyncio.to_thread(crud.get_all_active_chores)
     return paginated_response(items, limit, offset)
 
 
@@ -582,10 +614,10 @@ async def read_root():
     return {"message": "Kids Rewards API is running!"}
 
 
-@app.get("/leaderboard", response_model=list[User])
+@app.get("/leaderboard", response_model=list[UserSummary])
 async def get_leaderboard():
     """Get all users sorted by points (highest to lowest)"""
-    users = crud.get_all_users()
+    users = await asyncio.to_thread(crud.get_all_users)
     # Sort users by points (descending), putting users with None points at the end
     sorted_users = sorted(users, key=lambda u: u.points if u.points is not None else -1, reverse=True)
     return sorted_users
@@ -687,10 +719,10 @@ async def get_bearded_dragon_purchases(current_user: models.User = Depends(get_c
     """
     BEARDED_DRAGON_ITEM_ID = "4d35256f-f226-43d7-8211-627891059ebf"
 
-    logger.info(f"Bearded dragon purchases requested by {current_user.username}")
+    logger.info("Bearded dragon purchases requested by %s", current_user.username)
 
-    # Get all purchase logs from the system
-    all_purchases = crud.get_all_purchase_logs()
+    # Every purchase counts toward the collective goal, so the full list is needed; it comes newest first
+    all_purchases = await asyncio.to_thread(crud.get_all_purchase_logs)
 
     # Filter for bearded dragon purchases from the three kids
     valid_usernames = ["clara", "emery", "aiden"]
@@ -700,10 +732,7 @@ async def get_bearded_dragon_purchases(current_user: models.User = Depends(get_c
         if purchase.item_id == BEARDED_DRAGON_ITEM_ID and purchase.username.lower() in valid_usernames
     ]
 
-    # Sort by timestamp descending (newest first)
-    bearded_dragon_purchases.sort(key=lambda x: x.timestamp, reverse=True)
-
-    logger.info(f"Found {len(bearded_dragon_purchases)} bearded dragon purchases for collective goal")
+    logger.info("Found %s bearded dragon purchases for collective goal", len(bearded_dragon_purchases))
 
     return bearded_dragon_purchases
 
@@ -738,12 +767,12 @@ async def ask_gemini(request: GeminiRequest):
         # Combine prompt and question
         full_request = f"{request.prompt}\n\n{request.question}"
 
-        logger.info(f"Asking Gemini: {full_request}")
+        logger.info("Asking Gemini: %s", full_request)
         response = model.generate_content(full_request)
-        logger.info(f"Gemini response: {response.text}")
+        logger.info("Gemini response: %s", response.text)
         return GeminiResponse(answer=response.text)
     except Exception as e:
-        logger.error(f"Error asking Gemini: {type(e).__name__}: {e}")
+        logger.exception("Error asking Gemini: %s: %s", type(e).__name__, e)
         return GeminiResponse(answer=f"Error: {type(e).__name__}: {e}")
 
 
@@ -796,7 +825,7 @@ class PurchaseActionRequest(models.BaseModel):
 async def get_pending_purchase_requests(
     current_parent: models.User = Depends(get_current_parent_user),  # noqa: B008
 ):
-    pending_logs = crud.get_purchase_logs_by_status(models.PurchaseStatus.PENDING)
+    pending_logs = await asyncio.to_thread(crud.get_purchase_logs_by_status, models.PurchaseStatus.PENDING)
     return pending_logs
 
 
@@ -821,7 +850,7 @@ async def approve_purchase_request(
     if kid_user.points is None or kid_user.points < log_to_approve.points_spent:
         # Optionally, could reject automatically or just inform parent
         updated_log_insufficient_points = crud.update_purchase_log_status(
-            log_to_approve.id, models.PurchaseStatus.REJECTED
+            log_to_approve.id, models.PurchaseStatus.REJECTED, expected_status=models.PurchaseStatus.PENDING
         )
         if not updated_log_insufficient_points:
             raise HTTPException(
@@ -833,19 +862,17 @@ async def approve_purchase_request(
             detail=f"Kid {kid_user.username} no longer has enough points. Request auto-rejected.",
         )
 
-    # Deduct points
-    updated_kid = crud.update_user_points(username=kid_user.username, points_to_add=-log_to_approve.points_spent)
-    if not updated_kid:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to deduct points from kid."
-        )
-
-    # Update log status to APPROVED
-    approved_log = crud.update_purchase_log_status(log_to_approve.id, models.PurchaseStatus.APPROVED)
+    # Deduct points and mark the log APPROVED in a single transaction
+    approved_log = crud.approve_purchase(log_to_approve)
     if not approved_log:
+        # The kid's balance dropped below the cost since the check above. Only reject a still-pending
+        # log; a concurrent approve or reject raises 400 here instead of being overwritten.
+        crud.update_purchase_log_status(
+            log_to_approve.id, models.PurchaseStatus.REJECTED, expected_status=models.PurchaseStatus.PENDING
+        )
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to update purchase log status to approved.",
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Kid {kid_user.username} no longer has enough points. Request auto-rejected.",
         )
 
     return approved_log
@@ -863,7 +890,9 @@ async def reject_purchase_request(
     if log_to_reject.status != models.PurchaseStatus.PENDING:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Purchase request is not pending.")
 
-    rejected_log = crud.update_purchase_log_status(log_to_reject.id, models.PurchaseStatus.REJECTED)
+    rejected_log = crud.update_purchase_log_status(
+        log_to_reject.id, models.PurchaseStatus.REJECTED, expected_status=models.PurchaseStatus.PENDING
+    )
     if not rejected_log:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -890,7 +919,11 @@ async def create_feature_request(
     Kid creates a new feature request (e.g., add store item, add chore, other).
     """
     logger.info(
-        f"User {current_kid.username} (ID: {current_kid.id}) creating feature request of type {payload.request_type.value} with details: {payload.details}"
+        "User %s (ID: %s) creating feature request of type %s with details: %s",
+        current_kid.username,
+        current_kid.id,
+        payload.request_type.value,
+        payload.details,
     )
     request_create_data = models.RequestCreate(
         requester_id=current_kid.id,
@@ -901,11 +934,11 @@ async def create_feature_request(
     )
     created_request = crud.create_request(request_in=request_create_data)
     if not created_request:
-        logger.error(f"Failed to create feature request for user {current_kid.username}")
+        logger.error("Failed to create feature request for user %s", current_kid.username)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Could not create feature request."
         )
-    logger.info(f"Feature request {created_request.id} created successfully for user {current_kid.username}")
+    logger.info("Feature request %s created successfully for user %s", created_request.id, current_kid.username)
     return created_request
 
 
@@ -932,9 +965,9 @@ async def get_pending_feature_requests(
     """
     Parent retrieves all feature requests with 'pending' status.
     """
-    logger.info(f"Parent {current_parent.username} fetching pending feature requests.")
+    logger.info("Parent %s fetching pending feature requests.", current_parent.username)
     pending_requests = crud.get_requests_by_status(status=models.RequestStatus.PENDING)
-    logger.info(f"Found {len(pending_requests)} pending feature requests.")
+    logger.info("Found %s pending feature requests.", len(pending_requests))
     return pending_requests
 
 
@@ -947,17 +980,22 @@ async def approve_feature_request(
     Parent approves a feature request.
     If the request type is ADD_STORE_ITEM or ADD_CHORE, the item/chore is created.
     """
-    logger.info(f"Parent {current_parent.username} attempting to approve request {request_id}")
+    logger.info("Parent %s attempting to approve request %s", current_parent.username, request_id)
     updated_request = crud.update_request_status(
         request_id=request_id, new_status=models.RequestStatus.APPROVED, parent_id=current_parent.id
     )
     if not updated_request:
         logger.warning(
-            f"Failed to approve request {request_id} by parent {current_parent.username}. Request not found or update failed."
+            "Failed to approve request %s by parent %s. Request not found or update failed.",
+            request_id,
+            current_parent.username,
         )
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Request not found or could not be approved.")
     logger.info(
-        f"Request {request_id} approved successfully by parent {current_parent.username}. New status: {updated_request.status.value}"
+        "Request %s approved successfully by parent %s. New status: %s",
+        request_id,
+        current_parent.username,
+        updated_request.status.value,
     )
     return updated_request
 
@@ -970,17 +1008,22 @@ async def reject_feature_request(
     """
     Parent rejects a feature request.
     """
-    logger.info(f"Parent {current_parent.username} attempting to reject request {request_id}")
+    logger.info("Parent %s attempting to reject request %s", current_parent.username, request_id)
     updated_request = crud.update_request_status(
         request_id=request_id, new_status=models.RequestStatus.REJECTED, parent_id=current_parent.id
     )
     if not updated_request:
         logger.warning(
-            f"Failed to reject request {request_id} by parent {current_parent.username}. Request not found or update failed."
+            "Failed to reject request %s by parent %s. Request not found or update failed.",
+            request_id,
+            current_parent.username,
         )
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Request not found or could not be rejected.")
     logger.info(
-        f"Request {request_id} rejected successfully by parent {current_parent.username}. New status: {updated_request.status.value}"
+        "Request %s rejected successfully by parent %s. New status: %s",
+        request_id,
+        current_parent.username,
+        updated_request.status.value,
     )
     return updated_request
 
@@ -1049,9 +1092,9 @@ async def get_my_streak(
     """
     Kid retrieves their current streak information.
     """
-    logger.info(f"Fetching streak data for kid {current_kid.username}")
+    logger.info("Fetching streak data for kid %s", current_kid.username)
     streak_data = crud.calculate_streak_for_kid(kid_id=current_kid.username)
-    logger.info(f"Streak data for {current_kid.username}: {streak_data}")
+    logger.info("Streak data for %s: %s", current_kid.username, streak_data)
     return streak_data
 
 
@@ -1296,19 +1339,19 @@ async def generate_pet_care_tasks(
     if schedule.parent_id != current_parent.id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized.")
 
-    pet = crud.get_pet_by_id(schedule.pet_id)
+    # The pet, the rotation's kids and the pet's existing tasks only depend on the schedule, so read them together
+    pet, kid_users, existing_tasks = await asyncio.gather(
+        asyncio.to_thread(crud.get_pet_by_id, schedule.pet_id),
+        asyncio.to_thread(crud.get_users_by_usernames, schedule.assigned_kid_ids),
+        asyncio.to_thread(crud.get_tasks_by_pet_id, schedule.pet_id),
+    )
     if not pet:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Pet not found.")
 
     # Get kid usernames for rotation
-    kid_usernames = {}
-    for kid_id in schedule.assigned_kid_ids:
-        user = crud.get_user_by_username(kid_id)
-        if user:
-            kid_usernames[kid_id] = user.username
+    kid_usernames = {kid_id: kid_users[kid_id].username for kid_id in schedule.assigned_kid_ids if kid_id in kid_users}
 
     # Get existing task dates to avoid duplicates
-    existing_tasks = crud.get_tasks_by_pet_id(pet.id)
     existing_task_dates = {
         task.due_date.date().isoformat() for task in existing_tasks if task.schedule_id == schedule_id
     }
@@ -1319,10 +1362,7 @@ async def generate_pet_care_tasks(
     )
 
     # Create tasks in database
-    created_tasks = []
-    for task_create in task_creates:
-        task = crud.create_pet_care_task(task_create)
-        created_tasks.append(task)
+    created_tasks = crud.bulk_create_pet_care_tasks(task_creates)
 
     # Update rotation index
     if created_tasks:
@@ -1377,11 +1417,11 @@ async def get_pending_pet_task_submissions(
     current_parent: models.User = Depends(get_current_parent_user),  # noqa: B008
 ):
     """Parent retrieves all pending pet care task submissions."""
-    pending_tasks = crud.get_tasks_by_status(models.PetCareTaskStatus.PENDING_APPROVAL)
-    # Filter to only tasks for pets the parent owns
-    parent_pets = crud.get_pets_by_parent_id(current_parent.id)
-    parent_pet_ids = {pet.id for pet in parent_pets}
-    return [task for task in pending_tasks if task.pet_id in parent_pet_ids]
+    parent_pets = await asyncio.to_thread(crud.get_pets_by_parent_id, current_parent.id)
+    # Only tasks for pets the parent owns are fetched in full
+    return await asyncio.to_thread(
+        crud.get_tasks_by_status_for_pets, models.PetCareTaskStatus.PENDING_APPROVAL, {pet.id for pet in parent_pets}
+    )
 
 
 class PetCareTaskActionRequest(models.BaseModel):
@@ -1465,11 +1505,7 @@ async def generate_spike_feeding_tasks_endpoint(
     )
 
     # Save to database
-    created_count = 0
-    for task_create in new_tasks:
-        created_task = crud.create_pet_care_task(task_create)
-        if created_task:
-            created_count += 1
+    created_count = len(crud.bulk_create_pet_care_tasks(new_tasks))
 
     return {
         "message": f"Generated {created_count} Spike feeding task(s)",
@@ -1511,13 +1547,22 @@ async def get_pet_care_overview(
     pets = crud.get_active_pets()
     overview = []
 
-    for pet in pets:
+    # Fetch every pet's tasks and health logs concurrently instead of two blocking reads per pet
+    per_pet_reads = await asyncio.gather(
+        *(
+            asyncio.gather(
+                asyncio.to_thread(crud.get_tasks_by_pet_id, pet.id),
+                asyncio.to_thread(crud.get_health_logs_by_pet_id, pet.id),
+            )
+            for pet in pets
+        )
+    )
+
+    for pet, (tasks, health_logs) in zip(pets, per_pet_reads):
         pet_with_age = pet_care.get_pet_with_age(pet)
         care_rec = pet_care.get_care_recommendations(pet.species, pet_with_age.life_stage)
-        tasks = crud.get_tasks_by_pet_id(pet.id)
 
         # Get recent health logs
-        health_logs = crud.get_health_logs_by_pet_id(pet.id)
         latest_weight = health_logs[0] if health_logs else None
 
         # Count tasks by status
@@ -1616,7 +1661,7 @@ async def list_users(
     limit: int = Query(100, ge=1, le=500),
     offset: int = Query(0, ge=0),
 ):
-    items = crud.get_all_users()
+    items = await asyncio.to_thread(crud.get_all_users)
     if role:
         items = [u for u in items if u.role == role]
     return paginated_response(items, limit, offset)
@@ -1629,25 +1674,39 @@ async def list_users(
 async def get_parent_dashboard(
     current_parent: models.User = Depends(get_current_parent_user),  # noqa: B008
 ):
-    pending_chores = crud.get_chore_logs_by_status_for_parent(
-        status=models.ChoreStatus.PENDING_APPROVAL, parent_id=current_parent.id
+    # The reads are independent, so run the blocking boto3 calls in worker threads and overlap their waits
+    (
+        pending_chores,
+        pending_purchases,
+        pending_assignments,
+        pending_requests,
+        parent_pets,
+    ) = await asyncio.gather(
+        asyncio.to_thread(
+            crud.get_chore_logs_by_status_for_parent,
+            status=models.ChoreStatus.PENDING_APPROVAL,
+            parent_id=current_parent.id,
+        ),
+        asyncio.to_thread(crud.get_purchase_logs_by_status, models.PurchaseStatus.PENDING),
+        asyncio.to_thread(
+            crud.get_assignments_by_status_for_parent,
+            status=models.ChoreAssignmentStatus.SUBMITTED,
+            parent_id=current_parent.id,
+        ),
+        asyncio.to_thread(crud.get_requests_by_status, status=models.RequestStatus.PENDING),
+        asyncio.to_thread(crud.get_pets_by_parent_id, current_parent.id),
     )
-    pending_purchases = crud.get_purchase_logs_by_status(models.PurchaseStatus.PENDING)
-    pending_assignments = crud.get_assignments_by_status_for_parent(
-        status=models.ChoreAssignmentStatus.SUBMITTED, parent_id=current_parent.id
+    # Counting only needs ids, so pending pet tasks are gated on pet_id without being built into models
+    pending_pet_task_ids = await asyncio.to_thread(
+        crud.get_task_ids_by_status_for_pets, models.PetCareTaskStatus.PENDING_APPROVAL, {pet.id for pet in parent_pets}
     )
-    pending_requests = crud.get_requests_by_status(status=models.RequestStatus.PENDING)
-    pending_pet_tasks = crud.get_tasks_by_status(models.PetCareTaskStatus.PENDING_APPROVAL)
-    parent_pets = crud.get_pets_by_parent_id(current_parent.id)
-    parent_pet_ids = {pet.id for pet in parent_pets}
-    pending_pet_tasks = [t for t in pending_pet_tasks if t.pet_id in parent_pet_ids]
 
     return {
         "pending_chore_submissions": len(pending_chores),
         "pending_purchase_requests": len(pending_purchases),
         "pending_assignment_submissions": len(pending_assignments),
         "pending_feature_requests": len(pending_requests),
-        "pending_pet_task_submissions": len(pending_pet_tasks),
+        "pending_pet_task_submissions": len(pending_pet_task_ids),
     }
 
 
@@ -1655,13 +1714,15 @@ async def get_parent_dashboard(
 async def get_kid_dashboard(
     current_kid: models.User = Depends(get_current_kid_user),  # noqa: B008
 ):
-    assignments = crud.get_assignments_by_kid_id(kid_id=current_kid.username)
+    assignments, pet_tasks, streak_data = await asyncio.gather(
+        asyncio.to_thread(crud.get_assignments_by_kid_id, kid_id=current_kid.username),
+        asyncio.to_thread(crud.get_tasks_by_kid_id, kid_id=current_kid.username),
+        asyncio.to_thread(crud.calculate_streak_for_kid, kid_id=current_kid.username),
+    )
     active_assignments = [a for a in assignments if a.assignment_status == models.ChoreAssignmentStatus.ASSIGNED]
-    pet_tasks = crud.get_tasks_by_kid_id(kid_id=current_kid.username)
     active_pet_tasks = [
         t for t in pet_tasks if t.status in (models.PetCareTaskStatus.ASSIGNED, models.PetCareTaskStatus.SCHEDULED)
     ]
-    streak_data = crud.calculate_streak_for_kid(kid_id=current_kid.username)
 
     return {
         "points": current_kid.points or 0,
@@ -1,10 +1,15 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional
 
 from pydantic import BaseModel, Field
 
 
+def _utcnow() -> datetime:
+    # Naive UTC like the stored timestamps; datetime.utcnow() is deprecated
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 class UserRole(str, Enum):
     PARENT = "parent"
     KID = "kid"
@@ -32,6 +37,15 @@ class User(UserBase):  # User still has a role
         # orm_mode = True # For Pydantic V1
 
 
+class UserSummary(UserBase):  # User as listed to other users, without credentials
+    role: UserRole
+    id: str
+    points: Optional[int] = None
+
+    class Config:
+        from_attributes = True
+
+
 class Token(BaseModel):
     access_token: str
     token_type: str
@@ -86,7 +100,7 @@ class PurchaseLogBase(BaseModel):
     item_id: str
     item_name: str
     points_spent: int
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
     status: PurchaseStatus = PurchaseStatus.PENDING
 
 
@@ -124,8 +138,8 @@ class ChoreCreate(ChoreBase):
 class Chore(ChoreBase):
     id: str
     created_by_parent_id: str  # User ID of the parent who created it
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
     is_active: bool = True  # To allow deactivating chores instead of hard delete
 
     class Config:
@@ -151,7 +165,7 @@ class ChoreLogBase(BaseModel):
     kid_username: str  # Denormalized
     points_value: int  # Points for this specific instance of chore completion
     status: ChoreStatus
-    submitted_at: datetime = Field(default_factory=datetime.utcnow)
+    submitted_at: datetime = Field(default_factory=_utcnow)
     reviewed_by_parent_id: Optional[str] = None
     reviewed_at: Optional[datetime] = None
     # Effort tracking fields
@@ -170,6 +184,7 @@ class ChoreLogCreate(ChoreLogBase):
 
 class ChoreLog(ChoreLogBase):
     id: str
+    created_by_parent_id: Optional[str] = None  # Denormalized from the chore; missing on logs not yet backfilled
 
 
 class RequestType(str, Enum):
@@ -193,7 +208,7 @@ class RequestBase(BaseModel):
     # Example for ADD_CHORE: {"name": "...", "description": "...", "points_value": ...}
     # Example for OTHER: {"message": "..."}
     status: RequestStatus = RequestStatus.PENDING
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
 
     class Config:
         from_attributes = True
@@ -235,7 +250,7 @@ class ChoreAssignment(ChoreAssignmentBase):
     kid_username: str  # Denormalized for easier display
     points_value: int  # Points value at time of assignment
     assignment_status: ChoreAssignmentStatus = ChoreAssignmentStatus.ASSIGNED
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
     submitted_at: Optional[datetime] = None
     submission_notes: Optional[str] = None  # Notes from kid when submitting
     reviewed_by_parent_id: Optional[str] = None
@@ -300,8 +315,8 @@ class Pet(PetBase):
     id: str
     parent_id: str
     is_active: bool = True
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
 
     class Config:
         from_attributes = True
@@ -332,8 +347,8 @@ class PetCareSchedule(PetCareScheduleBase):
     assigned_kid_ids: list[str]
     rotation_index: int = 0  # Current position in rotation
     is_active: bool = True
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
 
     class Config:
         from_attributes = True
@@ -358,7 +373,7 @@ class PetCareTaskCreate(PetCareTaskBase):
 class PetCareTask(PetCareTaskBase):
     id: str
     status: PetCareTaskStatus = PetCareTaskStatus.ASSIGNED
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
     submitted_at: Optional[datetime] = None
     submission_notes: Optional[str] = None
     reviewed_by_parent_id: Optional[str] = None
@@ -386,7 +401,7 @@ class PetHealthLog(PetHealthLogBase):
     id: str
     logged_by_user_id: str
     logged_by_username: str
-    logged_at: datetime = Field(default_factory=datetime.utcnow)
+    logged_at: datetime = Field(default_factory=_utcnow)
     weight_status: Optional[WeightStatus] = None
     life_stage_at_log: Optional[BeardedDragonLifeStage] = None
 
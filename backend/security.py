@@ -33,7 +33,7 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     verification_result = pwd_context.verify(plain_password, hashed_password)
-    logger.info(f"Password verification result: {verification_result}")
+    logger.info("Password verification result: %s", verification_result)
     return verification_result
 
 
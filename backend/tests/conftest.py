@@ -57,6 +57,16 @@ def _override_active_kid():
     return KID_USER
 
 
+@pytest.fixture(autouse=True)
+def _clear_chore_cache():
+    # The chore and store listing caches are process-wide; keep one test's mocked rows out of the next
+    main.crud.clear_chore_cache()
+    main.crud.clear_store_items_cache()
+    yield
+    main.crud.clear_chore_cache()
+    main.crud.clear_store_items_cache()
+
+
 @pytest.fixture(scope="module")
 def client():
     with TestClient(app) as c:
@@ -98,7 +98,8 @@ def test_bearded_dragon_purchases_filtering():
 
     # Mock the crud.get_all_purchase_logs function
     with patch("crud.get_all_purchase_logs") as mock_get_all:
-        mock_get_all.return_value = mock_purchases
+        # crud returns the logs newest first, straight from the AllLogsByTimestamp index
+        mock_get_all.return_value = sorted(mock_purchases, key=lambda p: p.timestamp, reverse=True)
 
         # Mock the authentication dependency
         mock_user = models.User(
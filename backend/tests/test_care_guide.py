@@ -1,12 +1,18 @@
 """Tests for the pet care guide module - TDD approach."""
 
+import pytest
+
+import care_guide_generated
 from care_guide import (
     CareTaskType,
     LifeStage,
     PetSpecies,
+    _build_flat_instructions,
+    _build_schedule_table,
     get_cleaning_instructions,
     get_dusting_instructions,
     get_feeding_instructions,
+    get_recommended_schedules,
     get_task_description,
     get_water_instructions,
 )
@@ -213,3 +219,64 @@ class TestTaskTypeDetection:
 
         assert "food" in description.lower()  # Remove uneaten food
         assert "spot" in description.lower() or "daily" in description.lower()
+
+
+class TestInstructionCaching:
+    """Test that instruction lookups are memoized."""
+
+    def test_repeat_task_description_is_cached(self):
+        """Repeat calls with the same arguments should hit the cache."""
+        get_task_description.cache_clear()
+        args = (CareTaskType.FEEDING, PetSpecies.BEARDED_DRAGON, LifeStage.ADULT, "Feed Dubia Roaches")
+
+        first = get_task_description(*args)
+        second = get_task_description(*args)
+
+        assert first is second
+        assert get_task_description.cache_info().hits == 1
+
+
+class TestRecommendedSchedules:
+    """Test the precomputed recommended schedules."""
+
+    def test_bearded_dragon_schedules_use_life_stage_instructions(self):
+        """Schedule descriptions should match the life-stage-specific instructions."""
+        schedules = get_recommended_schedules(PetSpecies.BEARDED_DRAGON, LifeStage.BABY)
+
+        assert len(schedules) == 7
+        assert schedules[0]["description"] == get_feeding_instructions(
+            PetSpecies.BEARDED_DRAGON, LifeStage.BABY, "insects"
+        )
+
+    def test_schedule_descriptions_share_instruction_text(self):
+        """Descriptions are interned, so they are the same object the getters return."""
+        schedules = get_recommended_schedules("bearded_dragon", LifeStage.JUVENILE)
+
+        assert schedules[1]["description"] is get_feeding_instructions("bearded_dragon", LifeStage.JUVENILE, "greens")
+
+    def test_unknown_species_has_no_schedules(self):
+        """Species without a care guide get no recommendations."""
+        assert get_recommended_schedules("unknown_pet", LifeStage.ADULT) == []
+
+    def test_callers_cannot_mutate_cached_schedules(self):
+        """Returned schedules are read-only and clearing the list should not leak into later calls."""
+        schedules = get_recommended_schedules("bearded_dragon", LifeStage.ADULT)
+        with pytest.raises(TypeError):
+            schedules[0]["points_value"] = 999
+        schedules.clear()
+
+        fresh = get_recommended_schedules("bearded_dragon", LifeStage.ADULT)
+        assert len(fresh) == 7
+        assert fresh[0]["points_value"] == 10
+
+
+class TestGeneratedTables:
+    """The generated module must stay in sync with the instruction tables in care_guide.py."""
+
+    def test_generated_instructions_are_current(self):
+        """Regenerate with `python scripts/gen_care_guide.py` if this fails."""
+        assert care_guide_generated.FLAT_INSTRUCTIONS == _build_flat_instructions()
+
+    def test_generated_schedules_are_current(self):
+        """Regenerate with `python scripts/gen_care_guide.py` if this fails."""
+        assert care_guide_generated.RECOMMENDED_SCHEDULES == _build_schedule_table()
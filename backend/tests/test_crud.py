@@ -0,0 +1,1422 @@
+import os
+import sys
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import pytest
+from boto3.dynamodb.types import TypeSerializer
+from botocore.exceptions import ClientError
+from botocore.parsers import JSONParser
+from fastapi import HTTPException
+
+# Add the backend directory to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import crud
+import models
+
+
+def _user_item(username, points=10):
+    return {
+        "id": username,
+        "username": username,
+        "hashed_password": "hashed",
+        "role": "kid",
+        "points": Decimal(points),
+    }
+
+
+def _wire_user_item(username, points=10):
+    """_user_item as the low-level client returns it."""
+    return {k: TypeSerializer().serialize(v) for k, v in _user_item(username, points).items()}
+
+
+class TestBatchGetUsers:
+    """Bulk user lookups go through BatchGetItem instead of one GetItem per user."""
+
+    @patch("crud.time.sleep")
+    @patch("crud.dynamodb")
+    def test_retries_unprocessed_keys(self, mock_dynamodb, mock_sleep):
+        table = crud.USERS_TABLE_NAME
+        mock_dynamodb.batch_get_item.side_effect = [
+            {
+                "Responses": {table: [_user_item("kid-a")]},
+                "UnprocessedKeys": {table: {"Keys": [{"username": "kid-b"}]}},
+            },
+            {"Responses": {table: [_user_item("kid-b", points=5)]}, "UnprocessedKeys": {}},
+        ]
+
+        users = crud.get_users_by_usernames(["kid-a", "kid-b", "kid-a"])
+
+        assert set(users) == {"kid-a", "kid-b"}
+        assert users["kid-b"].points == 5
+        first_request = mock_dynamodb.batch_get_item.call_args_list[0][1]["RequestItems"]
+        assert first_request[table]["Keys"] == [{"username": "kid-a"}, {"username": "kid-b"}]
+        mock_sleep.assert_called_once()
+
+    @patch("crud.dynamodb")
+    def test_chunks_requests_at_the_batch_limit(self, mock_dynamodb):
+        mock_dynamodb.batch_get_item.return_value = {"Responses": {crud.USERS_TABLE_NAME: []}}
+
+        crud.get_users_by_usernames([f"kid-{i}" for i in range(crud.BATCH_GET_MAX_KEYS + 1)])
+
+        assert mock_dynamodb.batch_get_item.call_count == 2
+
+    @patch("crud.dynamodb")
+    def test_batch_get_drops_duplicate_keys_and_passes_projection(self, mock_dynamodb):
+        mock_dynamodb.batch_get_item.return_value = {"Responses": {crud.CHORES_TABLE_NAME: [_chore_item("c1")]}}
+
+        crud.batch_get(
+            crud.CHORES_TABLE_NAME, [{"id": "c1"}, {"id": "c1"}], projection="#n", attribute_names={"#n": "name"}
+        )
+
+        request = mock_dynamodb.batch_get_item.call_args[1]["RequestItems"][crud.CHORES_TABLE_NAME]
+        assert request == {
+            "Keys": [{"id": "c1"}],
+            "ProjectionExpression": "#n",
+            "ExpressionAttributeNames": {"#n": "name"},
+        }
+
+    @patch("crud.dynamodb")
+    def test_get_chores_by_ids_keys_results_by_id(self, mock_dynamodb):
+        mock_dynamodb.batch_get_item.return_value = {"Responses": {crud.CHORES_TABLE_NAME: [_chore_item("c1")]}}
+
+        chores = crud.get_chores_by_ids(["c1", "missing"])
+
+        assert list(chores) == ["c1"]
+        assert chores["c1"].points_value == 5
+
+    @patch("crud.dynamodb")
+    def test_no_usernames_skips_the_request(self, mock_dynamodb):
+        assert crud.get_users_by_usernames([]) == {}
+        mock_dynamodb.batch_get_item.assert_not_called()
+
+
+class TestRequestCache:
+    """Inside request_cache() a user is fetched from DynamoDB at most once."""
+
+    @patch("crud.ddb_client")
+    def test_repeated_lookups_hit_the_table_once(self, mock_client):
+        mock_client.get_item.return_value = {"Item": _wire_user_item("kid-a")}
+
+        with crud.request_cache():
+            first = crud.get_user_by_username("kid-a")
+            second = crud.get_user_by_username("kid-a")
+
+        assert first is second
+        mock_client.get_item.assert_called_once()
+
+    @patch("crud.ddb_client")
+    @patch("crud.dynamodb")
+    def test_batch_lookup_primes_the_cache(self, mock_dynamodb, mock_client):
+        mock_dynamodb.batch_get_item.return_value = {"Responses": {crud.USERS_TABLE_NAME: [_user_item("kid-a")]}}
+
+        with crud.request_cache():
+            crud.get_users_by_usernames(["kid-a"])
+            assert crud.get_user_by_username("kid-a").username == "kid-a"
+
+        mock_client.get_item.assert_not_called()
+
+    @patch("crud.ddb_client")
+    def test_points_update_replaces_the_cached_user(self, mock_client):
+        mock_client.get_item.return_value = {"Item": _wire_user_item("kid-a", points=10)}
+        mock_client.update_item.return_value = {"Attributes": _wire_user_item("kid-a", points=15)}
+
+        with crud.request_cache():
+            crud.get_user_by_username("kid-a")
+            crud.update_user_points("kid-a", 5)
+            assert crud.get_user_by_username("kid-a").points == 15
+
+    @patch("crud.ddb_client")
+    def test_nothing_is_cached_outside_a_request(self, mock_client):
+        mock_client.get_item.return_value = {"Item": _wire_user_item("kid-a")}
+
+        crud.get_user_by_username("kid-a")
+        crud.get_user_by_username("kid-a")
+
+        assert mock_client.get_item.call_count == 2
+
+
+class TestTrustedUserRows:
+    """Users read from the table are built with model_construct, keeping enum and int types."""
+
+    def test_user_from_item_converts_role_and_points(self):
+        user = crud._user_from_item({**_user_item("kid-a", points=7), "unknown_attribute": "x"})
+
+        assert user.role is models.UserRole.KID
+        assert user.points == 7 and isinstance(user.points, int)
+        assert user.model_dump()["api_key_hash"] is None
+        assert "unknown_attribute" not in user.model_dump()
+
+    @patch("crud.models.ChoreLog.__init__")
+    def test_item_loader_converts_only_typed_fields_without_validation(self, mock_init):
+        item = {
+            "id": "l1",
+            "chore_id": "c1",
+            "chore_name": "Chore",
+            "kid_id": "kid-a",
+            "kid_username": "kid-a",
+            "points_value": Decimal(5),
+            "status": "approved",
+            "submitted_at": "2025-01-02T03:04:05.000006",
+            "reviewed_at": None,
+            "is_retry": "false",
+            "status_submitted_at": "approved#2025-01-02T03:04:05.000006",
+        }
+
+        log = crud._chore_log_from_item(item)
+
+        mock_init.assert_not_called()
+        assert log.status is models.ChoreStatus.APPROVED
+        assert log.submitted_at == datetime(2025, 1, 2, 3, 4, 5, 6)
+        assert log.reviewed_at is None
+        assert log.points_value == 5 and isinstance(log.points_value, int)
+        assert log.is_retry is False
+        assert log.effort_minutes == 0  # Defaults fill in missing attributes
+        assert "status_submitted_at" not in log.model_dump()
+
+    def test_item_loader_converts_nested_decimals_and_leaves_the_item_alone(self):
+        item = _request_item("r1", "2025-01-01T00:00:00")
+        item["details"] = {"points_cost": Decimal(7), "ratio": Decimal("0.5")}
+
+        request = crud._request_from_item(item)
+
+        assert request.details == {"points_cost": 7, "ratio": 0.5}
+        assert isinstance(request.details["points_cost"], int)
+        assert item["details"]["points_cost"] == Decimal(7)
+
+    def test_pet_schedule_loader_converts_string_flags_and_numbers(self):
+        item = {
+            "id": "s1",
+            "parent_id": "parent-1",
+            "pet_id": "pet-1",
+            "task_name": "Feed",
+            "frequency": "weekly",
+            "points_value": Decimal(3),
+            "day_of_week": Decimal(2),
+            "assigned_kid_ids": ["kid-a", "kid-b"],
+            "rotation_index": Decimal(1),
+            "is_active": "true",
+            "created_at": "2025-01-01T00:00:00",
+        }
+
+        schedule = crud._pet_care_schedule_from_item(item)
+
+        assert schedule.frequency is models.CareFrequency.WEEKLY
+        assert schedule.is_active is True
+        assert (schedule.points_value, schedule.day_of_week, schedule.rotation_index) == (3, 2, 1)
+        assert schedule.created_at == datetime(2025, 1, 1)
+        assert schedule.assigned_kid_ids == ["kid-a", "kid-b"]
+
+
+class TestParallelScan:
+    """Full-table scans fan out across segments and join the results."""
+
+    @patch("crud._thread_table")
+    def test_scans_every_segment_and_follows_pagination(self, mock_thread_table):
+        def scan(**kwargs):
+            segment = kwargs["Segment"]
+            if segment == 0 and "ExclusiveStartKey" not in kwargs:
+                return {"Items": [{"id": "0a"}], "LastEvaluatedKey": {"id": "0a"}}
+            if segment == 0:
+                return {"Items": [{"id": "0b"}]}
+            return {"Items": [{"id": f"{segment}a"}]}
+
+        mock_thread_table.return_value.scan.side_effect = scan
+        table = crud.chores_table
+
+        items = crud.parallel_scan(table, total_segments=3, FilterExpression="filter")
+
+        assert sorted(item["id"] for item in items) == ["0a", "0b", "1a", "2a"]
+        for call in mock_thread_table.return_value.scan.call_args_list:
+            assert call[1]["TotalSegments"] == 3
+            assert call[1]["FilterExpression"] == "filter"
+        mock_thread_table.assert_called_with(table.name)
+
+    @patch("crud.ddb_client")
+    def test_client_scan_deserializes_wire_items(self, mock_client):
+        def scan(**kwargs):
+            if kwargs["Segment"] == 0 and "ExclusiveStartKey" not in kwargs:
+                return {"Items": [{"id": {"S": "a"}, "points": {"N": "5"}}], "LastEvaluatedKey": {"id": {"S": "a"}}}
+            if kwargs["Segment"] == 0:
+                return {"Items": [{"id": {"S": "b"}, "tags": {"L": [{"BOOL": True}]}}]}
+            return {"Items": []}
+
+        mock_client.scan.side_effect = scan
+
+        items = crud.client_scan(crud.STORE_ITEMS_TABLE_NAME, total_segments=2)
+
+        assert items == [{"id": "a", "points": Decimal("5")}, {"id": "b", "tags": [True]}]
+        assert {call[1]["TableName"] for call in mock_client.scan.call_args_list} == {crud.STORE_ITEMS_TABLE_NAME}
+
+
+class TestListProjections:
+    """List reads fetch only the attributes their model declares."""
+
+    @patch("crud.client_scan")
+    def test_user_listing_never_reads_credentials(self, mock_scan):
+        mock_scan.return_value = [_user_item("kid-a")]
+
+        users = crud.get_all_users()
+
+        kwargs = mock_scan.call_args[1]
+        assert set(kwargs["ExpressionAttributeNames"].values()) == {"username", "role", "id", "points"}
+        assert not hasattr(users[0], "hashed_password")
+
+    @patch("crud.logger")
+    @patch("crud.client_scan")
+    def test_user_listing_skips_the_debug_dump_unless_enabled(self, mock_scan, mock_logger):
+        mock_scan.return_value = [_user_item("kid-a")]
+        mock_logger.isEnabledFor.return_value = False
+
+        crud.get_all_users()
+
+        mock_logger.debug.assert_not_called()
+
+    @patch("crud.purchase_logs_table")
+    def test_purchase_log_query_projects_model_fields(self, mock_table):
+        mock_table.query.return_value = {"Items": []}
+
+        crud.get_purchase_logs_by_status(models.PurchaseStatus.PENDING)
+
+        kwargs = mock_table.query.call_args[1]
+        assert "gsi_pk" not in kwargs["ExpressionAttributeNames"].values()
+        assert kwargs["ProjectionExpression"].split(", ") == list(kwargs["ExpressionAttributeNames"])
+
+    @patch("crud.ddb_client")
+    def test_user_lookup_projects_model_fields(self, mock_client):
+        mock_client.get_item.return_value = {"Item": _wire_user_item("kid-a")}
+
+        crud.get_user_by_username("kid-a")
+
+        kwargs = mock_client.get_item.call_args[1]
+        assert set(kwargs["ExpressionAttributeNames"].values()) == set(models.User.model_fields)
+
+    @patch("crud.pets_table")
+    def test_pet_query_projects_model_fields(self, mock_table):
+        mock_table.query.return_value = {"Items": [_pet().model_dump(mode="json")]}
+
+        pets = crud.get_pets_by_parent_id("parent-1")
+
+        kwargs = mock_table.query.call_args[1]
+        assert set(kwargs["ExpressionAttributeNames"].values()) == set(models.Pet.model_fields)
+        assert pets[0].name == "Spike"
+
+
+class TestResponseParsing:
+    """DynamoDB item maps skip botocore's per-attribute parsing but parse to the same result."""
+
+    def _get_item_response(self):
+        body = b'{"Item": {"points": {"N": "5"}, "tags": {"L": [{"S": "a"}, {"BOOL": true}]}, "meta": {"M": {}}}}'
+        shape = crud.dynamodb.meta.client.meta.service_model.operation_model("GetItem").output_shape
+        return {"status_code": 200, "headers": {}, "body": body}, shape
+
+    def test_item_matches_the_stock_parser(self):
+        response, shape = self._get_item_response()
+
+        parsed = crud._DynamoDBResponseParserFactory().create_parser("json").parse(response, shape)
+
+        assert parsed["Item"] == JSONParser().parse(response, shape)["Item"]
+
+    def test_attribute_map_is_returned_untouched(self):
+        _, shape = self._get_item_response()
+        item = {"points": {"N": "5"}}
+
+        parser = crud._DynamoDBResponseParserFactory().create_parser("json")
+
+        assert parser._handle_map(shape.members["Item"], item) is item
+
+
+class TestDecimalConversion:
+    """replace_decimals / prepare_item_for_dynamodb walk nested items without recursion."""
+
+    def test_replace_decimals_converts_nested_numbers(self):
+        item = {"points": Decimal("10"), "nested": [Decimal("1.5"), {"whole": Decimal("2.0"), "name": "x"}]}
+
+        result = crud.replace_decimals(item)
+
+        assert result == {"points": 10, "nested": [1.5, {"whole": 2, "name": "x"}]}
+        assert isinstance(result["nested"][1]["whole"], int)
+        assert item["points"] == Decimal("10")  # input is left untouched
+
+    def test_replace_decimals_handles_deep_nesting(self):
+        item = Decimal("1")
+        for _ in range(5000):
+            item = [item]
+
+        result = crud.replace_decimals(item)
+
+        for _ in range(5000):
+            result = result[0]
+        assert result == 1
+
+    def test_prepare_item_drops_none_and_keeps_booleans(self):
+        item = {"points": 5, "ratio": 0.5, "missing": None, "details": {"flag": True, "items": [1, None]}}
+
+        assert crud.prepare_item_for_dynamodb(item) == {
+            "points": Decimal("5"),
+            "ratio": Decimal("0.5"),
+            "details": {"flag": True, "items": [Decimal("1")]},
+        }
+
+    def test_prepare_item_converts_ints_exactly_and_floats_via_str(self):
+        assert crud.prepare_item_for_dynamodb({"big": 2**60 + 1, "tenth": 0.1, "flag": False}) == {
+            "big": Decimal("1152921504606846977"),
+            "tenth": Decimal("0.1"),
+            "flag": False,
+        }
+        assert crud.prepare_item_for_dynamodb(True) is True
+
+
+def _chore_item(chore_id):
+    return {
+        "id": chore_id,
+        "name": "Chore",
+        "points_value": Decimal(5),
+        "created_by_parent_id": "parent-1",
+        "created_at": "2025-01-01T00:00:00",
+        "updated_at": "2025-01-01T00:00:00",
+        "is_active": True,
+        "is_active_pk": "ACTIVE",
+    }
+
+
+class TestActiveChores:
+    """Active chores are read from the ActiveChoresIndex instead of a full scan."""
+
+    def setup_method(self):
+        crud.clear_chore_cache()
+
+    @patch("crud.chores_table")
+    def test_queries_the_active_index_across_pages(self, mock_table):
+        mock_table.query.side_effect = [
+            {"Items": [_chore_item("c1")], "LastEvaluatedKey": {"id": "c1"}},
+            {"Items": [_chore_item("c2")]},
+        ]
+
+        chores = crud.get_all_active_chores()
+
+        assert [chore.id for chore in chores] == ["c1", "c2"]
+        assert mock_table.query.call_args_list[0][1]["IndexName"] == "ActiveChoresIndex"
+        assert mock_table.query.call_args_list[1][1]["ExclusiveStartKey"] == {"id": "c1"}
+        mock_table.scan.assert_not_called()
+
+    @patch("crud.parallel_scan")
+    @patch("crud.chores_table")
+    def test_missing_index_falls_back_to_a_scan_that_keeps_legacy_rows(self, mock_table, mock_scan):
+        # Real DynamoDB reports a missing GSI as a ValidationException, not ResourceNotFoundException
+        mock_table.query.side_effect = ClientError(
+            {"Error": {"Code": "ValidationException", "Message": "The table does not have the specified index"}},
+            "Query",
+        )
+        mock_scan.return_value = [{**_chore_item("c1"), "is_active": "true"}]
+
+        chores = crud.get_all_active_chores()
+
+        assert [chore.is_active for chore in chores] == [True]
+        filter_values = mock_scan.call_args[1]["FilterExpression"].get_expression()["values"]
+        assert filter_values[1] == [True, "true"]
+
+    @patch("crud.chores_table")
+    def test_create_stores_a_boolean_and_joins_the_active_index(self, mock_table):
+        chore = crud.create_chore(models.ChoreCreate(name="Dishes", points_value=5), "parent-1")
+
+        item = mock_table.put_item.call_args[1]["Item"]
+        assert item["is_active"] is True
+        assert item["is_active_pk"] == crud.ACTIVE_CHORES_PARTITION
+        assert chore.is_active is True
+
+    @patch("crud.chores_table")
+    def test_deactivate_stores_false_and_leaves_the_active_index(self, mock_table):
+        mock_table.update_item.return_value = {"Attributes": {**_chore_item("c1"), "is_active": False}}
+
+        chore = crud.deactivate_chore("c1", "parent-1")
+
+        kwargs = mock_table.update_item.call_args[1]
+        assert kwargs["ExpressionAttributeValues"][":ia"] is False
+        assert kwargs["UpdateExpression"].endswith("REMOVE is_active_pk")
+        assert chore.is_active is False
+
+
+def _chore_log_item(log_id, chore_id):
+    return {
+        "id": log_id,
+        "chore_id": chore_id,
+        "chore_name": "Chore",
+        "kid_id": "kid-a",
+        "kid_username": "kid-a",
+        "points_value": Decimal(5),
+        "status": "pending_approval",
+        "submitted_at": "2025-01-01T00:00:00",
+    }
+
+
+def _index_missing():
+    return ClientError({"Error": {"Code": "ResourceNotFoundException", "Message": "no index"}}, "Query")
+
+
+class TestChoreLogsForParent:
+    """A parent's chore logs come from ParentStatusIndex, or one batched chore lookup without it."""
+
+    @patch("crud.dynamodb")
+    @patch("crud.chore_logs_table")
+    def test_queries_the_parent_status_index_newest_first(self, mock_logs_table, mock_dynamodb):
+        mock_logs_table.query.side_effect = [
+            {"Items": [{**_chore_log_item("l2", "c1"), "created_by_parent_id": "parent-1"}], "LastEvaluatedKey": {}},
+            {"Items": [{**_chore_log_item("l1", "c1"), "created_by_parent_id": "parent-1"}]},
+        ]
+
+        logs = crud.get_chore_logs_by_status_for_parent(models.ChoreStatus.PENDING_APPROVAL, "parent-1")
+
+        assert [log.id for log in logs] == ["l2", "l1"]
+        first_call = mock_logs_table.query.call_args_list[0][1]
+        assert first_call["IndexName"] == "ParentStatusIndex"
+        assert first_call["ScanIndexForward"] is False
+        assert set(first_call["ExpressionAttributeNames"].values()) >= set(models.ChoreLog.model_fields)
+        mock_dynamodb.batch_get_item.assert_not_called()
+
+    @patch("crud.dynamodb")
+    @patch("crud.chore_logs_table")
+    def test_without_the_index_filters_by_parent_with_one_projected_batch_get(self, mock_logs_table, mock_dynamodb):
+        mock_logs_table.query.side_effect = [
+            _index_missing(),
+            {
+                "Items": [
+                    _chore_log_item("l1", "c1"),
+                    _chore_log_item("l2", "c2"),
+                    _chore_log_item("l3", "c1"),
+                    {**_chore_log_item("l4", "c3"), "created_by_parent_id": "parent-1"},
+                ]
+            },
+        ]
+        mock_dynamodb.batch_get_item.return_value = {
+            "Responses": {
+                crud.CHORES_TABLE_NAME: [
+                    {"id": "c1", "created_by_parent_id": "parent-1"},
+                    {"id": "c2", "created_by_parent_id": "parent-2"},
+                ]
+            }
+        }
+
+        logs = crud.get_chore_logs_by_status_for_parent(models.ChoreStatus.PENDING_APPROVAL, "parent-1")
+
+        assert [log.id for log in logs] == ["l1", "l3", "l4"]
+        assert mock_logs_table.query.call_args_list[1][1]["IndexName"] == "ChoreLogStatusIndex"
+        mock_dynamodb.batch_get_item.assert_called_once()
+        request = mock_dynamodb.batch_get_item.call_args[1]["RequestItems"][crud.CHORES_TABLE_NAME]
+        assert request["Keys"] == [{"id": "c1"}, {"id": "c2"}]  # c3's log already carries its parent
+        assert request["ProjectionExpression"] == "id, created_by_parent_id"
+
+    @patch("crud.dynamodb")
+    @patch("crud.chore_logs_table")
+    def test_no_logs_skips_the_chore_lookup(self, mock_logs_table, mock_dynamodb):
+        mock_logs_table.query.side_effect = [_index_missing(), {"Items": []}]
+
+        assert crud.get_chore_logs_by_status_for_parent(models.ChoreStatus.PENDING_APPROVAL, "parent-1") == []
+        mock_dynamodb.batch_get_item.assert_not_called()
+
+    @patch("crud.get_chore_by_id")
+    @patch("crud.chore_logs_table")
+    def test_submission_stores_the_chore_parent_and_status_sort_key(self, mock_table, mock_get_chore):
+        mock_get_chore.return_value = models.Chore(**crud.replace_decimals(_chore_item("c1")))
+        mock_table.query.return_value = {"Count": 0}
+        kid = models.User(id="kid-a", username="kid-a", role=models.UserRole.KID, hashed_password="x", points=0)
+
+        log = crud.create_chore_log_submission("c1", kid)
+
+        item = mock_table.put_item.call_args[1]["Item"]
+        assert item["created_by_parent_id"] == "parent-1"
+        assert item["status_submitted_at"] == f"pending_approval#{item['submitted_at']}"
+        assert log.created_by_parent_id == "parent-1"
+
+
+class TestKidChoreHistory:
+    """A kid's chore logs and approved assignments are queried concurrently and merged newest-first."""
+
+    @patch("crud._thread_table")
+    @patch("crud.chore_logs_table")
+    def test_merges_logs_and_approved_assignments(self, mock_logs_table, mock_thread_table):
+        mock_logs_table.query.return_value = {"Items": [_chore_log_item("l1", "c1")]}
+        mock_thread_table.return_value.query.return_value = {
+            "Items": [
+                {
+                    "id": "a1",
+                    "chore_id": "c2",
+                    "assigned_to_kid_id": "kid-a",
+                    "due_date": "2025-01-01T00:00:00",
+                    "assigned_by_parent_id": "parent-1",
+                    "chore_name": "Chore",
+                    "kid_username": "kid-a",
+                    "points_value": Decimal(3),
+                    "assignment_status": "approved",
+                    "reviewed_at": "2025-02-01T00:00:00",
+                }
+            ]
+        }
+
+        logs = crud.get_chore_logs_by_kid_id("kid-a")
+
+        assert [log.id for log in logs] == ["assignment_a1", "l1"]
+        mock_thread_table.assert_called_once_with(crud.CHORE_ASSIGNMENTS_TABLE_NAME)
+        query_kwargs = mock_thread_table.return_value.query.call_args[1]
+        assert query_kwargs["IndexName"] == "KidAssignmentsByStatusIndex"
+        assert "FilterExpression" not in query_kwargs
+
+    @patch("crud._thread_table")
+    @patch("crud.chore_logs_table")
+    def test_filters_assignments_by_status_without_the_status_index(self, mock_logs_table, mock_thread_table):
+        mock_logs_table.query.return_value = {"Items": []}
+        assignments_table = mock_thread_table.return_value
+        assignments_table.query.side_effect = [_index_missing(), {"Items": []}]
+
+        assert crud.get_chore_logs_by_kid_id("kid-a") == []
+        query_kwargs = assignments_table.query.call_args[1]
+        assert query_kwargs["IndexName"] == "KidAssignmentsIndex"
+        assert "FilterExpression" in query_kwargs
+
+
+class TestIterQuery:
+    """List reads follow LastEvaluatedKey instead of stopping at the first 1 MB page."""
+
+    @patch("crud.chore_logs_table")
+    def test_kid_chore_logs_read_every_page(self, mock_table):
+        mock_table.query.side_effect = [
+            {"Items": [_chore_log_item("l2", "c1")], "LastEvaluatedKey": {"id": "l2"}},
+            {"Items": [_chore_log_item("l1", "c1")]},
+        ]
+
+        logs = crud._chore_logs_for_kid("kid-a")
+
+        assert [log.id for log in logs] == ["l2", "l1"]
+        assert mock_table.query.call_args_list[1][1]["ExclusiveStartKey"] == {"id": "l2"}
+
+    def test_pages_are_requested_lazily(self):
+        table = MagicMock()
+        table.query.side_effect = [{"Items": [{"id": "a"}], "LastEvaluatedKey": {"id": "a"}}, {"Items": [{"id": "b"}]}]
+
+        items = crud.iter_query(table, IndexName="Index")
+
+        assert next(items) == {"id": "a"}
+        assert table.query.call_count == 1
+        assert list(items) == [{"id": "b"}]
+
+
+class TestScanFallbacks:
+    """The GSI fallback scans read their table as parallel segments."""
+
+    @patch("crud.parallel_scan")
+    def test_chore_log_fallback_uses_parallel_scan(self, mock_parallel_scan):
+        mock_parallel_scan.return_value = [_chore_log_item("l1", "c1")]
+
+        logs = crud.get_all_chore_logs_scan_fallback()
+
+        assert [log.id for log in logs] == ["l1"]
+        assert mock_parallel_scan.call_args[0] == (crud.chore_logs_table,)
+        assert "FilterExpression" not in mock_parallel_scan.call_args[1]
+
+    @patch("crud.parallel_scan")
+    def test_assignment_fallback_uses_parallel_scan(self, mock_parallel_scan):
+        mock_parallel_scan.return_value = []
+
+        assert crud.get_all_assignments_scan_fallback() == []
+        assert mock_parallel_scan.call_args[0] == (crud.chore_assignments_table,)
+
+    @patch("crud.parallel_scan")
+    def test_all_pet_care_tasks_use_parallel_scan(self, mock_parallel_scan):
+        mock_parallel_scan.return_value = [_pending_pet_care_task().model_dump(mode="json")]
+
+        assert [task.id for task in crud.get_all_pet_care_tasks()] == ["t1"]
+        assert mock_parallel_scan.call_args[0] == (crud.pet_care_tasks_table,)
+
+    @patch("crud.parallel_scan")
+    @patch("crud.pet_care_tasks_table")
+    def test_pet_task_fallback_filters_server_side(self, mock_table, mock_parallel_scan):
+        mock_table.query.side_effect = _index_missing()
+        mock_parallel_scan.return_value = []
+
+        assert crud.get_tasks_by_kid_id("kid-a") == []
+        assert mock_parallel_scan.call_args[0] == (crud.pet_care_tasks_table,)
+        assert mock_parallel_scan.call_args[1]["FilterExpression"] == crud._A_ASSIGNED_TO_KID_ID.eq("kid-a")
+
+    @patch("crud.parallel_scan")
+    @patch("crud.chore_logs_table")
+    def test_kid_fallback_filters_server_side_and_projects_the_model(self, mock_table, mock_parallel_scan):
+        mock_table.query.side_effect = _index_missing()
+        mock_parallel_scan.return_value = [_chore_log_item("l1", "c1")]
+
+        logs = crud._chore_logs_for_kid("kid-a")
+
+        assert [log.id for log in logs] == ["l1"]
+        kwargs = mock_parallel_scan.call_args[1]
+        assert kwargs["FilterExpression"] == crud._A_KID_ID.eq("kid-a")
+        assert set(kwargs["ExpressionAttributeNames"].values()) == set(models.ChoreLog.model_fields)
+
+
+class TestStoreItemsCache:
+    """The store listing is reused for a short TTL and dropped by store item writes."""
+
+    def setup_method(self):
+        crud.clear_store_items_cache()
+
+    def teardown_method(self):
+        crud.clear_store_items_cache()
+
+    @patch("crud.store_items_table")
+    @patch("crud.client_scan")
+    def test_listing_is_cached_until_a_store_item_write(self, mock_scan, mock_table):
+        mock_scan.return_value = [{"id": "s1", "name": "Toy", "points_cost": Decimal(10)}]
+
+        crud.get_store_items()
+        items = crud.get_store_items()
+        items.clear()  # Callers get their own list
+        assert [item.id for item in crud.get_store_items()] == ["s1"]
+        assert mock_scan.call_count == 1
+
+        crud.delete_store_item("s1")
+        crud.get_store_items()
+        assert mock_scan.call_count == 2
+
+    @patch("crud.store_items_table")
+    @patch("crud.client_scan")
+    def test_listing_during_the_write_does_not_re_cache_the_old_catalog(self, mock_scan, mock_table):
+        mock_scan.return_value = [{"id": "s1", "name": "Toy", "points_cost": Decimal(10)}]
+        mock_table.delete_item.side_effect = lambda **kwargs: crud.get_store_items()
+
+        crud.delete_store_item("s1")
+        mock_scan.return_value = []
+
+        assert crud.get_store_items() == []
+
+
+class TestChoreCache:
+    """Chore lookups are served from a short-lived process cache that writes invalidate."""
+
+    def setup_method(self):
+        crud.clear_chore_cache()
+
+    def teardown_method(self):
+        crud.clear_chore_cache()
+
+    @patch("crud.chores_table")
+    def test_repeat_lookups_hit_the_cache(self, mock_table):
+        mock_table.get_item.return_value = {"Item": _chore_item("c1")}
+
+        first = crud.get_chore_by_id("c1")
+        second = crud.get_chore_by_id("c1")
+
+        assert first is second
+        mock_table.get_item.assert_called_once()
+
+    @patch("crud.chores_table")
+    def test_updates_invalidate_the_cached_chore(self, mock_table):
+        mock_table.get_item.return_value = {"Item": _chore_item("c1")}
+        mock_table.update_item.return_value = {"Attributes": {**_chore_item("c1"), "is_active": False}}
+
+        crud.get_chore_by_id("c1")
+        crud.deactivate_chore("c1", "parent-1")
+        crud.get_chore_by_id("c1")
+
+        assert mock_table.get_item.call_count == 2
+
+    @patch("crud.chores_table")
+    def test_read_during_the_write_does_not_re_cache_the_old_row(self, mock_table):
+        mock_table.get_item.return_value = {"Item": _chore_item("c1")}
+
+        def update_item(**kwargs):
+            crud.get_chore_by_id("c1")  # A concurrent reader caches the pre-write row
+            return {"Attributes": {**_chore_item("c1"), "points_value": Decimal(9)}}
+
+        mock_table.update_item.side_effect = update_item
+        chore_in = models.ChoreCreate(name="Chore", points_value=9)
+
+        crud.update_chore("c1", chore_in, "parent-1")
+        mock_table.get_item.return_value = {"Item": {**_chore_item("c1"), "points_value": Decimal(9)}}
+
+        assert crud.get_chore_by_id("c1").points_value == 9
+
+    @patch("crud.time.monotonic")
+    @patch("crud.chores_table")
+    def test_entries_expire_after_the_ttl(self, mock_table, mock_monotonic):
+        mock_table.get_item.return_value = {"Item": _chore_item("c1")}
+        mock_monotonic.return_value = 1000.0
+        crud.get_chore_by_id("c1")
+
+        mock_monotonic.return_value = 1000.0 + crud.CHORE_CACHE_TTL_SECONDS
+        crud.get_chore_by_id("c1")
+
+        assert mock_table.get_item.call_count == 2
+
+    @patch("crud.chores_table")
+    def test_active_listing_is_reused_until_a_chore_is_created(self, mock_table):
+        mock_table.query.return_value = {"Items": [_chore_item("c1")]}
+
+        crud.get_all_active_chores()
+        chores = crud.get_all_active_chores()
+        chores.clear()  # Callers get their own list
+        crud.create_chore(models.ChoreCreate(name="Dishes", points_value=5), "parent-1")
+
+        assert [chore.id for chore in crud.get_all_active_chores()] == ["c1"]
+        assert mock_table.query.call_count == 2
+
+    @patch("crud.dynamodb")
+    @patch("crud.chores_table")
+    def test_parent_lookup_only_batches_uncached_chores(self, mock_table, mock_dynamodb):
+        mock_table.get_item.return_value = {"Item": _chore_item("c1")}
+        crud.get_chore_by_id("c1")
+        mock_dynamodb.batch_get_item.return_value = {
+            "Responses": {crud.CHORES_TABLE_NAME: [{"id": "c2", "created_by_parent_id": "parent-2"}]}
+        }
+
+        parent_ids = crud.get_chore_parent_ids(["c1", "c2"])
+
+        assert parent_ids == {"c1": "parent-1", "c2": "parent-2"}
+        request = mock_dynamodb.batch_get_item.call_args[1]["RequestItems"][crud.CHORES_TABLE_NAME]
+        assert request["Keys"] == [{"id": "c2"}]
+
+
+def _request_item(request_id, created_at):
+    return {
+        "id": request_id,
+        "requester_id": "kid-a",
+        "requester_username": "kid-a",
+        "request_type": "other",
+        "details": {"message": "hi"},
+        "status": "pending",
+        "created_at": created_at,
+    }
+
+
+class TestRequestQueries:
+    """Feature requests are read from their created_at-sorted GSIs instead of a filtered scan."""
+
+    @patch("crud.requests_table")
+    def test_status_queries_the_index_newest_first_across_pages(self, mock_table):
+        mock_table.query.side_effect = [
+            {"Items": [_request_item("r2", "2025-01-02T00:00:00")], "LastEvaluatedKey": {"id": "r2"}},
+            {"Items": [_request_item("r1", "2025-01-01T00:00:00")]},
+        ]
+
+        requests = crud.get_requests_by_status(models.RequestStatus.PENDING)
+
+        assert [request.id for request in requests] == ["r2", "r1"]
+        first_call = mock_table.query.call_args_list[0][1]
+        assert first_call["IndexName"] == "StatusCreatedAtGSI"
+        assert first_call["ScanIndexForward"] is False
+        assert mock_table.query.call_args_list[1][1]["ExclusiveStartKey"] == {"id": "r2"}
+        mock_table.scan.assert_not_called()
+
+    @patch("crud.parallel_scan")
+    @patch("crud.requests_table")
+    def test_requester_falls_back_to_a_sorted_scan_without_the_index(self, mock_table, mock_parallel_scan):
+        mock_table.query.side_effect = ClientError(
+            {"Error": {"Code": "ResourceNotFoundException", "Message": "no index"}}, "Query"
+        )
+        mock_parallel_scan.return_value = [
+            _request_item("r1", "2025-01-01T00:00:00"),
+            _request_item("r2", "2025-01-02T00:00:00"),
+        ]
+
+        requests = crud.get_requests_by_requester_id("kid-a")
+
+        assert mock_table.query.call_args[1]["IndexName"] == "RequesterIdCreatedAtGSI"
+        assert [request.id for request in requests] == ["r2", "r1"]
+
+
+def _purchase_log_item(log_id, timestamp):
+    return {
+        "id": log_id,
+        "user_id": "kid-a",
+        "username": "kid-a",
+        "item_id": "item-1",
+        "item_name": "Toy",
+        "points_spent": Decimal(5),
+        "timestamp": timestamp,
+        "status": "pending",
+        "gsi_pk": "ALL",
+    }
+
+
+class TestAllPurchaseLogs:
+    """All purchase logs come back newest-first from the AllLogsByTimestamp index."""
+
+    @patch("crud.purchase_logs_table")
+    def test_queries_the_timestamp_index_newest_first(self, mock_table):
+        mock_table.query.side_effect = [
+            {"Items": [_purchase_log_item("p2", "2025-01-02T00:00:00")], "LastEvaluatedKey": {"id": "p2"}},
+            {"Items": [_purchase_log_item("p1", "2025-01-01T00:00:00")]},
+        ]
+
+        logs = crud.get_all_purchase_logs()
+
+        assert [log.id for log in logs] == ["p2", "p1"]
+        first_call = mock_table.query.call_args_list[0][1]
+        assert first_call["IndexName"] == "AllLogsByTimestamp"
+        assert first_call["ScanIndexForward"] is False
+        assert "FilterExpression" not in first_call
+        assert mock_table.query.call_args_list[1][1]["ExclusiveStartKey"] == {"id": "p2"}
+        mock_table.scan.assert_not_called()
+
+    @patch("crud.purchase_logs_table")
+    def test_limit_pages_by_size_and_stops_once_enough_logs_are_read(self, mock_table):
+        mock_table.query.side_effect = [
+            {"Items": [_purchase_log_item("p3", "2025-01-03T00:00:00")], "LastEvaluatedKey": {"id": "p3"}},
+            {"Items": [_purchase_log_item("p2", "2025-01-02T00:00:00")], "LastEvaluatedKey": {"id": "p2"}},
+            {"Items": [_purchase_log_item("p1", "2025-01-01T00:00:00")]},
+        ]
+
+        logs = crud.get_all_purchase_logs(limit=2)
+
+        assert [log.id for log in logs] == ["p3", "p2"]
+        assert mock_table.query.call_args_list[0][1]["Limit"] == 2
+        assert mock_table.query.call_count == 2
+
+    @patch("crud.purchase_logs_table")
+    def test_get_by_id_parses_the_stored_iso_timestamp(self, mock_table):
+        mock_table.get_item.return_value = {"Item": _purchase_log_item("p1", "2025-01-02T03:04:05.123456")}
+
+        log = crud.get_purchase_log_by_id("p1")
+
+        assert log.timestamp == datetime(2025, 1, 2, 3, 4, 5, 123456)
+
+    @patch("crud.purchase_logs_table")
+    def test_create_sets_the_index_partition_key(self, mock_table):
+        log_in = models.PurchaseLogCreate(
+            user_id="kid-a", username="kid-a", item_id="item-1", item_name="Toy", points_spent=5
+        )
+
+        crud.create_purchase_log(log_in)
+
+        assert mock_table.put_item.call_args[1]["Item"]["gsi_pk"] == crud.PURCHASE_LOGS_ALL_PARTITION
+
+
+def _condition_failed(existing_item=None):
+    response = {"Error": {"Code": "ConditionalCheckFailedException", "Message": "failed"}}
+    if existing_item is not None:
+        response["Item"] = existing_item
+    return ClientError(response, "UpdateItem")
+
+
+class TestRequestReview:
+    """Reviewing a request is one conditional update; the condition failure distinguishes no-ops from misses."""
+
+    @patch("crud.create_chore")
+    @patch("crud.requests_table")
+    def test_approval_updates_without_a_pre_read_and_creates_the_chore(self, mock_table, mock_create_chore):
+        item = _request_item("r1", "2025-01-01T00:00:00")
+        item.update(request_type="add_chore", details={"name": "Dishes", "points_value": Decimal(4)}, status="approved")
+        mock_table.update_item.return_value = {"Attributes": item}
+
+        request = crud.update_request_status("r1", models.RequestStatus.APPROVED, "parent-1")
+
+        assert request.status == models.RequestStatus.APPROVED
+        mock_table.get_item.assert_not_called()
+        assert mock_table.update_item.call_args[1]["ConditionExpression"] == "attribute_exists(id) AND #s <> :s"
+        assert mock_create_chore.call_args[1]["chore_in"].points_value == 4
+        assert mock_create_chore.call_args[1]["chore_id"] == "request_r1"
+
+    @patch("crud.create_chore")
+    @patch("crud.requests_table")
+    def test_reapproval_retries_the_idempotent_creation(self, mock_table, mock_create_chore):
+        item = _request_item("r1", "2025-01-01T00:00:00")
+        item.update(request_type="add_chore", details={"name": "Dishes", "points_value": 4}, status="approved")
+        # Condition failures carry ALL_OLD in the low-level wire format
+        mock_table.update_item.side_effect = _condition_failed(
+            {k: TypeSerializer().serialize(v) for k, v in item.items()}
+        )
+
+        request = crud.update_request_status("r1", models.RequestStatus.APPROVED, "parent-1")
+
+        assert request.id == "r1"
+        assert mock_create_chore.call_args[1]["chore_id"] == "request_r1"
+
+    @patch("crud.requests_table")
+    def test_missing_request_returns_none(self, mock_table):
+        mock_table.update_item.side_effect = _condition_failed()
+
+        assert crud.update_request_status("r1", models.RequestStatus.REJECTED, "parent-1") is None
+
+
+class TestIdempotentCreates:
+    """A caller-chosen id makes creating a store item or chore a no-op the second time."""
+
+    @patch("crud.store_items_table")
+    def test_existing_store_item_is_not_an_error(self, mock_table):
+        mock_table.put_item.side_effect = _condition_failed()
+
+        item = crud.create_store_item(models.StoreItemCreate(name="Toy", points_cost=10), item_id="request_r1")
+
+        assert item.id == "request_r1"
+        assert mock_table.put_item.call_args[1]["ConditionExpression"] == "attribute_not_exists(id)"
+
+
+class TestWriteExistenceConditions:
+    """User and store item updates check existence in the write's condition instead of pre-reading."""
+
+    @patch("crud.get_user_by_username")
+    @patch("crud.users_table")
+    def test_promoting_an_existing_parent_returns_it_without_a_pre_read(self, mock_table, mock_get_user):
+        parent_item = {**_user_item("mom"), "role": "parent"}
+        mock_table.update_item.side_effect = _condition_failed(
+            {k: TypeSerializer().serialize(v) for k, v in parent_item.items()}
+        )
+
+        user = crud.promote_user_to_parent("mom")
+
+        assert user.role == models.UserRole.PARENT
+        mock_get_user.assert_not_called()
+
+    @patch("crud.store_items_table")
+    def test_updating_a_missing_store_item_does_not_create_it(self, mock_table):
+        mock_table.update_item.side_effect = _condition_failed()
+
+        assert crud.update_store_item("s1", models.StoreItemCreate(name="Toy", points_cost=10)) is None
+        assert mock_table.update_item.call_args[1]["ConditionExpression"] == "attribute_exists(id)"
+
+
+class TestChoreOwnershipConditions:
+    """Chore mutations rely on the write's condition instead of pre-reading the chore."""
+
+    @patch("crud.get_chore_by_id")
+    @patch("crud.chores_table")
+    def test_missing_chore_returns_none_without_a_pre_read(self, mock_table, mock_get_chore):
+        mock_table.update_item.side_effect = _condition_failed()
+
+        result = crud.update_chore("missing", models.ChoreCreate(name="Dishes", points_value=5), "parent-1")
+
+        assert result is None
+        mock_get_chore.assert_not_called()
+        assert mock_table.update_item.call_args[1]["ReturnValuesOnConditionCheckFailure"] == "ALL_OLD"
+
+    @patch("crud.chores_table")
+    def test_other_parents_chore_is_forbidden(self, mock_table):
+        mock_table.delete_item.side_effect = _condition_failed({"id": {"S": "c1"}})
+
+        with pytest.raises(HTTPException) as exc_info:
+            crud.delete_chore("c1", "parent-2")
+
+        assert exc_info.value.status_code == 403
+
+
+def _parent(user_id="parent-1"):
+    return models.User(id=user_id, username=user_id, role=models.UserRole.PARENT, hashed_password="x")
+
+
+class TestChoreLogReview:
+    """Reviews write with a pending-status condition so a concurrent review can't be overwritten."""
+
+    @patch("crud.get_chore_by_id")
+    @patch("crud.chore_logs_table")
+    def test_reject_is_conditional_on_pending_and_chore(self, mock_table, mock_get_chore):
+        mock_table.get_item.return_value = {"Item": _chore_log_item("l1", "c1")}
+        mock_get_chore.return_value = models.Chore(**crud.replace_decimals(_chore_item("c1")))
+        mock_table.update_item.return_value = {"Attributes": {**_chore_log_item("l1", "c1"), "status": "rejected"}}
+
+        log = crud.update_chore_log_status("l1", models.ChoreStatus.REJECTED, _parent())
+
+        assert log.status == models.ChoreStatus.REJECTED
+        kwargs = mock_table.update_item.call_args[1]
+        assert kwargs["ConditionExpression"] == "#s = :pending AND chore_id = :cid"
+        assert kwargs["ExpressionAttributeValues"][":cid"] == "c1"
+        assert kwargs["ReturnValuesOnConditionCheckFailure"] == "ALL_OLD"
+
+    @patch("crud.get_chore_by_id")
+    @patch("crud.chore_logs_table")
+    def test_denormalized_parent_skips_the_chore_lookup(self, mock_table, mock_get_chore):
+        log_item = {**_chore_log_item("l1", "c1"), "created_by_parent_id": "parent-1"}
+        mock_table.get_item.return_value = {"Item": log_item}
+        mock_table.update_item.return_value = {"Attributes": {**log_item, "status": "rejected"}}
+
+        crud.update_chore_log_status("l1", models.ChoreStatus.REJECTED, _parent())
+
+        mock_get_chore.assert_not_called()
+        values = mock_table.update_item.call_args[1]["ExpressionAttributeValues"]
+        assert values[":ssa"] == "rejected#2025-01-01T00:00:00"
+
+        with pytest.raises(HTTPException) as exc_info:
+            crud.update_chore_log_status("l1", models.ChoreStatus.REJECTED, _parent("parent-2"))
+        assert exc_info.value.status_code == 403
+
+    @patch("crud.get_chore_by_id")
+    @patch("crud.chore_logs_table")
+    def test_reject_losing_a_race_is_a_bad_request(self, mock_table, mock_get_chore):
+        mock_table.get_item.return_value = {"Item": _chore_log_item("l1", "c1")}
+        mock_get_chore.return_value = models.Chore(**crud.replace_decimals(_chore_item("c1")))
+        mock_table.update_item.side_effect = _condition_failed({"id": {"S": "l1"}})
+
+        with pytest.raises(HTTPException) as exc_info:
+            crud.update_chore_log_status("l1", models.ChoreStatus.REJECTED, _parent())
+
+        assert exc_info.value.status_code == 400
+
+
+class TestUpdateUserPoints:
+    """Points are added atomically in a single conditional UpdateItem."""
+
+    @patch("crud.get_user_by_username")
+    @patch("crud.ddb_client")
+    def test_adds_points_without_reading_first(self, mock_client, mock_get_user):
+        mock_client.update_item.return_value = {"Attributes": _wire_user_item("kid-a", points=15)}
+
+        user = crud.update_user_points("kid-a", 5)
+
+        assert user.points == 15
+        mock_get_user.assert_not_called()
+        kwargs = mock_client.update_item.call_args[1]
+        assert kwargs["TableName"] == crud.USERS_TABLE_NAME
+        assert kwargs["Key"] == {"username": {"S": "kid-a"}}
+        assert kwargs["UpdateExpression"] == "ADD points :p"
+        assert kwargs["ExpressionAttributeValues"][":p"] == {"N": "5"}
+
+    @patch("crud.ddb_client")
+    def test_missing_or_non_kid_user_returns_none(self, mock_table):
+        mock_table.update_item.side_effect = _condition_failed()
+
+        assert crud.update_user_points("parent-1", 5) is None
+
+
+def _transaction_cancelled(*codes):
+    return ClientError(
+        {
+            "Error": {"Code": "TransactionCanceledException", "Message": "cancelled"},
+            "CancellationReasons": [{"Code": code} for code in codes],
+        },
+        "TransactWriteItems",
+    )
+
+
+def _purchase_log(points_spent=7):
+    return models.PurchaseLog(
+        id="p1", user_id="kid-a", username="kid-a", item_id="item-1", item_name="Toy", points_spent=points_spent
+    )
+
+
+class TestApprovePurchase:
+    """Purchase approval deducts points and updates the log in one TransactWriteItems call."""
+
+    @patch("crud.dynamodb")
+    def test_deducts_points_and_approves_in_one_transaction(self, mock_dynamodb):
+        approved = crud.approve_purchase(_purchase_log())
+
+        assert approved.status == models.PurchaseStatus.APPROVED
+        items = mock_dynamodb.meta.client.transact_write_items.call_args[1]["TransactItems"]
+        assert items[0]["Update"]["TableName"] == crud.PURCHASE_LOGS_TABLE_NAME
+        points_update = items[1]["Update"]
+        assert points_update["Key"] == {"username": "kid-a"}
+        assert points_update["ExpressionAttributeValues"][":p"] == Decimal(-7)
+        assert "points >= :cost" in points_update["ConditionExpression"]
+
+    @patch("crud.dynamodb")
+    def test_insufficient_points_returns_none(self, mock_dynamodb):
+        mock_dynamodb.meta.client.transact_write_items.side_effect = _transaction_cancelled(
+            "None", "ConditionalCheckFailed"
+        )
+
+        assert crud.approve_purchase(_purchase_log()) is None
+
+    @patch("crud.dynamodb")
+    def test_log_no_longer_pending_is_a_bad_request(self, mock_dynamodb):
+        mock_dynamodb.meta.client.transact_write_items.side_effect = _transaction_cancelled(
+            "ConditionalCheckFailed", "None"
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            crud.approve_purchase(_purchase_log())
+
+        assert exc_info.value.status_code == 400
+
+    @patch("crud.purchase_logs_table")
+    def test_reject_only_applies_to_a_still_pending_log(self, mock_table):
+        mock_table.update_item.return_value = {
+            "Attributes": {**_purchase_log_item("log-1", "2025-01-01T00:00:00"), "status": "rejected"}
+        }
+
+        rejected = crud.update_purchase_log_status(
+            "log-1", models.PurchaseStatus.REJECTED, expected_status=models.PurchaseStatus.PENDING
+        )
+
+        assert rejected.status == models.PurchaseStatus.REJECTED
+        kwargs = mock_table.update_item.call_args[1]
+        assert kwargs["ConditionExpression"] == "#s = :expected"
+        assert kwargs["ExpressionAttributeValues"][":expected"] == "pending"
+
+    @patch("crud.purchase_logs_table")
+    def test_reject_of_an_already_approved_log_is_a_bad_request(self, mock_table):
+        mock_table.update_item.side_effect = _condition_failed()
+
+        with pytest.raises(HTTPException) as exc_info:
+            crud.update_purchase_log_status(
+                "log-1", models.PurchaseStatus.REJECTED, expected_status=models.PurchaseStatus.PENDING
+            )
+
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail == "Purchase request is not pending."
+
+
+class TestCreateAssignment:
+    """Creating an assignment checks the kid and the chore in the same transaction as the put."""
+
+    @patch("crud.dynamodb")
+    @patch("crud.get_user_by_username")
+    @patch("crud.get_chore_by_id")
+    def test_checks_kid_and_chore_without_reading_the_kid(self, mock_get_chore, mock_get_user, mock_dynamodb):
+        mock_get_chore.return_value = models.Chore(**crud.replace_decimals(_chore_item("c1")))
+        assignment_in = models.ChoreAssignmentCreate(
+            chore_id="c1", assigned_to_kid_id="kid-a", due_date=datetime(2025, 1, 1)
+        )
+
+        assignment = crud.create_chore_assignment(assignment_in, "parent-1")
+
+        assert assignment.kid_username == "kid-a"
+        mock_get_user.assert_not_called()
+        items = mock_dynamodb.meta.client.transact_write_items.call_args[1]["TransactItems"]
+        assert items[0]["ConditionCheck"]["TableName"] == crud.CHORES_TABLE_NAME
+        assert set(items[0]["ConditionCheck"]["ExpressionAttributeValues"].values()) == {True, "true"}
+        assert items[1]["ConditionCheck"]["Key"] == {"username": "kid-a"}
+        assert items[2]["Put"]["Item"]["id"] == assignment.id
+
+    @pytest.mark.parametrize(
+        ("codes", "detail"),
+        [
+            (("ConditionalCheckFailed", "None", "None"), "Active chore not found."),
+            (("None", "ConditionalCheckFailed", "None"), "Kid user not found."),
+        ],
+    )
+    @patch("crud.dynamodb")
+    @patch("crud.get_chore_by_id")
+    def test_failed_check_is_not_found(self, mock_get_chore, mock_dynamodb, codes, detail):
+        mock_get_chore.return_value = models.Chore(**crud.replace_decimals(_chore_item("c1")))
+        mock_dynamodb.meta.client.transact_write_items.side_effect = _transaction_cancelled(*codes)
+        assignment_in = models.ChoreAssignmentCreate(
+            chore_id="c1", assigned_to_kid_id="kid-a", due_date=datetime(2025, 1, 1)
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            crud.create_chore_assignment(assignment_in, "parent-1")
+
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.detail == detail
+
+
+def _submitted_assignment():
+    return models.ChoreAssignment(
+        id="a1",
+        chore_id="c1",
+        assigned_to_kid_id="kid-a",
+        due_date=datetime(2025, 1, 1),
+        assigned_by_parent_id="parent-1",
+        chore_name="Chore",
+        kid_username="kid-a",
+        points_value=4,
+        assignment_status=models.ChoreAssignmentStatus.SUBMITTED,
+    )
+
+
+class TestAssignmentReview:
+    """Assignment approval awards points and updates the assignment in one TransactWriteItems call."""
+
+    @patch("crud._award_streak_bonus")
+    @patch("crud.dynamodb")
+    @patch("crud.get_assignment_by_id")
+    def test_approves_and_awards_points_in_one_transaction(self, mock_get, mock_dynamodb, mock_streak):
+        mock_get.return_value = _submitted_assignment()
+
+        approved = crud.update_assignment_status("a1", models.ChoreAssignmentStatus.APPROVED, _parent())
+
+        assert approved.assignment_status == models.ChoreAssignmentStatus.APPROVED
+        items = mock_dynamodb.meta.client.transact_write_items.call_args[1]["TransactItems"]
+        assignment_update = items[0]["Update"]
+        assert assignment_update["TableName"] == crud.CHORE_ASSIGNMENTS_TABLE_NAME
+        assert assignment_update["ConditionExpression"] == crud._SUBMITTED_ASSIGNMENT_CONDITION
+        assert assignment_update["ExpressionAttributeValues"][":sra"].startswith("approved#")
+        assert items[1]["Update"]["ExpressionAttributeValues"][":p"] == Decimal(4)
+        mock_streak.assert_called_once_with("kid-a")
+
+    @patch("crud.dynamodb")
+    @patch("crud.get_assignment_by_id")
+    def test_concurrent_review_is_a_bad_request(self, mock_get, mock_dynamodb):
+        mock_get.return_value = _submitted_assignment()
+        mock_dynamodb.meta.client.transact_write_items.side_effect = _transaction_cancelled(
+            "ConditionalCheckFailed", "None"
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            crud.update_assignment_status("a1", models.ChoreAssignmentStatus.APPROVED, _parent())
+
+        assert exc_info.value.status_code == 400
+
+
+def _pending_pet_care_task():
+    return models.PetCareTask(
+        id="t1",
+        schedule_id="s1",
+        pet_id="pet-1",
+        pet_name="Spike",
+        task_name="Clean tank",
+        points_value=5,
+        assigned_to_kid_id="kid-a",
+        assigned_to_kid_username="kid-a",
+        due_date=datetime(2025, 1, 1),
+        status=models.PetCareTaskStatus.PENDING_APPROVAL,
+    )
+
+
+def _pet(**overrides):
+    return models.Pet(
+        **{
+            "id": "pet-1",
+            "parent_id": "parent-1",
+            "name": "Spike",
+            "species": models.PetSpecies.BEARDED_DRAGON,
+            "birthday": datetime(2025, 2, 1),
+            "care_notes": "Misting twice a day",
+            **overrides,
+        }
+    )
+
+
+class TestUpdatePet:
+    """update_pet writes only the attributes that changed from the pet it already read."""
+
+    @patch("crud.pets_table")
+    @patch("crud.get_pet_by_id")
+    def test_sets_changed_attributes_and_removes_cleared_ones(self, mock_get_pet, mock_pets_table):
+        mock_get_pet.return_value = _pet()
+        mock_pets_table.update_item.return_value = {"Attributes": _pet(name="Spikey").model_dump(mode="json")}
+        pet_in = models.PetCreate(
+            name="Spikey", species=models.PetSpecies.BEARDED_DRAGON, birthday=datetime(2025, 2, 1)
+        )
+
+        pet = crud.update_pet("pet-1", pet_in, "parent-1")
+
+        kwargs = mock_pets_table.update_item.call_args[1]
+        assert kwargs["UpdateExpression"] == "SET #name = :name, updated_at = :ua REMOVE #care_notes"
+        assert kwargs["ExpressionAttributeNames"] == {"#name": "name", "#care_notes": "care_notes"}
+        assert set(kwargs["ExpressionAttributeValues"]) == {":name", ":ua", ":pid"}
+        assert pet.name == "Spikey"
+
+    @patch("crud.pets_table")
+    @patch("crud.get_pet_by_id")
+    def test_unchanged_pet_skips_the_write(self, mock_get_pet, mock_pets_table):
+        existing = _pet()
+        mock_get_pet.return_value = existing
+        pet_in = models.PetCreate(**existing.model_dump(include=set(models.PetCreate.model_fields)))
+
+        assert crud.update_pet("pet-1", pet_in, "parent-1") is existing
+        mock_pets_table.update_item.assert_not_called()
+
+    @patch("crud.pets_table")
+    @patch("crud.get_pet_by_id")
+    def test_deactivate_returns_the_read_pet_without_reading_back(self, mock_get_pet, mock_pets_table):
+        mock_get_pet.return_value = _pet()
+        mock_pets_table.update_item.return_value = {}
+
+        pet = crud.deactivate_pet("pet-1", "parent-1")
+
+        assert "ReturnValues" not in mock_pets_table.update_item.call_args[1]
+        assert (pet.id, pet.name, pet.is_active) == ("pet-1", "Spike", False)
+
+
+class TestPendingPetTasksForPets:
+    """Pending pet tasks are gated on pet_id from a projected query; only the survivors are fetched in full."""
+
+    @patch("crud.dynamodb")
+    @patch("crud.pet_care_tasks_table")
+    def test_batch_gets_only_tasks_for_the_given_pets(self, mock_tasks_table, mock_dynamodb):
+        mock_tasks_table.query.side_effect = [
+            {"Items": [{"id": "t1", "pet_id": "pet-1"}, {"id": "t2", "pet_id": "pet-2"}], "LastEvaluatedKey": {}},
+            {"Items": [{"id": "t3", "pet_id": "pet-1"}]},
+        ]
+        task_item = _pending_pet_care_task().model_dump(mode="json")
+        mock_dynamodb.batch_get_item.return_value = {
+            "Responses": {
+                crud.PET_CARE_TASKS_TABLE_NAME: [
+                    {**task_item, "id": "t3", "due_date": "2025-01-02T00:00:00"},
+                    {**task_item, "id": "t1"},
+                ]
+            }
+        }
+
+        tasks = crud.get_tasks_by_status_for_pets(models.PetCareTaskStatus.PENDING_APPROVAL, {"pet-1"})
+
+        assert [task.id for task in tasks] == ["t1", "t3"]
+        assert mock_tasks_table.query.call_args_list[0][1]["ProjectionExpression"] == "id, pet_id"
+        request = mock_dynamodb.batch_get_item.call_args[1]["RequestItems"][crud.PET_CARE_TASKS_TABLE_NAME]
+        assert request["Keys"] == [{"id": "t1"}, {"id": "t3"}]
+
+    @patch("crud.dynamodb")
+    @patch("crud.pet_care_tasks_table")
+    def test_no_matching_tasks_skips_the_batch_get(self, mock_tasks_table, mock_dynamodb):
+        mock_tasks_table.query.return_value = {"Items": [{"id": "t2", "pet_id": "pet-2"}]}
+
+        assert crud.get_tasks_by_status_for_pets(models.PetCareTaskStatus.PENDING_APPROVAL, {"pet-1"}) == []
+        mock_dynamodb.batch_get_item.assert_not_called()
+
+    @patch("crud.pet_care_tasks_table")
+    def test_no_pets_skips_the_query(self, mock_tasks_table):
+        assert crud.get_task_ids_by_status_for_pets(models.PetCareTaskStatus.PENDING_APPROVAL, set()) == []
+        mock_tasks_table.query.assert_not_called()
+
+
+class TestPetCareTaskApproval:
+    """Approving a pet care task updates it and awards its points in one TransactWriteItems call."""
+
+    @patch("crud._award_streak_bonus")
+    @patch("crud.dynamodb")
+    @patch("crud.get_pet_by_id")
+    @patch("crud.get_task_by_id")
+    def test_approves_and_awards_points_in_one_transaction(self, mock_get, mock_get_pet, mock_dynamodb, mock_streak):
+        mock_get.return_value = _pending_pet_care_task()
+        mock_get_pet.return_value.parent_id = "parent-1"
+
+        task = crud.update_pet_care_task_status("t1", models.PetCareTaskStatus.APPROVED, _parent())
+
+        assert task.status == models.PetCareTaskStatus.APPROVED
+        items = mock_dynamodb.meta.client.transact_write_items.call_args[1]["TransactItems"]
+        assert items[0]["Update"]["TableName"] == crud.PET_CARE_TASKS_TABLE_NAME
+        assert items[0]["Update"]["ConditionExpression"] == "#s = :pending"
+        assert items[1]["Update"]["ExpressionAttributeValues"][":p"] == Decimal(5)
+        mock_streak.assert_called_once_with("kid-a")
+
+    @patch("crud.dynamodb")
+    @patch("crud.get_pet_by_id")
+    @patch("crud.get_task_by_id")
+    def test_concurrent_review_is_a_bad_request(self, mock_get, mock_get_pet, mock_dynamodb):
+        mock_get.return_value = _pending_pet_care_task()
+        mock_get_pet.return_value.parent_id = "parent-1"
+        mock_dynamodb.meta.client.transact_write_items.side_effect = _transaction_cancelled(
+            "ConditionalCheckFailed", "None"
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            crud.update_pet_care_task_status("t1", models.PetCareTaskStatus.APPROVED, _parent())
+
+        assert exc_info.value.status_code == 400
+
+
+class TestBulkCreatePetCareTasks:
+    """Generated tasks are written through one batch writer instead of a PutItem each."""
+
+    @patch("crud.pet_care_tasks_table")
+    def test_puts_every_task_through_the_batch_writer(self, mock_table):
+        batch = mock_table.batch_writer.return_value.__enter__.return_value
+        tasks_in = [
+            models.PetCareTaskCreate(
+                schedule_id="s1",
+                pet_id="pet-1",
+                pet_name="Spike",
+                task_name="Feed Spike",
+                points_value=5,
+                assigned_to_kid_id="kid-a",
+                assigned_to_kid_username="kid-a",
+                due_date=datetime(2025, 1, day),
+            )
+            for day in (1, 2, 3)
+        ]
+
+        tasks = crud.bulk_create_pet_care_tasks(tasks_in)
+
+        assert [task.due_date.day for task in tasks] == [1, 2, 3]
+        assert batch.put_item.call_count == 3
+        assert [call[1]["Item"]["id"] for call in batch.put_item.call_args_list] == [task.id for task in tasks]
+        mock_table.put_item.assert_not_called()
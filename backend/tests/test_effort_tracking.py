@@ -5,6 +5,7 @@ from decimal import Decimal
 from unittest.mock import patch
 
 import pytest
+from botocore.exceptions import ClientError
 
 # Add the backend directory to the path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -54,14 +55,11 @@ class TestEffortTracking:
 
     @patch("crud.chore_logs_table")
     @patch("crud.get_chore_by_id")
-    @patch("crud.get_chore_logs_by_kid_id")
-    def test_create_chore_log_with_effort_tracking(
-        self, mock_get_logs, mock_get_chore, mock_table, mock_chore, mock_kid_user
-    ):
+    def test_create_chore_log_with_effort_tracking(self, mock_get_chore, mock_table, mock_chore, mock_kid_user):
         """Test creating a chore log with effort tracking."""
         # Setup
         mock_get_chore.return_value = mock_chore
-        mock_get_logs.return_value = []  # No previous attempts
+        mock_table.query.return_value = {"Count": 0}  # No previous attempts
         mock_table.put_item.return_value = True
 
         # Execute
@@ -84,11 +82,10 @@ class TestEffortTracking:
 
     @patch("crud.chore_logs_table")
     @patch("crud.get_chore_by_id")
-    @patch("crud.get_chore_logs_by_kid_id")
-    def test_effort_points_calculation(self, mock_get_logs, mock_get_chore, mock_table, mock_chore, mock_kid_user):
+    def test_effort_points_calculation(self, mock_get_chore, mock_table, mock_chore, mock_kid_user):
         """Test effort points calculation (0.5 points per minute, max 10)."""
         mock_get_chore.return_value = mock_chore
-        mock_get_logs.return_value = []
+        mock_table.query.return_value = {"Count": 0}
         mock_table.put_item.return_value = True
 
         test_cases = [
@@ -108,27 +105,11 @@ class TestEffortTracking:
 
     @patch("crud.chore_logs_table")
     @patch("crud.get_chore_by_id")
-    @patch("crud.get_chore_logs_by_kid_id")
-    def test_retry_detection_within_24_hours(
-        self, mock_get_logs, mock_get_chore, mock_table, mock_chore, mock_kid_user
-    ):
+    def test_retry_detection_within_24_hours(self, mock_get_chore, mock_table, mock_chore, mock_kid_user):
         """Test retry detection for same chore within 24 hours."""
-        # Setup - simulate previous rejected attempt
-        previous_log = models.ChoreLog(
-            id="log-1",
-            chore_id="chore-123",
-            chore_name="Clean Room",
-            kid_id="kid-1",
-            kid_username="kid-1",
-            points_value=10,
-            status=models.ChoreStatus.REJECTED,
-            submitted_at=datetime.utcnow() - timedelta(hours=12),  # 12 hours ago
-            reviewed_by_parent_id="parent-1",
-            reviewed_at=datetime.utcnow() - timedelta(hours=10),
-        )
-
+        # Setup - the index window holds one previous rejected or pending attempt
         mock_get_chore.return_value = mock_chore
-        mock_get_logs.return_value = [previous_log]
+        mock_table.query.return_value = {"Count": 1}
         mock_table.put_item.return_value = True
 
         # Execute
@@ -137,30 +118,20 @@ class TestEffortTracking:
         # Assert
         assert result.is_retry is True
         assert result.retry_count == 1
+        query = mock_table.query.call_args[1]
+        assert query["IndexName"] == "KidChoreLogIndex"
+        assert query["Select"] == "COUNT"
+        assert query["FilterExpression"] == crud._A_CHORE_ID.eq("chore-123") & crud._A_STATUS.is_in(
+            [models.ChoreStatus.REJECTED.value, models.ChoreStatus.PENDING_APPROVAL.value]
+        )
 
     @patch("crud.chore_logs_table")
     @patch("crud.get_chore_by_id")
-    @patch("crud.get_chore_logs_by_kid_id")
-    def test_no_retry_detection_after_24_hours(
-        self, mock_get_logs, mock_get_chore, mock_table, mock_chore, mock_kid_user
-    ):
+    def test_no_retry_detection_after_24_hours(self, mock_get_chore, mock_table, mock_chore, mock_kid_user):
         """Test that retries are not detected after 24 hours."""
-        # Setup - simulate previous attempt more than 24 hours ago
-        previous_log = models.ChoreLog(
-            id="log-1",
-            chore_id="chore-123",
-            chore_name="Clean Room",
-            kid_id="kid-1",
-            kid_username="kid-1",
-            points_value=10,
-            status=models.ChoreStatus.REJECTED,
-            submitted_at=datetime.utcnow() - timedelta(hours=25),  # 25 hours ago
-            reviewed_by_parent_id="parent-1",
-            reviewed_at=datetime.utcnow() - timedelta(hours=24),
-        )
-
+        # Setup - only attempts inside the last 24 hours are in the queried range
         mock_get_chore.return_value = mock_chore
-        mock_get_logs.return_value = [previous_log]
+        mock_table.query.return_value = {"Count": 0}
         mock_table.put_item.return_value = True
 
         # Execute
@@ -169,42 +140,18 @@ class TestEffortTracking:
         # Assert
         assert result.is_retry is False
         assert result.retry_count == 0
+        submitted_at = mock_table.put_item.call_args[1]["Item"]["submitted_at"]
+        window_start = (datetime.fromisoformat(submitted_at) - timedelta(hours=24)).isoformat()
+        key_condition = mock_table.query.call_args[1]["KeyConditionExpression"]
+        assert key_condition == crud._K_KID_ID.eq("kid-1") & crud._K_SUBMITTED_AT.gt(window_start)
 
     @patch("crud.chore_logs_table")
     @patch("crud.get_chore_by_id")
-    @patch("crud.get_chore_logs_by_kid_id")
-    def test_multiple_retry_attempts_count(self, mock_get_logs, mock_get_chore, mock_table, mock_chore, mock_kid_user):
+    def test_multiple_retry_attempts_count(self, mock_get_chore, mock_table, mock_chore, mock_kid_user):
         """Test that multiple retry attempts are counted correctly."""
-        # Setup - simulate two previous attempts within 24 hours
-        previous_logs = [
-            models.ChoreLog(
-                id="log-1",
-                chore_id="chore-123",
-                chore_name="Clean Room",
-                kid_id="kid-1",
-                kid_username="kid-1",
-                points_value=10,
-                status=models.ChoreStatus.REJECTED,
-                submitted_at=datetime.utcnow() - timedelta(hours=20),
-                reviewed_by_parent_id="parent-1",
-                reviewed_at=datetime.utcnow() - timedelta(hours=19),
-            ),
-            models.ChoreLog(
-                id="log-2",
-                chore_id="chore-123",
-                chore_name="Clean Room",
-                kid_id="kid-1",
-                kid_username="kid-1",
-                points_value=10,
-                status=models.ChoreStatus.PENDING_APPROVAL,
-                submitted_at=datetime.utcnow() - timedelta(hours=10),
-                reviewed_by_parent_id=None,
-                reviewed_at=None,
-            ),
-        ]
-
+        # Setup - two previous attempts within 24 hours, split across result pages
         mock_get_chore.return_value = mock_chore
-        mock_get_logs.return_value = previous_logs
+        mock_table.query.side_effect = [{"Count": 1, "LastEvaluatedKey": {"id": "log-1"}}, {"Count": 1}]
         mock_table.put_item.return_value = True
 
         # Execute
@@ -214,6 +161,36 @@ class TestEffortTracking:
         assert result.is_retry is True
         assert result.retry_count == 2  # Two previous attempts
 
+    @patch("crud.chore_logs_table")
+    @patch("crud.get_chore_by_id")
+    @patch("crud.get_chore_logs_by_kid_id")
+    def test_retry_detection_without_the_index_counts_recent_logs(
+        self, mock_get_logs, mock_get_chore, mock_table, mock_chore, mock_kid_user
+    ):
+        """Without KidChoreLogIndex, recent rejected or pending logs of the same chore are counted."""
+        mock_get_chore.return_value = mock_chore
+        mock_table.query.side_effect = ClientError(
+            {"Error": {"Code": "ResourceNotFoundException", "Message": "no index"}}, "Query"
+        )
+        previous_log = models.ChoreLog(
+            id="log-1",
+            chore_id="chore-123",
+            chore_name="Clean Room",
+            kid_id="kid-1",
+            kid_username="kid-1",
+            points_value=10,
+            status=models.ChoreStatus.REJECTED,
+            submitted_at=crud._utcnow() - timedelta(hours=12),
+        )
+        stale_log = previous_log.model_copy(
+            update={"id": "log-0", "submitted_at": crud._utcnow() - timedelta(hours=25)}
+        )
+        mock_get_logs.return_value = [previous_log, stale_log]
+
+        result = crud.create_chore_log_submission(chore_id="chore-123", kid_user=mock_kid_user, effort_minutes=15)
+
+        assert result.retry_count == 1
+
     @patch("crud.get_chore_logs_by_kid_id")
     def test_streak_calculation_includes_effort_attempts(self, mock_get_logs):
         """Test that streak calculation includes high-effort attempts."""
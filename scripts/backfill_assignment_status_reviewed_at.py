@@ -0,0 +1,65 @@
+import argparse
+import os
+
+import boto3
+from boto3.dynamodb.conditions import Attr
+from botocore.exceptions import ClientError
+
+
+def backfill(table) -> int:
+    """Sets status_reviewed_at on reviewed assignments written before the KidAssignmentsByStatusIndex existed."""
+    updated = 0
+    scan_kwargs = {
+        "FilterExpression": Attr("reviewed_at").exists()
+        & Attr("reviewed_at").ne(None)
+        & Attr("status_reviewed_at").not_exists(),
+        "ProjectionExpression": "id, assignment_status, reviewed_at",
+    }
+    while True:
+        response = table.scan(**scan_kwargs)
+        for item in response.get("Items", []):
+            try:
+                table.update_item(
+                    Key={"id": item["id"]},
+                    UpdateExpression="SET status_reviewed_at = :sra",
+                    ConditionExpression="attribute_exists(id)",
+                    # Must match crud._assignment_status_sort_key
+                    ExpressionAttributeValues={":sra": f"{item['assignment_status']}#{item['reviewed_at']}"},
+                )
+                updated += 1
+            except ClientError as e:
+                print(f"  Error updating assignment {item['id']}: {e}")
+        if "LastEvaluatedKey" not in response:
+            return updated
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Backfill status_reviewed_at on reviewed chore assignments for the KidAssignmentsByStatusIndex."
+    )
+    parser.add_argument(
+        "--assignments-table",
+        type=str,
+        default=os.getenv("CHORE_ASSIGNMENTS_TABLE_NAME", "KidsRewardsChoreAssignments"),
+        help="The chore assignments table name",
+    )
+    args = parser.parse_args()
+
+    dynamodb_endpoint_override = os.getenv("DYNAMODB_ENDPOINT_OVERRIDE")
+    aws_region = os.getenv("AWS_REGION", "us-west-2")  # Default to us-west-2
+
+    if dynamodb_endpoint_override:
+        print(f"Using local DynamoDB endpoint: {dynamodb_endpoint_override}")
+        dynamodb = boto3.resource("dynamodb", endpoint_url=dynamodb_endpoint_override, region_name=aws_region)
+    else:
+        dynamodb = boto3.resource("dynamodb", region_name=aws_region)
+
+    table = dynamodb.Table(args.assignments_table)
+    print(f"Backfilling status_reviewed_at on table: {args.assignments_table}")
+    updated = backfill(table)
+    print(f"Finished backfilling {updated} assignments.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Convert chores' string is_active values to booleans and add them to the sparse ActiveChoresIndex.
+
+Rollout order matters: the old ActiveChoresIndex is keyed on the string is_active, so DynamoDB rejects
+BOOL values while it exists, and the re-keyed index starts empty.
+  1. Deploy with ActiveChoresIndex removed (the current template). get_all_active_chores falls back
+     to a scan that matches both True and "true", so no chore disappears.
+  2. Run this script.
+  3. In a separate deploy, re-add ActiveChoresIndex keyed on is_active_pk (type S). One update can
+     only create or delete one GSI per table, so this cannot ride along with step 1.
+"""
+
+import argparse
+import os
+
+import boto3
+from boto3.dynamodb.conditions import Attr
+from botocore.exceptions import ClientError
+
+# Must match crud.ACTIVE_CHORES_PARTITION
+ACTIVE_CHORES_PARTITION = "ACTIVE"
+
+
+def backfill(table) -> int:
+    """Converts string is_active values on existing chores to booleans and sets is_active_pk on active ones."""
+    updated = 0
+    scan_kwargs = {
+        "FilterExpression": Attr("is_active").is_in(["true", "false"]),
+        "ProjectionExpression": "id, is_active",
+    }
+    while True:
+        response = table.scan(**scan_kwargs)
+        for item in response.get("Items", []):
+            if item["is_active"] == "true":
+                update_kwargs = {
+                    "UpdateExpression": "SET is_active = :ia, is_active_pk = :pk",
+                    "ExpressionAttributeValues": {":ia": True, ":pk": ACTIVE_CHORES_PARTITION, ":old": "true"},
+                }
+            else:
+                update_kwargs = {
+                    "UpdateExpression": "SET is_active = :ia REMOVE is_active_pk",
+                    "ExpressionAttributeValues": {":ia": False, ":old": "false"},
+                }
+            try:
+                table.update_item(
+                    Key={"id": item["id"]},
+                    ConditionExpression="is_active = :old",  # Skip chores changed since the scan
+                    **update_kwargs,
+                )
+                updated += 1
+            except ClientError as e:
+                print(f"  Error updating chore {item['id']}: {e}")
+        if "LastEvaluatedKey" not in response:
+            return updated
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert is_active on existing chores to a boolean.")
+    parser.add_argument(
+        "--chores-table",
+        type=str,
+        default=os.getenv("CHORES_TABLE_NAME", "KidsRewardsChores"),
+        help="The chores table name",
+    )
+    args = parser.parse_args()
+
+    dynamodb_endpoint_override = os.getenv("DYNAMODB_ENDPOINT_OVERRIDE")
+    aws_region = os.getenv("AWS_REGION", "us-west-2")  # Default to us-west-2
+
+    if dynamodb_endpoint_override:
+        print(f"Using local DynamoDB endpoint: {dynamodb_endpoint_override}")
+        dynamodb = boto3.resource("dynamodb", endpoint_url=dynamodb_endpoint_override, region_name=aws_region)
+    else:
+        dynamodb = boto3.resource("dynamodb", region_name=aws_region)
+
+    table = dynamodb.Table(args.chores_table)
+    print(f"Backfilling is_active on table: {args.chores_table}")
+    updated = backfill(table)
+    print(f"Finished backfilling {updated} chores.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import argparse
+import os
+
+import boto3
+from boto3.dynamodb.conditions import Attr
+from botocore.exceptions import ClientError
+
+
+def chore_parent_ids(chores_table) -> dict:
+    """Maps every chore id to the parent who created it."""
+    parent_ids = {}
+    scan_kwargs = {"ProjectionExpression": "id, created_by_parent_id"}
+    while True:
+        response = chores_table.scan(**scan_kwargs)
+        for item in response.get("Items", []):
+            parent_ids[item["id"]] = item["created_by_parent_id"]
+        if "LastEvaluatedKey" not in response:
+            return parent_ids
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def backfill(chore_logs_table, parent_ids: dict) -> int:
+    """Sets created_by_parent_id and status_submitted_at on chore logs written before ParentStatusIndex."""
+    updated = 0
+    scan_kwargs = {
+        "FilterExpression": Attr("created_by_parent_id").not_exists(),
+        "ProjectionExpression": "id, chore_id, #s, submitted_at",
+        "ExpressionAttributeNames": {"#s": "status"},
+    }
+    while True:
+        response = chore_logs_table.scan(**scan_kwargs)
+        for item in response.get("Items", []):
+            parent_id = parent_ids.get(item["chore_id"])
+            if parent_id is None:
+                print(f"  Skipping chore log {item['id']}: chore {item['chore_id']} not found")
+                continue
+            try:
+                chore_logs_table.update_item(
+                    Key={"id": item["id"]},
+                    UpdateExpression="SET created_by_parent_id = :pid, status_submitted_at = :ssa",
+                    # Skip logs reviewed since the scan; their status (and sort key) changed
+                    ConditionExpression="attribute_exists(id) AND #s = :s",
+                    ExpressionAttributeNames={"#s": "status"},
+                    ExpressionAttributeValues={
+                        ":pid": parent_id,
+                        ":ssa": f"{item['status']}#{item['submitted_at']}",
+                        ":s": item["status"],
+                    },
+                )
+                updated += 1
+            except ClientError as e:
+                print(f"  Error updating chore log {item['id']}: {e}")
+        if "LastEvaluatedKey" not in response:
+            return updated
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Backfill created_by_parent_id on existing chore logs for the ParentStatusIndex index."
+    )
+    parser.add_argument(
+        "--chores-table",
+        type=str,
+        default=os.getenv("CHORES_TABLE_NAME", "KidsRewardsChores"),
+        help="The chores table name",
+    )
+    parser.add_argument(
+        "--chore-logs-table",
+        type=str,
+        default=os.getenv("CHORE_LOGS_TABLE_NAME", "KidsRewardsChoreLogs"),
+        help="The chore logs table name",
+    )
+    args = parser.parse_args()
+
+    dynamodb_endpoint_override = os.getenv("DYNAMODB_ENDPOINT_OVERRIDE")
+    aws_region = os.getenv("AWS_REGION", "us-west-2")  # Default to us-west-2
+
+    if dynamodb_endpoint_override:
+        print(f"Using local DynamoDB endpoint: {dynamodb_endpoint_override}")
+        dynamodb = boto3.resource("dynamodb", endpoint_url=dynamodb_endpoint_override, region_name=aws_region)
+    else:
+        dynamodb = boto3.resource("dynamodb", region_name=aws_region)
+
+    parent_ids = chore_parent_ids(dynamodb.Table(args.chores_table))
+    print(f"Backfilling created_by_parent_id on table: {args.chore_logs_table}")
+    updated = backfill(dynamodb.Table(args.chore_logs_table), parent_ids)
+    print(f"Finished backfilling {updated} chore logs.")
+
+
+if __name__ == "__main__":
+    main()
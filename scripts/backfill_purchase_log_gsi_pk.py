@@ -0,0 +1,62 @@
+import argparse
+import os
+
+import boto3
+from boto3.dynamodb.conditions import Attr
+from botocore.exceptions import ClientError
+
+# Must match crud.PURCHASE_LOGS_ALL_PARTITION
+ALL_PARTITION = "ALL"
+
+
+def backfill(table) -> int:
+    """Sets gsi_pk on every purchase log written before the AllLogsByTimestamp index existed."""
+    updated = 0
+    scan_kwargs = {"FilterExpression": Attr("gsi_pk").not_exists(), "ProjectionExpression": "id"}
+    while True:
+        response = table.scan(**scan_kwargs)
+        for item in response.get("Items", []):
+            try:
+                table.update_item(
+                    Key={"id": item["id"]},
+                    UpdateExpression="SET gsi_pk = :pk",
+                    ConditionExpression="attribute_exists(id)",
+                    ExpressionAttributeValues={":pk": ALL_PARTITION},
+                )
+                updated += 1
+            except ClientError as e:
+                print(f"  Error updating purchase log {item['id']}: {e}")
+        if "LastEvaluatedKey" not in response:
+            return updated
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Backfill gsi_pk on existing purchase logs for the AllLogsByTimestamp index."
+    )
+    parser.add_argument(
+        "--purchase-logs-table",
+        type=str,
+        default=os.getenv("PURCHASE_LOGS_TABLE_NAME", "KidsRewardsPurchaseLogs"),
+        help="The purchase logs table name",
+    )
+    args = parser.parse_args()
+
+    dynamodb_endpoint_override = os.getenv("DYNAMODB_ENDPOINT_OVERRIDE")
+    aws_region = os.getenv("AWS_REGION", "us-west-2")  # Default to us-west-2
+
+    if dynamodb_endpoint_override:
+        print(f"Using local DynamoDB endpoint: {dynamodb_endpoint_override}")
+        dynamodb = boto3.resource("dynamodb", endpoint_url=dynamodb_endpoint_override, region_name=aws_region)
+    else:
+        dynamodb = boto3.resource("dynamodb", region_name=aws_region)
+
+    table = dynamodb.Table(args.purchase_logs_table)
+    print(f"Backfilling gsi_pk on table: {args.purchase_logs_table}")
+    updated = backfill(table)
+    print(f"Finished backfilling {updated} purchase logs.")
+
+
+if __name__ == "__main__":
+    main()
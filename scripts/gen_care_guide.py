@@ -0,0 +1,49 @@
+"""
+Regenerate backend/care_guide_generated.py from the care guide instruction modules in backend/.
+
+Run this after editing any care guide text or recommended schedule:
+
+    python scripts/gen_care_guide.py
+"""
+
+import os
+import sys
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend")
+OUTPUT_PATH = os.path.join(BACKEND_DIR, "care_guide_generated.py")
+
+HEADER = '''"""
+Precomputed care guide tables.
+
+Generated by scripts/gen_care_guide.py from the care_guide instruction modules. Do not edit by hand.
+"""
+'''
+
+
+def render() -> str:
+    """Render the generated module source from the current care_guide tables."""
+    # Hide any existing generated module so care_guide builds its tables from the source literals
+    sys.modules["care_guide_generated"] = None
+    sys.path.insert(0, BACKEND_DIR)
+    import care_guide
+
+    lines = [HEADER, "FLAT_INSTRUCTIONS = {"]
+    for key, text in care_guide._build_flat_instructions().items():
+        lines.append(f"    {key!r}: {text!r},")
+    lines += ["}", "", "RECOMMENDED_SCHEDULES = {"]
+    for key, schedules in care_guide._build_schedule_table().items():
+        lines.append(f"    {key!r}: [")
+        lines.extend(f"        {schedule!r}," for schedule in schedules)
+        lines.append("    ],")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
+        f.write(render())
+    print(f"Wrote {OUTPUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()
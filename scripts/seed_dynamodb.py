@@ -16,7 +16,11 @@ def convert_to_decimal(obj):
         return [convert_to_decimal(i) for i in obj]
     elif isinstance(obj, dict):
         return {k: convert_to_decimal(v) for k, v in obj.items()}
-    elif isinstance(obj, (float, int)):
+    elif isinstance(obj, bool):
+        return obj
+    elif isinstance(obj, int):
+        return Decimal(obj)
+    elif isinstance(obj, float):
         return Decimal(str(obj))
     return obj
 
@@ -40,15 +44,14 @@ def seed_table(table_name: str, data: list, dynamodb_resource):
     try:
         table = dynamodb_resource.Table(table_name)
         print(f"Seeding table: {table_name}")
-        for item in data:
-            try:
-                table.put_item(Item=item)
+        # The batch writer sends puts 25 at a time and retries any unprocessed items
+        with table.batch_writer() as batch:
+            for item in data:
+                batch.put_item(Item=item)
                 print(f"  Put item: {item}")
-            except ClientError as e:
-                print(f"  Error putting item {item}: {e}")
         print(f"Finished seeding table: {table_name}")
     except ClientError as e:
-        print(f"Error accessing table {table_name}: {e}")
+        print(f"Error seeding table {table_name}: {e}")
 
 
 def main():
@@ -176,6 +179,7 @@ def main():
                     "points_spent": Decimal(str(store_items_data[0]["points_cost"])),
                     "timestamp": (datetime.utcnow() - timedelta(days=1)).isoformat(),
                     "status": PurchaseStatus.PENDING.value,
+                    "gsi_pk": "ALL",
                 }
             )
             # Approved request
@@ -194,6 +198,7 @@ def main():
                             datetime.utcnow() - timedelta(days=2)
                         ).isoformat(),
                         "status": PurchaseStatus.APPROVED.value,
+                        "gsi_pk": "ALL",
                     }
                 )
             # Rejected request
@@ -212,6 +217,7 @@ def main():
                             datetime.utcnow() - timedelta(hours=5)
                         ).isoformat(),
                         "status": PurchaseStatus.REJECTED.value,
+                        "gsi_pk": "ALL",
                     }
                 )
 